@@ -0,0 +1 @@
+"""Shared building blocks for the kube-reports Streamlit dashboards."""
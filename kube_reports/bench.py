@@ -0,0 +1,195 @@
+"""Rerun latency and figure cost of every dashboard page, as a JSON report.
+
+Each page of both reports runs headlessly with Streamlit's ``AppTest``
+against synthetic ``kubectl top`` captures of each requested size; the
+node-comparison pages read them through the sidebar data source
+variables, while the phase-1 pages run on their built-in data. Per page
+and size the report records:
+
+- ``wall_s``: median rerun time once warm, next to ``wall_cold_s``, the
+  first visit;
+- ``load_s``, ``transform_s``, ``figure_s``, ``serialize_s``: the page
+  render split into the sections of :mod:`kube_reports.profiling`;
+- ``figure_bytes``: total size of the serialized figure JSON;
+- ``peak_mem_mb``: Python heap peak during one rerun, from a separate
+  pass under ``tracemalloc`` so the timings stay clean.
+
+``--baseline`` compares against an earlier report and exits non-zero
+when a page got slower or bigger than ``--tolerance`` allows::
+
+    python -m kube_reports.bench --sizes 10 1000 100000 --out bench.json
+    python -m kube_reports.bench --out new.json --baseline bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from kube_reports.profiling import PROFILE, SECTIONS
+from kube_reports.render import REPO_ROOT, REPORTS
+
+DEFAULT_SIZES = (10, 1000, 100000)
+SCRIPT_TIMEOUT = 1800
+
+
+def synthetic_nodes(path, count, seed, drift=0.0):
+    """Write a ``kubectl top nodes`` capture of ``count`` nodes.
+
+    ``drift`` replaces that fraction of the fleet with new node names, so
+    the diff sees nodes added and removed.
+    """
+    rng = np.random.default_rng(seed)
+    ids = np.arange(count)
+    replaced = rng.random(count) < drift
+    ids[replaced] += count
+    names = np.char.add('aks-nodepool1-28315746-vmss', np.char.zfill(np.char.mod('%x', ids), 6))
+    cpu = rng.integers(100, 4000, count)
+    memory = rng.integers(2000, 15000, count)
+    lines = ['NAME CPU(cores) CPU% MEMORY(bytes) MEMORY%']
+    lines += [f"{name} {c}m {c * 100 // 4000}% {m}Mi {m * 100 // 15750}%"
+              for name, c, m in zip(names.tolist(), cpu.tolist(), memory.tolist())]
+    with open(path, 'w', encoding='utf-8') as handle:
+        handle.write('\n'.join(lines) + '\n')
+    return path
+
+
+def _figure_bytes(app):
+    return sum(len(element.proto.spec) for element in app.get('plotly_chart'))
+
+
+def bench_report(report, environ, repeat, dataset):
+    """Time every page of ``report`` with ``environ`` applied; one result dict per page."""
+    from streamlit.testing.v1 import AppTest
+
+    from kube_reports.pages import page_labels
+
+    package, script = REPORTS[report]
+    saved = {key: os.environ.get(key) for key in environ}
+    os.environ.update(environ)
+    results = []
+    try:
+        app = AppTest.from_file(os.path.join(REPO_ROOT, script), default_timeout=SCRIPT_TIMEOUT).run()
+        app.toggle(key='profile_render').set_value(True)
+        for label in page_labels(package):
+            walls, sections = [], []
+            for attempt in range(repeat + 1):
+                start = time.perf_counter()
+                if attempt == 0:
+                    app.sidebar.selectbox[0].select(label).run()
+                else:
+                    app.run()
+                walls.append(time.perf_counter() - start)
+                sections.append(PROFILE.last)
+                if app.exception:
+                    raise RuntimeError(f"{report} / {label}: {app.exception[0].message}")
+
+            tracemalloc.start()
+            app.run()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            warm = slice(1, None) if repeat else slice(None)
+            row = {'report': report, 'page': label, 'dataset': dataset,
+                   'wall_s': round(statistics.median(walls[warm]), 4), 'wall_cold_s': round(walls[0], 4)}
+            for name in SECTIONS:
+                row[f'{name}_s'] = round(statistics.median(rerun[name] for rerun in sections[warm]), 4)
+            row.update(figure_bytes=_figure_bytes(app), figures=len(app.get('plotly_chart')),
+                       peak_mem_mb=round(peak / 2 ** 20, 2))
+            results.append(row)
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+    return results
+
+
+def run(sizes=DEFAULT_SIZES, reports=tuple(REPORTS), repeat=3):
+    """Benchmark ``reports`` over ``sizes``; return the report document."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix='kube-reports-bench-') as scratch:
+        for report in reports:
+            if report != 'node-comparison':
+                # Phase-1 pages are built on the report's own tables, not on node captures
+                results += bench_report(report, {}, repeat, 'builtin')
+                continue
+            for size in sizes:
+                old = synthetic_nodes(os.path.join(scratch, f'old-{size}.txt'), size, seed=size)
+                current = synthetic_nodes(os.path.join(scratch, f'current-{size}.txt'), size, seed=size + 1, drift=0.02)
+                environ = {'KUBE_REPORTS_OLD_NODES': old, 'KUBE_REPORTS_CURRENT_NODES': current}
+                results += bench_report(report, environ, repeat, f'{size} nodes')
+    return {'created': datetime.now(timezone.utc).isoformat(timespec='seconds'), 'version': _version(),
+            'python': platform.python_version(), 'machine': platform.machine(), 'repeat': repeat,
+            'results': results}
+
+
+def _version():
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def regressions(current, baseline, tolerance=0.2, metrics=('wall_s', 'figure_s', 'serialize_s', 'figure_bytes', 'peak_mem_mb')):
+    """Pages whose metrics grew by more than ``tolerance`` (a fraction) over ``baseline``."""
+    before = {(row['report'], row['page'], row['dataset']): row for row in baseline['results']}
+    found = []
+    for row in current['results']:
+        old = before.get((row['report'], row['page'], row['dataset']))
+        if old is None:
+            continue
+        for metric in metrics:
+            # Ignore sub-millisecond noise on timings
+            floor = 0.001 if metric.endswith('_s') else 0
+            if row[metric] > max(old[metric], floor) * (1 + tolerance):
+                found.append((row, metric, old[metric]))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m kube_reports.bench', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help='node counts')
+    parser.add_argument('--report', action='append', choices=sorted(REPORTS),
+                        help='report to benchmark (repeatable, default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='warm reruns per page')
+    parser.add_argument('--out', required=True, help='write the JSON report here')
+    parser.add_argument('--baseline', help='earlier JSON report to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed growth before flagging (0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    # Deprecation notices from the pages would bury the table
+    from streamlit.logger import set_log_level
+    set_log_level('error')
+    document = run(args.sizes, args.report or tuple(REPORTS), args.repeat)
+    with open(args.out, 'w', encoding='utf-8') as handle:
+        json.dump(document, handle, indent=2)
+
+    for row in document['results']:
+        print(f"{row['report']:16} {row['dataset']:>12}  {row['page'][:38]:38} "
+              f"{row['wall_s'] * 1000:9.1f} ms  load {row['load_s'] * 1000:7.1f}  transform {row['transform_s'] * 1000:7.1f}  "
+              f"figure {row['figure_s'] * 1000:7.1f}  serialize {row['serialize_s'] * 1000:7.1f} ms  {row['figure_bytes'] / 1024:9.1f} KiB  "
+              f"{row['peak_mem_mb']:8.1f} MiB")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as handle:
+            found = regressions(document, json.load(handle), args.tolerance)
+        for row, metric, before in found:
+            print(f"REGRESSION {row['report']} / {row['page']} / {row['dataset']}: {metric} {before} -> {row[metric]}")
+        if found:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+"""Bin-packing simulation of pod memory requests onto nodes.
+
+The scheduler places a pod on a node when the pod's memory request fits in
+what is left of the node's allocatable memory (and a pod slot is free).
+:func:`pack` replays that for a whole pod table: pods are taken largest
+request first and placed either on the first node they fit
+(first-fit-decreasing) or on the node they fit most tightly (best-fit
+decreasing). What is left afterwards is the cluster's real headroom, and
+:func:`extra_replicas` turns it into how many more pods of a given size
+would still be scheduled.
+
+Packing is done per run of equal requests rather than per pod. Replicas of
+one Deployment ask for the same memory, so 100k pods usually hold a few
+thousand distinct requests. For a run of ``k`` equal pods first fit fills
+the nodes in order, each taking as many pods as its free memory and pod
+slots allow, until ``k`` are placed; best fit does the same in order of
+increasing free memory. Both are a ``cumsum`` over the node arrays, and
+100k pods on 1k nodes pack in well under a second.
+
+:func:`pool_what_if` repeats the packing for other node pool sizes::
+
+    python -m kube_reports.binpack pods.json --nodes nodes.json --pool-sizes 40 50 60
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from kube_reports.ingest import _column, _items, _read_json, parse_memory_mi
+from kube_reports.overcommit import ACTIVE_PHASES, pod_table
+
+STRATEGIES = ('first_fit', 'best_fit')
+STRATEGY_LABELS = {'first_fit': 'First-fit decreasing', 'best_fit': 'Best-fit decreasing'}
+
+
+def pod_requests(pods):
+    """Memory requests (Mi) of the active pods of a :func:`~kube_reports.overcommit.pod_table` frame."""
+    active = pods['Phase'].isin(ACTIVE_PHASES).to_numpy()
+    return pods['Memory_Request_Mi'].to_numpy(dtype='float64', na_value=0.0)[active]
+
+
+def requests_from_nodes(nodes):
+    """Stand-in requests when no pod dump is loaded: each node's usage split evenly over its pods."""
+    pods = nodes['Pods'].to_numpy(dtype='float64', na_value=0.0).astype('int64').clip(min=0)
+    usage = nodes['Memory_Usage_Mi'].to_numpy(dtype='float64', na_value=0.0)
+    return np.repeat(usage / np.maximum(pods, 1), pods)
+
+
+def node_capacity(source):
+    """``Node``, ``Allocatable_Memory_Mi`` and ``Allocatable_Pods`` from a ``kubectl get nodes -o json`` dump."""
+    items = _items(_read_json(source))
+    return pd.DataFrame({
+        'Node': _column(items, 'metadata', 'name'),
+        'Allocatable_Memory_Mi': parse_memory_mi(_column(items, 'status', 'allocatable', 'memory')),
+        'Allocatable_Pods': pd.to_numeric(pd.Series(_column(items, 'status', 'allocatable', 'pods'), dtype=object),
+                                          errors='coerce'),
+    })
+
+
+def _runs(sizes):
+    """Start index and length of each run of equal values in a sorted array."""
+    starts = np.flatnonzero(np.r_[True, sizes[1:] != sizes[:-1]]) if len(sizes) else np.array([], dtype='int64')
+    return starts, np.diff(np.r_[starts, len(sizes)])
+
+
+def pack(requests, capacity, strategy='first_fit', pod_slots=None):
+    """Place pods on nodes, largest request first.
+
+    ``requests`` holds one memory request per pod and ``capacity`` one
+    allocatable figure per node (same unit); ``pod_slots`` optionally caps
+    the pods per node. Returns ``(assignment, free, slots)``: the node index
+    of every pod in input order (-1 when it fits nowhere), and the memory
+    and pod slots left on each node.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown packing strategy {strategy!r}; expected one of {', '.join(STRATEGIES)}")
+    requests = np.nan_to_num(np.asarray(requests, dtype='float64')).clip(min=0)
+    free = np.nan_to_num(np.asarray(capacity, dtype='float64')).clip(min=0)
+    slots = (np.full(len(free), len(requests), dtype='int64') if pod_slots is None
+             else np.nan_to_num(np.asarray(pod_slots, dtype='float64'), nan=len(requests)).astype('int64'))
+    order = np.argsort(-requests, kind='stable')
+    sizes = requests[order]
+    placed = np.full(len(requests), -1, dtype='int64')
+    for start, count in zip(*_runs(sizes)):
+        size = sizes[start]
+        fits = slots if size == 0 else np.minimum(np.floor(free / size).astype('int64'), slots)
+        candidates = np.flatnonzero(fits > 0)
+        if strategy == 'best_fit':
+            candidates = candidates[np.argsort(free[candidates], kind='stable')]
+        take = np.minimum(fits[candidates], count)
+        cumulative = np.cumsum(take)
+        # Nodes up to the one that completes the run, the last taking only what is still needed
+        used = min(np.searchsorted(cumulative, count), len(take) - 1) + 1 if len(take) else 0
+        take, candidates = take[:used], candidates[:used]
+        if used:
+            take[-1] -= max(cumulative[used - 1] - count, 0)
+        free[candidates] -= take * size
+        slots[candidates] -= take
+        placed[start:start + take.sum()] = np.repeat(candidates, take)
+    assignment = np.empty_like(placed)
+    assignment[order] = placed
+    return assignment, free, slots
+
+
+def extra_replicas(free, size, slots=None):
+    """How many more pods requesting ``size`` fit in the memory (and slots) left on the nodes."""
+    if not size or size <= 0:
+        return 0
+    fits = np.floor(np.nan_to_num(np.asarray(free, dtype='float64')) / size).astype('int64')
+    if slots is not None:
+        fits = np.minimum(fits, slots)
+    return int(fits.clip(min=0).sum())
+
+
+def replica_size(requests):
+    """Median non-zero request: the size of the typical extra replica."""
+    requests = np.asarray(requests, dtype='float64')
+    requests = requests[requests > 0]
+    return float(np.median(requests)) if len(requests) else 0.0
+
+
+def simulate(requests, capacity, strategy='first_fit', pod_slots=None, replica_mi=None):
+    """Summary of one packing: pods placed, headroom and the extra replicas it leaves room for."""
+    requests = np.nan_to_num(np.asarray(requests, dtype='float64'))
+    capacity = np.nan_to_num(np.asarray(capacity, dtype='float64'))
+    replica_mi = replica_size(requests) if replica_mi is None else replica_mi
+    assignment, free, slots = pack(requests, capacity, strategy, pod_slots)
+    placed = assignment >= 0
+    return {
+        'Strategy': strategy,
+        'Nodes': len(capacity),
+        'Nodes_Used': len(np.unique(assignment[placed])),
+        'Pods': len(requests),
+        'Placed': int(placed.sum()),
+        'Unplaced': int((~placed).sum()),
+        'Requested_Mi': float(requests.sum()),
+        'Capacity_Mi': float(capacity.sum()),
+        'Free_Mi': float(free.sum()),
+        'Replica_Mi': replica_mi,
+        'Extra_Replicas': extra_replicas(free, replica_mi, None if pod_slots is None else slots),
+    }
+
+
+def packing_summary(requests, capacity, pod_slots=None, replica_mi=None):
+    """One :func:`simulate` row per strategy."""
+    return pd.DataFrame([simulate(requests, capacity, strategy, pod_slots, replica_mi) for strategy in STRATEGIES])
+
+
+def pool_what_if(requests, node_mi, pool_sizes, node_pods=None, replica_mi=None):
+    """:func:`packing_summary` for pools of ``pool_sizes`` identical nodes of ``node_mi`` each."""
+    replica_mi = replica_size(requests) if replica_mi is None else replica_mi
+    frames = []
+    for nodes in pool_sizes:
+        slots = None if node_pods is None else np.full(nodes, node_pods)
+        frames.append(packing_summary(requests, np.full(nodes, float(node_mi)), slots, replica_mi))
+    return pd.concat(frames, ignore_index=True)
+
+
+def nodes_needed(requests, node_mi, node_pods=None, strategy='first_fit'):
+    """Smallest pool of ``node_mi`` nodes that places every pod, or None if a pod is larger than a node.
+
+    Both strategies only start an empty node when no other fits, so the
+    nodes one packing into a large enough pool uses is the answer.
+    """
+    requests = np.nan_to_num(np.asarray(requests, dtype='float64'))
+    if not len(requests):
+        return 0
+    if not node_mi > 0 or requests.max() > node_mi or node_pods == 0:
+        return None
+    lower = max(int(np.ceil(requests.sum() / node_mi)), int(np.ceil(len(requests) / node_pods)) if node_pods else 1, 1)
+    # One node per pod always places every pod, so the pool never needs to grow past that
+    pool = min(2 * lower + 1, len(requests))
+    while True:
+        slots = None if node_pods is None else np.full(pool, node_pods)
+        assignment, _, _ = pack(requests, np.full(pool, float(node_mi)), strategy, slots)
+        if (assignment >= 0).all():
+            return int(assignment.max()) + 1
+        pool = min(2 * pool, len(requests))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m kube_reports.binpack', description=__doc__.split('\n\n')[0])
+    parser.add_argument('pods', help='kubectl get pods -A -o json dump')
+    parser.add_argument('--nodes', required=True, help='kubectl get nodes -o json dump (allocatable memory and pods)')
+    parser.add_argument('--replica-mi', type=float, help='request of the extra replica (default: median request)')
+    parser.add_argument('--pool-sizes', type=int, nargs='*', default=[], help='also pack onto pools of this many nodes')
+    args = parser.parse_args(argv)
+
+    requests = pod_requests(pod_table(args.pods))
+    nodes = node_capacity(args.nodes)
+    slots = nodes['Allocatable_Pods'].to_numpy(dtype='float64', na_value=np.nan)
+    summary = packing_summary(requests, nodes['Allocatable_Memory_Mi'], slots, args.replica_mi)
+    print(summary.to_string(index=False))
+    if args.pool_sizes:
+        node_mi = nodes['Allocatable_Memory_Mi'].median()
+        node_pods = nodes['Allocatable_Pods'].median()
+        node_pods = None if pd.isna(node_pods) else int(node_pods)
+        print(f"\nPools of {node_mi:,.0f}Mi nodes; {nodes_needed(requests, node_mi, node_pods)} needed for every pod")
+        print(pool_what_if(requests, node_mi, args.pool_sizes, node_pods, args.replica_mi).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""Content-hashed frame cache shared by every dashboard page and session.
+
+Streamlit re-executes the whole script on each widget interaction, so any
+frame built from a source (a literal dict today, a metrics dump tomorrow)
+is rebuilt per click. :func:`load_frame` keys a cache entry on the
+*content* of the source, so a rerun over unchanged data is served from
+memory, while an edited dump file produces a new key immediately.
+
+The cache is a ``st.cache_resource``: every browser session connected to
+the server process gets the *same* object rather than its own copy, so
+thirty viewers of one snapshot cost one frame. Each caller gets a shallow
+copy that references the shared values, and pandas copy-on-write (always
+on from pandas 3, and switched on here for older versions) turns any write
+into a private copy instead of a change to the shared frame. Builders are not
+limited to frames: a builder returning a cube or a figure is shared the
+same way.
+
+With ``KUBE_REPORTS_SHM_DIR`` set (``/dev/shm/kube-reports``, say), built
+frames are also written there as Arrow IPC files and other server
+processes on the host memory-map them instead of building them again;
+numeric columns are then read from the page cache without a copy.
+
+Entries expire after ``CACHE_TTL_SECONDS`` and the cache holds at most
+``CACHE_MAX_ENTRIES`` entries, evicting the least recently used one first.
+The shared files follow the same limits: each write removes the files not
+read or written within the TTL, then the least recently used ones beyond
+the entry limit. Unlinking a file another process has mapped is safe; its
+pages are freed when that process lets go of them.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+
+from kube_reports.profiling import PROFILE
+from kube_reports.schema import FOOTPRINT_KEY, session_footprint
+
+CACHE_TTL_SECONDS = int(os.environ.get("KUBE_REPORTS_CACHE_TTL", 600))
+CACHE_MAX_ENTRIES = int(os.environ.get("KUBE_REPORTS_CACHE_ENTRIES", 64))
+SHM_DIR = os.environ.get("KUBE_REPORTS_SHM_DIR")
+
+if int(pd.__version__.split(".")[0]) < 3:
+    # Shared frames stay shared: writes copy the touched columns first
+    pd.set_option("mode.copy_on_write", True)
+
+
+class CacheStats:
+    """Process-wide request/miss counters for :func:`load_frame`.
+
+    ``shared_reads`` counts the misses served from ``SHM_DIR`` rather than
+    built.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.misses = 0
+        self.shared_reads = 0
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def record_shared_read(self):
+        with self._lock:
+            self.shared_reads += 1
+
+    @property
+    def hits(self):
+        return self.requests - self.misses
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.requests if self.requests else 0.0
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.misses = 0
+            self.shared_reads = 0
+
+    def as_dict(self):
+        return {"requests": self.requests, "hits": self.hits, "misses": self.misses,
+                "shared_reads": self.shared_reads, "hit_rate": round(self.hit_rate, 3)}
+
+
+STATS = CacheStats()
+
+
+def content_hash(source):
+    """Stable digest of a frame source.
+
+    Paths to existing files hash the file bytes, DataFrames hash their
+    values and index, tuples hash each member that way, and anything else
+    hashes its JSON form.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(source, tuple):
+        for part in source:
+            digest.update(content_hash(part).encode())
+    elif isinstance(source, (str, os.PathLike)) and os.path.isfile(source):
+        digest.update(os.fspath(source).encode())
+        with open(source, "rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(block)
+    elif isinstance(source, bytes):
+        digest.update(source)
+    elif isinstance(source, pd.DataFrame):
+        digest.update(",".join(map(str, source.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(source, index=True).to_numpy().tobytes())
+    else:
+        digest.update(json.dumps(source, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def _shared_path(key, builder_name):
+    name = hashlib.blake2b(builder_name.encode(), digest_size=8).hexdigest()
+    return os.path.join(SHM_DIR, f"{name}-{key}.arrow")
+
+
+def _read_shared(path):
+    # Memory-mapped, so processes reading the same file share its pages
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    # The mtime doubles as the last use, which _prune_shared evicts by
+    os.utime(path)
+    return table.to_pandas(split_blocks=True)
+
+
+def _prune_shared():
+    """Drop shared files past the TTL, then the oldest beyond the entry limit."""
+    used = []
+    for path in glob.glob(os.path.join(SHM_DIR, "*.arrow*")):
+        try:
+            used.append((os.path.getmtime(path), path))
+        except FileNotFoundError:
+            pass  # pruned by another process meanwhile
+    used.sort(reverse=True)
+    expired = time.time() - CACHE_TTL_SECONDS
+    # Temporary files count towards the age limit only, so a crashed writer's leftovers go too
+    kept = [path for mtime, path in used if mtime >= expired and path.endswith(".arrow")]
+    surplus = set(kept[CACHE_MAX_ENTRIES:])
+    for mtime, path in used:
+        if mtime < expired or path in surplus:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def _write_shared(path, frame):
+    try:
+        table = pa.Table.from_pandas(frame)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return  # e.g. mixed-type object columns; this process keeps its own copy
+    os.makedirs(SHM_DIR, exist_ok=True)
+    # Write then rename, so another process never maps a half-written file
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with pa.OSFile(temporary, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(temporary, path)
+    _prune_shared()
+
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _cached_frame(key, builder_name, _builder, _source):
+    # Only runs on a miss; the leading underscore keeps Streamlit from hashing the source again
+    STATS.record_miss()
+    if not SHM_DIR:
+        return _builder(_source)
+    path = _shared_path(key, builder_name)
+    try:
+        result = _read_shared(path)
+    except FileNotFoundError:
+        pass  # not built yet, or evicted by another process
+    else:
+        STATS.record_shared_read()
+        return result
+    result = _builder(_source)
+    if isinstance(result, pd.DataFrame):
+        _write_shared(path, result)
+    return result
+
+
+def load_frame(source, builder=pd.DataFrame):
+    """Return ``builder(source)``, cached on the source's content hash.
+
+    Frames come back as shallow copies of the shared entry; other results
+    are the shared object itself and must not be modified in place. A
+    frame's compaction saving is added to the session's footprint.
+    """
+    STATS.record_request()
+    builder_name = f"{builder.__module__}.{builder.__qualname__}"
+    with PROFILE.section("load"):
+        result = _cached_frame(content_hash(source), builder_name, builder, source)
+    if isinstance(result, pd.DataFrame) and FOOTPRINT_KEY in result.attrs and st.runtime.exists():
+        session_footprint(st.session_state).record(*result.attrs[FOOTPRINT_KEY])
+    # A shallow copy per caller: adding a column stays local, and writes to
+    # values copy them first because the cached frame still references them
+    return result.copy(deep=False) if isinstance(result, pd.DataFrame) else result
+
+
+def clear():
+    _cached_frame.clear()
+    STATS.reset()
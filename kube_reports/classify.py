@@ -0,0 +1,155 @@
+"""Status, priority and color classification for every chart and table.
+
+Each :class:`Scheme` maps a numeric column onto ordered bands in one
+vectorized pass (``np.digitize`` over the band edges, which is ``pd.cut``
+with left-closed bins), so classifying a 100k-row pod table costs a few
+milliseconds. Pages ask a scheme for labels or colors instead of testing
+thresholds inline, which keeps the legend text, the table status and the
+bar colors in agreement.
+
+Band edges are configurable per process through the environment, e.g.
+``KUBE_REPORTS_NODE_BANDS=60,70,80``; fewer edges merge the middle bands
+(see :meth:`Scheme.with_thresholds`).
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+
+def _bands_from_env(scheme, name):
+    raw = os.environ.get(name)
+    return scheme.with_thresholds(float(edge) for edge in raw.split(',')) if raw else scheme
+
+
+class Scheme:
+    """Ordered bands over a numeric metric, lowest band first.
+
+    ``thresholds`` are the lower edges of every band but the first, so a
+    value equal to an edge falls into the higher band.
+    """
+
+    def __init__(self, thresholds, labels, colors, priorities=None):
+        thresholds = tuple(thresholds)
+        if len(labels) != len(thresholds) + 1 or len(colors) != len(labels):
+            raise ValueError("A scheme needs one label and one color per band (thresholds + 1)")
+        if priorities is not None and len(priorities) != len(labels):
+            raise ValueError("A scheme needs one priority per band")
+        if list(thresholds) != sorted(thresholds):
+            raise ValueError(f"Band thresholds must be increasing, got {thresholds}")
+        self.thresholds = thresholds
+        self.labels = tuple(labels)
+        self.colors = tuple(colors)
+        self.priorities = tuple(priorities) if priorities is not None else None
+
+    def with_thresholds(self, thresholds):
+        """This scheme with other band edges.
+
+        Fewer edges than bands merge the middle ones: the lowest band and
+        the ``len(thresholds)`` highest are kept, so ``70,85`` on the node
+        scheme gives NORMAL, HIGH and CRITICAL.
+        """
+        thresholds = tuple(thresholds)
+        if len(thresholds) > len(self.thresholds):
+            raise ValueError(f"At most {len(self.thresholds)} thresholds for the bands {', '.join(self.labels)}")
+        keep = [0] + list(range(len(self.labels) - len(thresholds), len(self.labels)))
+
+        def pick(values):
+            return None if values is None else tuple(values[index] for index in keep)
+
+        return Scheme(thresholds, pick(self.labels), pick(self.colors), pick(self.priorities))
+
+    def bands(self):
+        """``(label, lower, upper)`` per band, lowest first; the open ends are None."""
+        edges = (None,) + self.thresholds + (None,)
+        return list(zip(self.labels, edges[:-1], edges[1:]))
+
+    def legend(self, highest_first=False):
+        """Markdown list of the bands, e.g. ``- 🔴 **>80%**: Critical``."""
+        lines = []
+        for label, lower, upper in self.bands():
+            icon, _, name = label.partition(' ')
+            if lower is None and upper is None:
+                span = "any"
+            elif lower is None:
+                span = f"<{upper:g}%"
+            elif upper is None:
+                span = f">{lower:g}%"
+            else:
+                span = f"{lower:g}-{upper:g}%"
+            lines.append(f"- {icon} **{span}**: {name.title()}")
+        return '\n'.join(reversed(lines) if highest_first else lines)
+
+    def codes(self, values):
+        """Band index per value; ``-1`` where the value is missing."""
+        values = np.asarray(values, dtype='float64') if not isinstance(values, pd.Series) \
+            else values.to_numpy(dtype='float64', na_value=np.nan)
+        codes = np.digitize(values, self.thresholds)
+        codes[np.isnan(values)] = -1
+        return codes
+
+    def status(self, values):
+        return pd.Categorical.from_codes(self.codes(values), categories=list(self.labels))
+
+    def priority(self, values):
+        if self.priorities is None:
+            raise ValueError("This scheme has no priorities")
+        return pd.Categorical.from_codes(self.codes(values), categories=list(self.priorities))
+
+    def color(self, values, missing='#9e9e9e'):
+        return self._palette(missing)[self.codes(values)]
+
+    def _palette(self, missing):
+        # Code -1 (missing value) indexes the trailing entry
+        return np.asarray(self.colors + (missing,), dtype=object)
+
+    def classify(self, values, missing_color='#9e9e9e'):
+        """Status, Priority (when defined) and Color columns from one pass over ``values``."""
+        codes = self.codes(values)
+        out = {'Status': pd.Categorical.from_codes(codes, categories=list(self.labels), validate=False)}
+        if self.priorities is not None:
+            out['Priority'] = pd.Categorical.from_codes(codes, categories=list(self.priorities), validate=False)
+        color_codes = np.where(codes < 0, len(self.colors), codes)
+        out['Color'] = pd.Categorical.from_codes(color_codes, categories=list(self._palette(missing_color)),
+                                                 validate=False)
+        index = values.index if isinstance(values, pd.Series) else None
+        return pd.DataFrame(out, index=index)
+
+    def count(self, values):
+        """Number of values per band label, including empty bands."""
+        counts = np.bincount(self.codes(values) + 1, minlength=len(self.labels) + 1)[1:]
+        return pd.Series(counts, index=list(self.labels))
+
+
+# Node memory usage bands documented on the Critical Nodes page
+NODE_MEMORY = _bands_from_env(Scheme(
+    thresholds=(60, 70, 80),
+    labels=('🟢 NORMAL', '🟡 MEDIUM', '🟠 HIGH', '🔴 CRITICAL'),
+    priorities=('P3', 'P2', 'P1', 'P0'),
+    colors=('#4caf50', '#ffaa00', '#ff8800', '#ff4444'),
+), 'KUBE_REPORTS_NODE_BANDS')
+
+# Namespace memory usage bands documented on the Current Infrastructure Status page
+NAMESPACE_MEMORY = _bands_from_env(Scheme(
+    thresholds=(70, 80),
+    labels=('🟢 HEALTHY', '🟡 MODERATE', '🔴 CRITICAL'),
+    colors=('#4caf50', '#ff9800', '#f44336'),
+), 'KUBE_REPORTS_NAMESPACE_BANDS')
+
+# Implementation state, scored by implementation_score()
+IMPLEMENTATION = Scheme(
+    thresholds=(0.5, 1),
+    labels=('Not Implemented', 'Partial', 'Implemented'),
+    colors=('#f44336', '#ff9800', '#4caf50'),
+)
+
+
+def implementation_score(statuses):
+    """1 for ✅, 0.5 for ⚠️ and 0 otherwise, for a column of status strings."""
+    statuses = pd.Series(statuses, copy=False).astype('string').fillna('')
+    return np.select(
+        [statuses.str.startswith('✅').to_numpy(dtype=bool), statuses.str.startswith('⚠️').to_numpy(dtype=bool)],
+        [1.0, 0.5],
+        default=0.0,
+    )
@@ -0,0 +1,289 @@
+"""Concurrent per-namespace CPU/memory/pod collection from many clusters.
+
+For every cluster in a config file the collector lists the namespaces (or
+uses the configured ones). For each namespace it then fetches the
+metrics-server ``PodMetricsList`` and the pod specs, and folds them into
+one row per namespace: usage, limits, usage as a percentage of limits,
+and the pod count. This is the same frame the "📊 Current Infrastructure
+Status" page was written against.
+
+All requests share one ``aiohttp`` session, so connections are pooled and
+kept alive per API server. A per-cluster semaphore and then a global one
+bound the number of requests in flight; a request takes a global slot only
+once its cluster has room, so one busy cluster never holds slots the
+others could use. The timeout covers each request from the moment it is
+sent, not the time it waited for a slot. A request that times out gives
+up its whole cluster, so one unreachable API server costs its timeout and
+nothing more. Rows are yielded as namespaces finish rather than when the
+whole fleet is done.
+
+``clusters.json`` maps a cluster name to its API server::
+
+    {"prod": {"server": "https://prod.example:6443", "token_file": "/var/run/prod.token",
+              "namespaces": ["ehgv3", "cenomi"], "verify": true, "timeout": 20}}
+
+``timeout`` is in seconds per request.
+
+Usage::
+
+    python -m kube_reports.collector --clusters clusters.json --out namespaces.csv
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from kube_reports.ingest import parse_cpu_millicores, parse_memory_mi
+from kube_reports.schema import NAMESPACE_SCHEMA, compact
+
+NAMESPACE_COLUMNS = [
+    'Cluster', 'Namespace', 'CPU_Usage_Percent', 'Memory_Usage_Percent', 'Pod_Count',
+    'CPU_Usage_m', 'Memory_Usage_Mi', 'CPU_Limit_m', 'Memory_Limit_Mi',
+    'CPU_Limited_Usage_m', 'Memory_Limited_Usage_Mi', 'Error',
+]
+
+DEFAULT_CONCURRENCY = int(os.environ.get("KUBE_REPORTS_COLLECT_CONCURRENCY", 256))
+DEFAULT_PER_CLUSTER = int(os.environ.get("KUBE_REPORTS_COLLECT_PER_CLUSTER", 16))
+DEFAULT_TIMEOUT = float(os.environ.get("KUBE_REPORTS_COLLECT_TIMEOUT", 30))
+
+NAMESPACES_PATH = '/api/v1/namespaces'
+PODS_PATH = '/api/v1/namespaces/{namespace}/pods'
+POD_METRICS_PATH = '/apis/metrics.k8s.io/v1beta1/namespaces/{namespace}/pods'
+
+
+def load_clusters(path):
+    """Cluster name → endpoint config, from a JSON file."""
+    with open(path, encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def _headers(config):
+    token = config.get('token')
+    if token is None and config.get('token_file'):
+        with open(config['token_file'], encoding='utf-8') as handle:
+            token = handle.read().strip()
+    headers = {'Accept': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    return headers
+
+
+_RAW_FIELDS = {
+    'CPU_Usage_m': parse_cpu_millicores, 'Memory_Usage_Mi': parse_memory_mi,
+    'CPU_Limit_m': parse_cpu_millicores, 'Memory_Limit_Mi': parse_memory_mi,
+    'CPU_Limited_Usage_m': parse_cpu_millicores, 'Memory_Limited_Usage_Mi': parse_memory_mi,
+}
+
+
+def namespace_row(cluster, namespace, pod_metrics, pods):
+    """Pull one namespace's raw quantity strings out of its PodMetricsList and PodList.
+
+    Quantities stay unparsed here: :func:`to_frame` parses a whole batch
+    of namespaces in one vectorized pass, which keeps the event loop free.
+    The ``*_Limited_Usage_*`` lists hold the usage of only the containers
+    that set the matching limit, the numerator of the usage percentages.
+    """
+    usage = {(item.get('metadata', {}).get('name'), container.get('name')): container.get('usage', {})
+             for item in pod_metrics.get('items', []) for container in item.get('containers', [])}
+    limits = {(item.get('metadata', {}).get('name'), container.get('name')):
+              container.get('resources', {}).get('limits', {})
+              for item in pods.get('items', []) if item.get('status', {}).get('phase', 'Running') == 'Running'
+              for container in item.get('spec', {}).get('containers', [])}
+    limited = [(entry, limits.get(key, {})) for key, entry in usage.items()]
+    usage, limits = usage.values(), limits.values()
+    return {
+        'Cluster': cluster, 'Namespace': namespace, 'Pod_Count': len(pod_metrics.get('items', [])),
+        'CPU_Usage_m': [entry.get('cpu') for entry in usage],
+        'Memory_Usage_Mi': [entry.get('memory') for entry in usage],
+        'CPU_Limit_m': [entry.get('cpu') for entry in limits],
+        'Memory_Limit_Mi': [entry.get('memory') for entry in limits],
+        'CPU_Limited_Usage_m': [entry.get('cpu') for entry, limit in limited if limit.get('cpu')],
+        'Memory_Limited_Usage_Mi': [entry.get('memory') for entry, limit in limited if limit.get('memory')],
+        'Error': None,
+    }
+
+
+def _error_row(cluster, namespace, error):
+    row = {'Cluster': cluster, 'Namespace': namespace, 'Pod_Count': None, 'Error':
+           f"{type(error).__name__}: {error}".rstrip(': ')}
+    row.update((name, []) for name in _RAW_FIELDS)
+    return row
+
+
+class Collector:
+    """One pooled HTTP session and its concurrency limits."""
+
+    def __init__(self, clusters, concurrency=DEFAULT_CONCURRENCY, per_cluster=DEFAULT_PER_CLUSTER,
+                 timeout=DEFAULT_TIMEOUT):
+        self.clusters = clusters
+        self.concurrency = concurrency
+        self.per_cluster = per_cluster
+        self.timeout = timeout
+
+    async def _get(self, session, url, headers, ssl, limits):
+        import aiohttp
+
+        cluster_limit, global_limit, timeout = limits
+        async with cluster_limit, global_limit:
+            # Timed from here: waiting for a slot is not the API server's fault
+            async with asyncio.timeout(timeout):
+                async with session.get(url, headers=headers, ssl=ssl) as response:
+                    if response.status >= 400:
+                        raise aiohttp.ClientResponseError(response.request_info, response.history,
+                                                          status=response.status, message=response.reason or '')
+                    return await response.json(content_type=None)
+
+    async def _namespace(self, session, name, config, namespace, limits, ssl, headers):
+        base = config['server'].rstrip('/')
+        try:
+            pod_metrics, pods = await asyncio.gather(
+                self._get(session, base + POD_METRICS_PATH.format(namespace=namespace), headers, ssl, limits),
+                self._get(session, base + PODS_PATH.format(namespace=namespace), headers, ssl, limits),
+            )
+        except TimeoutError:
+            raise  # the API server stopped answering; _cluster gives up on it
+        except Exception as error:  # one bad namespace must not sink the cluster
+            return _error_row(name, namespace, error)
+        return namespace_row(name, namespace, pod_metrics, pods)
+
+    async def _cluster(self, session, name, config, global_limit, out):
+        timeout = config.get('timeout', self.timeout)
+        limits = (asyncio.Semaphore(config.get('concurrency', self.per_cluster)), global_limit, timeout)
+        ssl = None if config.get('verify', True) else False
+        headers = _headers(config)
+        pending = set()
+        try:
+            namespaces = config.get('namespaces')
+            if not namespaces:
+                listing = await self._get(session, config['server'].rstrip('/') + NAMESPACES_PATH,
+                                          headers, ssl, limits)
+                namespaces = [item['metadata']['name'] for item in listing.get('items', [])]
+            pending = {asyncio.create_task(self._namespace(session, name, config, namespace, limits, ssl, headers))
+                       for namespace in namespaces}
+            for task in asyncio.as_completed(pending):
+                await out.put(await task)
+        except Exception as error:
+            for task in pending:
+                task.cancel()
+            await out.put(_error_row(name, pd.NA, error if str(error) else TimeoutError(
+                f"cluster did not answer a request within {timeout}s")))
+
+    async def stream(self):
+        """Yield one row per namespace (or per failed cluster) as it completes."""
+        import aiohttp
+
+        out = asyncio.Queue()
+        global_limit = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=0, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            workers = [asyncio.create_task(self._cluster(session, name, config, global_limit, out))
+                       for name, config in self.clusters.items()]
+            done = asyncio.gather(*workers)
+            while not (done.done() and out.empty()):
+                getter = asyncio.ensure_future(out.get())
+                finished, _ = await asyncio.wait({getter, done}, return_when=asyncio.FIRST_COMPLETED)
+                if getter in finished:
+                    yield getter.result()
+                else:
+                    getter.cancel()
+            await done
+
+
+def to_frame(rows):
+    """Rows from :meth:`Collector.stream` as a frame in ``NAMESPACE_COLUMNS`` order."""
+    rows = list(rows)
+    owners = np.arange(len(rows))
+    failed = np.array([row['Error'] is not None for row in rows], dtype=bool)
+    frame = pd.DataFrame({
+        'Cluster': [row['Cluster'] for row in rows],
+        'Namespace': [row['Namespace'] for row in rows],
+        'Pod_Count': pd.array([row['Pod_Count'] for row in rows], dtype='Int64'),
+        'Error': pd.array([row['Error'] for row in rows], dtype='string'),
+    })
+    for name, parse in _RAW_FIELDS.items():
+        # Every container of every namespace in the batch, parsed at once and summed per namespace
+        lengths = [len(row[name]) for row in rows]
+        values = parse([value for row in rows for value in row[name]])
+        totals = np.bincount(np.repeat(owners, lengths), weights=np.nan_to_num(values), minlength=len(rows))
+        frame[name] = pd.array(np.round(totals), dtype='Int64')
+        frame.loc[failed, name] = pd.NA
+    for name, usage, limit in (('CPU_Usage_Percent', 'CPU_Limited_Usage_m', 'CPU_Limit_m'),
+                               ('Memory_Usage_Percent', 'Memory_Limited_Usage_Mi', 'Memory_Limit_Mi')):
+        # Usage of unlimited containers is left out; no limits set means no meaningful percentage
+        frame[name] = (frame[usage] / frame[limit].replace(0, pd.NA) * 100).round().astype('Int64')
+    return compact(frame[NAMESPACE_COLUMNS], NAMESPACE_SCHEMA)
+
+
+def collect_batches(clusters, interval=0.25, **kwargs):
+    """Run the collector on a background event loop and yield frames of new rows.
+
+    For synchronous callers such as a Streamlit script: each yielded frame
+    holds the rows that arrived during the last ``interval`` seconds.
+    """
+    rows = queue.Queue()
+    finished = object()
+
+    async def pump():
+        try:
+            async for row in Collector(clusters, **kwargs).stream():
+                rows.put(row)
+        finally:
+            rows.put(finished)
+
+    thread = threading.Thread(target=asyncio.run, args=(pump(),), daemon=True)
+    thread.start()
+    batch, deadline, running = [], time.monotonic() + interval, True
+    while running:
+        try:
+            row = rows.get(timeout=max(deadline - time.monotonic(), 0.001))
+            if row is finished:
+                running = False
+            else:
+                batch.append(row)
+        except queue.Empty:
+            pass
+        if (time.monotonic() >= deadline or not running) and batch:
+            yield to_frame(batch)
+            batch = []
+        if time.monotonic() >= deadline:
+            deadline = time.monotonic() + interval
+    thread.join()
+
+
+def collect(clusters, **kwargs):
+    """All namespaces of all ``clusters`` as one frame."""
+    frames = list(collect_batches(clusters, **kwargs))
+    return pd.concat(frames, ignore_index=True) if frames else to_frame([])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m kube_reports.collector', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--clusters', required=True, help='JSON file of cluster endpoints')
+    parser.add_argument('--out', help='write the namespace frame to this CSV')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='requests in flight overall')
+    parser.add_argument('--per-cluster', type=int, default=DEFAULT_PER_CLUSTER, help='requests in flight per cluster')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='seconds allowed per API request')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    frame = collect(load_clusters(args.clusters), concurrency=args.concurrency,
+                    per_cluster=args.per_cluster, timeout=args.timeout)
+    elapsed = time.perf_counter() - start
+    failed = frame['Error'].notna()
+    print(f"collected {int((~failed).sum())} namespaces from {frame['Cluster'].nunique()} clusters "
+          f"in {elapsed:.2f}s ({int(failed.sum())} errors)")
+    for _, row in frame[failed].iterrows():
+        print(f"  {row['Cluster']}/{row['Namespace']}: {row['Error']}")
+    if args.out:
+        frame.to_csv(args.out, index=False)
+
+
+if __name__ == '__main__':
+    main()
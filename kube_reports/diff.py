@@ -0,0 +1,106 @@
+"""Old-vs-current diff of two node or namespace tables.
+
+:func:`diff_frames` aligns two snapshots on their key columns with one
+outer merge and computes absolute and percentage deltas for every metric
+in a single vectorized pass, so a 10k-node fleet diffs in milliseconds.
+Rows present on only one side are kept and tagged ``added`` or
+``removed`` rather than dropped (integer metrics become nullable
+integers, not floats), and :func:`top_regressions` picks the
+worst ``n`` changes with ``nlargest`` instead of sorting the whole fleet.
+"""
+
+import numpy as np
+import pandas as pd
+
+CHANGE_STATES = ['common', 'added', 'removed']
+
+_MERGE_STATES = {'both': 'common', 'right_only': 'added', 'left_only': 'removed'}
+
+
+def _nullable(dtype):
+    """Nullable extension type of a numpy integer dtype (``int32`` -> ``Int32``), else None."""
+    if isinstance(dtype, np.dtype) and dtype.kind in 'iu':
+        return pd.api.types.pandas_dtype(f"{'UInt' if dtype.kind == 'u' else 'Int'}{dtype.itemsize * 8}")
+    return None
+
+
+def metric_columns(old, current, keys):
+    """Numeric columns present in both frames, in ``current``'s order."""
+    return [name for name in current.columns
+            if name not in keys and name in old.columns
+            and pd.api.types.is_numeric_dtype(current[name]) and pd.api.types.is_numeric_dtype(old[name])]
+
+
+def diff_frames(old, current, keys='Node', metrics=None, columns=()):
+    """One row per key with ``<metric>_Old``, ``_Current``, ``_Change`` and ``_Change_Percent``.
+
+    ``keys`` is a column name or list (``['Cluster', 'Namespace']``) and
+    duplicates keep the last row. ``columns`` are extra non-metric columns
+    (e.g. ``Status``) carried through as ``_Old``/``_Current``. ``State``
+    is ``common``, ``added`` (only in ``current``) or ``removed``. Change
+    columns are missing unless the row is ``common``, and the percentage
+    is missing when the old value is 0.
+    """
+    keys = [keys] if isinstance(keys, str) else list(keys)
+    metrics = metric_columns(old, current, keys) if metrics is None else list(metrics)
+    wanted = keys + metrics + [name for name in columns if name not in metrics]
+    old = old.drop_duplicates(keys, keep='last')[[name for name in wanted if name in old.columns]]
+    current = current.drop_duplicates(keys, keep='last')[[name for name in wanted if name in current.columns]]
+
+    merged = pd.merge(old, current, on=keys, how='outer', suffixes=('_Old', '_Current'),
+                      indicator='State', sort=False)
+    # Rows missing on one side turn integer columns into float64; keep them integers with NA
+    for frame, side in ((old, '_Old'), (current, '_Current')):
+        for name in metrics + list(columns):
+            column = name + side
+            dtype = _nullable(frame[name].dtype) if name in frame.columns else None
+            if dtype is not None and column in merged.columns and merged[column].dtype.kind == 'f':
+                merged[column] = merged[column].astype(dtype)
+    out = {name: merged[name] for name in keys}
+    out['State'] = pd.Categorical(merged['State'].map(_MERGE_STATES).to_numpy(), categories=CHANGE_STATES)
+    for name in list(columns) + metrics:
+        for side in ('_Old', '_Current'):
+            column = name + side
+            if column in merged.columns:
+                out[column] = merged[column]
+    for name in metrics:
+        before, after = merged[name + '_Old'], merged[name + '_Current']
+        change = after - before
+        out[name + '_Change'] = change
+        baseline = before.astype('float64').replace(0, np.nan)
+        out[name + '_Change_Percent'] = (change.astype('float64') / baseline * 100).round(1)
+    return pd.DataFrame(out)
+
+
+def summary(diff):
+    """Row counts per ``State``."""
+    return diff['State'].value_counts().reindex(CHANGE_STATES, fill_value=0)
+
+
+def _top(diff, metric, n, percent, keys, largest):
+    keys = [keys] if isinstance(keys, str) else list(keys)
+    column = f"{metric}_Change_Percent" if percent else f"{metric}_Change"
+    change = diff[column].astype('float64')
+    grew = (change > 0) if largest else (change < 0)
+    # Missing changes (added/removed rows) compare False and drop out here
+    change = change[grew.to_numpy() & (diff['State'] == 'common').to_numpy()]
+    order = change.nlargest(n).index if largest else change.nsmallest(n).index
+    return diff.loc[order, keys + [f"{metric}_Old", f"{metric}_Current", f"{metric}_Change",
+                                   f"{metric}_Change_Percent"]].reset_index(drop=True)
+
+
+def top_regressions(diff, metric, n=10, percent=False, keys='Node'):
+    """The ``n`` common rows whose ``metric`` grew the most."""
+    return _top(diff, metric, n, percent, keys, largest=True)
+
+
+def top_improvements(diff, metric, n=10, percent=False, keys='Node'):
+    """The ``n`` common rows whose ``metric`` dropped the most."""
+    return _top(diff, metric, n, percent, keys, largest=False)
+
+
+def changed_keys(diff, state, keys='Node'):
+    """Key values of the rows in ``state`` (``added`` or ``removed``)."""
+    keys = [keys] if isinstance(keys, str) else list(keys)
+    rows = diff.loc[np.asarray(diff['State'] == state), keys]
+    return rows[keys[0]].tolist() if len(keys) == 1 else list(rows.itertuples(index=False, name=None))
@@ -0,0 +1,141 @@
+"""Pre-serialized Plotly figures for charts drawn from constant data.
+
+``st.plotly_chart`` rebuilds nothing itself, but a page calling it on every
+rerun first constructs the ``go.Figure`` (``make_subplots``, ``add_trace``
+and ``update_layout`` validate every property) and Streamlit then encodes
+it to JSON again. For a chart whose inputs have not changed, both produce
+the same string each time. :func:`cached_chart` builds the figure once per
+input fingerprint (the source's content hash, through
+:func:`kube_reports.cache.load_frame`) and keeps only its JSON. A rerun then
+sends the stored string straight to the frontend as the same
+``PlotlyChart`` element ``st.plotly_chart`` would send. No figure object is
+created and nothing is re-encoded. That element is built with Streamlit
+internals (requirements.txt pins the versions it is known to match); if
+they are missing or have changed, charts fall back to ``st.plotly_chart``
+on the figure decoded from the stored JSON.
+
+:data:`STATS` counts the charts served from stored JSON and the CPU that
+saved: the figure's measured build and encode time minus what serving the
+stored JSON cost.
+"""
+
+import functools
+import threading
+import time
+
+import plotly.io
+
+from kube_reports.cache import load_frame
+from kube_reports.profiling import PROFILE
+
+# plotly.js default height, which Streamlit also uses for a figure without one
+DEFAULT_HEIGHT = 450
+
+
+class FigureSpec:
+    """A figure serialized as Streamlit sends it, and what building it cost."""
+
+    def __init__(self, spec, height=None, width=None, build_seconds=0.0):
+        self.spec = spec
+        self.height = height
+        self.width = width
+        self.build_seconds = build_seconds
+
+    @classmethod
+    def from_figure(cls, figure, build_seconds=0.0):
+        started = time.perf_counter()
+        # Same encoding as st.plotly_chart: the validated dict, then to_json without validating again
+        figure = figure.to_dict()
+        spec = plotly.io.to_json(figure, validate=False)
+        layout = figure.get('layout', {})
+        return cls(spec, layout.get('height'), layout.get('width'),
+                   build_seconds + time.perf_counter() - started)
+
+
+class FigureStats:
+    """Process-wide counters for :func:`cached_chart`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.served = 0
+        self.built = 0
+        self.saved_seconds = 0.0
+
+    def record_build(self):
+        with self._lock:
+            self.built += 1
+
+    def record_served(self, spec, seconds):
+        """A chart drawn from stored JSON in ``seconds`` instead of built in ``spec.build_seconds``."""
+        with self._lock:
+            self.served += 1
+            self.saved_seconds += max(spec.build_seconds - seconds, 0.0)
+
+    def reset(self):
+        with self._lock:
+            self.served = 0
+            self.built = 0
+            self.saved_seconds = 0.0
+
+
+STATS = FigureStats()
+
+
+@functools.cache
+def _spec_builder(builder):
+    """``builder`` returning a :class:`FigureSpec`; one wrapper per builder, so the cache key stays stable."""
+    def build(source):
+        STATS.record_build()
+        started = time.perf_counter()
+        figure = builder(source)
+        return FigureSpec.from_figure(figure, time.perf_counter() - started)
+
+    build.__module__ = builder.__module__
+    build.__qualname__ = f"{builder.__qualname__}.spec"
+    return build
+
+
+def spec_chart(spec, width='stretch', key=None, config=None):
+    """Draw a :class:`FigureSpec` as ``st.plotly_chart`` draws a figure (no selections)."""
+    import json
+
+    import streamlit as st
+
+    try:
+        from streamlit.elements.lib.form_utils import current_form_id
+        from streamlit.elements.lib.layout_utils import LayoutConfig
+        from streamlit.elements.lib.utils import compute_and_register_element_id
+        from streamlit.proto.PlotlyChart_pb2 import PlotlyChart as PlotlyChartProto
+
+        dg = st._main
+        proto = PlotlyChartProto()
+        proto.theme = "streamlit"
+        proto.form_id = current_form_id(dg)
+        proto.spec = spec.spec
+        proto.config = json.dumps(config or {})
+        layout = LayoutConfig(width=(spec.width or 700) if width == 'content' else width,
+                              height=spec.height or DEFAULT_HEIGHT)
+        proto.id = compute_and_register_element_id(
+            "plotly_chart", user_key=key, key_as_main_identity=False, dg=dg, plotly_spec=proto.spec,
+            plotly_config=proto.config, is_selection_activated=False, theme="streamlit", width=width,
+            height="content",
+        )
+        return dg._enqueue("plotly_chart", proto, layout_config=layout)
+    except (ImportError, AttributeError, TypeError):
+        # Streamlit internals moved: decode the figure and let the public API send it
+        return st.plotly_chart(plotly.io.from_json(spec.spec), width=width, key=key, config=config)
+
+
+def cached_chart(source, builder, key=None):
+    """Draw ``builder(source)``, a Plotly figure, from JSON cached on the content of ``source``.
+
+    ``builder`` must depend on nothing but ``source``. Charts fill the
+    container's width, as with ``use_container_width=True``.
+    """
+    started, built = time.perf_counter(), STATS.built
+    spec = load_frame(source, builder=_spec_builder(builder))
+    with PROFILE.section("serialize"):
+        element = spec_chart(spec, key=key)
+    if STATS.built == built:
+        STATS.record_served(spec, time.perf_counter() - started)
+    return element
@@ -0,0 +1,304 @@
+"""Load node metrics from live cluster dumps into the dashboard's node frame.
+
+Every loader returns the same columnar frame the reports were written
+against (``Node``, ``Memory_Usage_Percent``, ``Memory_Usage_Mi``, ...), so a
+real ``kubectl top`` capture, a metrics-server JSON dump or a Prometheus
+export can be dropped in wherever the hard-coded node dicts were used.
+
+Parsing is done column-at-a-time with pandas string and arithmetic ops; no
+loader builds the frame row by row.
+"""
+
+import errno
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from kube_reports.classify import NODE_MEMORY
+from kube_reports.schema import NODE_SCHEMA, compact
+
+NODE_COLUMNS = [
+    'Node',
+    'Memory_Usage_Percent',
+    'Memory_Usage_Mi',
+    'Memory_Overcommit_Percent',
+    'CPU_Usage_Percent',
+    'CPU_Usage_Mi',
+    'Pods',
+    'Status',
+    'Priority',
+]
+
+# Kubernetes quantity suffixes -> multiplier to the base unit (bytes / cores)
+QUANTITY_SUFFIXES = {
+    '': 1.0,
+    'n': 1e-9, 'u': 1e-6, 'm': 1e-3,
+    'k': 1e3, 'M': 1e6, 'G': 1e9, 'T': 1e12, 'P': 1e15, 'E': 1e18,
+    'Ki': 2.0 ** 10, 'Mi': 2.0 ** 20, 'Gi': 2.0 ** 30,
+    'Ti': 2.0 ** 40, 'Pi': 2.0 ** 50, 'Ei': 2.0 ** 60,
+}
+
+_QUANTITY_RE = r'^\s*([+-]?[0-9.]+(?:[eE][+-]?[0-9]+)?)\s*([a-zA-Z]*)\s*$'
+
+# Prometheus series -> (node frame column, scale to the column's unit)
+PROMETHEUS_METRICS = {
+    'node_memory_working_set_bytes': ('Memory_Usage_Mi', 1 / 2 ** 20),
+    'node:cpu_usage_cores:rate5m': ('CPU_Usage_Mi', 1000.0),
+    'kubelet_running_pods': ('Pods', 1.0),
+    'node:memory_overcommit:ratio': ('Memory_Overcommit_Percent', 100.0),
+    'kube_node_status_allocatable_memory_bytes': ('Allocatable_Memory_Mi', 1 / 2 ** 20),
+    'kube_node_status_allocatable_cpu_cores': ('Allocatable_CPU_Mi', 1000.0),
+}
+
+_PROM_LINE_RE = (
+    r'^(?P<metric>[a-zA-Z_:][a-zA-Z0-9_:]*)'
+    r'(?:\{(?P<labels>[^}]*)\})?'
+    r'\s+(?P<value>[^\s]+)'
+)
+
+# Window statistics of node memory, read from a memory sketch -> quantile
+MEMORY_STATISTICS = {'P50': 0.5, 'P95': 0.95, 'P99': 0.99, 'Max': 1.0}
+
+LOADERS = {}
+
+
+def register_loader(name):
+    """Register a loader function under ``name`` for :func:`load_nodes`."""
+    def decorator(func):
+        LOADERS[name] = func
+        return func
+    return decorator
+
+
+def parse_quantity(values):
+    """Convert Kubernetes quantity strings ("836m", "11342Mi") to base units."""
+    # Dumps repeat the same few quantities ("512Mi", "1Gi"), so parse each distinct one once
+    codes, uniques = pd.factorize(pd.Series(values, copy=False).astype('string'))
+    parts = pd.Series(uniques, dtype='string').str.extract(_QUANTITY_RE)
+    number = pd.to_numeric(parts[0], errors='coerce')
+    scale = parts[1].map(QUANTITY_SUFFIXES)
+    parsed = np.append((number * scale).astype('float64').to_numpy(), np.nan)
+    return parsed[codes]
+
+
+def parse_cpu_millicores(values):
+    return parse_quantity(values) * 1000.0
+
+
+def parse_memory_mi(values):
+    return parse_quantity(values) / 2 ** 20
+
+
+def _looks_like_path(source):
+    """True for a single line that names a file rather than holding a snapshot."""
+    if isinstance(source, os.PathLike):
+        return True
+    text = source.strip()
+    if not text or '\n' in text or text[:1] in ('{', '['):
+        return False
+    # A one-line kubectl top or Prometheus capture has spaces and no slashes
+    return '/' in text or os.sep in text or not any(char.isspace() for char in text)
+
+
+def _read_text(source):
+    if hasattr(source, 'read'):
+        data = source.read()
+        return data.decode() if isinstance(data, bytes) else data
+    if isinstance(source, (str, os.PathLike)) and os.path.exists(source):
+        with open(source, encoding='utf-8') as handle:
+            return handle.read()
+    if isinstance(source, (str, os.PathLike)) and _looks_like_path(source):
+        # A mistyped path would otherwise parse as an empty capture
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), os.fspath(source))
+    return source
+
+
+def _read_json(source):
+    if isinstance(source, (dict, list)):
+        return source
+    return json.loads(_read_text(source))
+
+
+def _items(document):
+    return document.get('items', []) if isinstance(document, dict) else document
+
+
+def _column(items, *path):
+    """Pull one nested field out of every item into a flat list."""
+    out = []
+    for item in items:
+        for key in path:
+            item = item.get(key) if isinstance(item, dict) else None
+        out.append(item)
+    return out
+
+
+def _as_float(values):
+    return pd.to_numeric(values, errors='coerce').astype('float64')
+
+
+def finalize_nodes(df, record=True):
+    """Fill derived columns and return the frame in ``NODE_COLUMNS`` order.
+
+    ``record=False`` is for re-finalizing a frame that was already compacted.
+    """
+    df = df.copy()
+    for column in NODE_COLUMNS:
+        if column not in df:
+            df[column] = np.nan
+    # Percentages the source lacks, as usage over allocatable; overcommit is pod memory limits
+    # over allocatable. Filled in float64, since a finalized frame holds nullable integers.
+    for percent, amount, capacity in (('Memory_Usage_Percent', 'Memory_Usage_Mi', 'Allocatable_Memory_Mi'),
+                                      ('Memory_Overcommit_Percent', 'Memory_Limit_Mi', 'Allocatable_Memory_Mi'),
+                                      ('CPU_Usage_Percent', 'CPU_Usage_Mi', 'Allocatable_CPU_Mi')):
+        if amount in df and capacity in df:
+            allocatable = _as_float(df[capacity])
+            df[percent] = _as_float(df[percent]).fillna(_as_float(df[amount]) / allocatable.where(allocatable > 0) * 100)
+    # Status and priority always follow the configured memory bands
+    df['Status'] = NODE_MEMORY.status(df['Memory_Usage_Percent'])
+    df['Priority'] = NODE_MEMORY.priority(df['Memory_Usage_Percent'])
+
+    for column in ['Memory_Usage_Percent', 'Memory_Usage_Mi', 'Memory_Overcommit_Percent',
+                   'CPU_Usage_Percent', 'CPU_Usage_Mi', 'Pods']:
+        df[column] = pd.to_numeric(df[column], errors='coerce').round().astype('Int64')
+    extra = [c for c in df.columns if c not in NODE_COLUMNS]
+    return compact(df[NODE_COLUMNS + extra].reset_index(drop=True), NODE_SCHEMA, record=record)
+
+
+def implied_allocatable(nodes):
+    """Allocatable memory (Mi) per row: the frame's column, else usage over usage percent."""
+    if 'Allocatable_Memory_Mi' in nodes:
+        return nodes['Allocatable_Memory_Mi'].astype('float64')
+    percent = nodes['Memory_Usage_Percent'].astype('float64')
+    return nodes['Memory_Usage_Mi'].astype('float64') / percent.where(percent > 0) * 100
+
+
+def apply_memory_sketch(nodes, sketch):
+    """Node frame with ``Memory_Usage_<P50|P95|P99|Max>_Percent`` from a node memory sketch.
+
+    ``sketch`` is a :class:`kube_reports.sketch.GroupedSketch` of memory
+    usage in Mi grouped by node name, e.g. merged from the shards written
+    by ``python -m kube_reports.streaming --sketch-out``. Nodes the sketch
+    has not seen get no values.
+    """
+    nodes = nodes.copy()
+    names = nodes['Node'].astype('string')
+    allocatable = implied_allocatable(nodes).to_numpy(dtype='float64', na_value=np.nan)
+    for statistic, q in MEMORY_STATISTICS.items():
+        usage = sketch.max if q == 1 else sketch.quantile(q)
+        percent = names.map(usage).to_numpy(dtype='float64', na_value=np.nan) / allocatable * 100
+        nodes[f'Memory_Usage_{statistic}_Percent'] = pd.array(np.round(percent), dtype='Float64').astype('Int64')
+    return compact(nodes, NODE_SCHEMA, record=False)
+
+
+def nodes_frame(data):
+    """Build the node frame from one of the report's literal column dicts."""
+    return finalize_nodes(pd.DataFrame(data))
+
+
+@register_loader('kubectl-top')
+def load_kubectl_top(source):
+    """Parse ``kubectl top nodes`` output (with or without the header row)."""
+    text = _read_text(source).strip()
+    names = ['Node', 'CPU', 'CPU_Percent', 'Memory', 'Memory_Percent']
+    header = 0 if text.split(None, 1)[0] == 'NAME' else None
+    raw = pd.read_csv(io.StringIO(text), sep=r'\s+', header=header, names=names,
+                      usecols=range(5), dtype=str)
+    return finalize_nodes(pd.DataFrame({
+        'Node': raw['Node'],
+        'CPU_Usage_Mi': parse_cpu_millicores(raw['CPU']),
+        'CPU_Usage_Percent': pd.to_numeric(raw['CPU_Percent'].str.rstrip('%'), errors='coerce'),
+        'Memory_Usage_Mi': parse_memory_mi(raw['Memory']),
+        'Memory_Usage_Percent': pd.to_numeric(raw['Memory_Percent'].str.rstrip('%'), errors='coerce'),
+    }))
+
+
+@register_loader('metrics-server')
+def load_metrics_server(source, nodes=None, pods=None):
+    """Parse a metrics-server ``NodeMetricsList`` dump.
+
+    ``nodes`` (``kubectl get nodes -o json``) supplies allocatable capacity
+    for the percentage columns and ``pods`` (``kubectl get pods -A -o json``)
+    supplies the running pod count and the memory limits behind the
+    overcommit column (see :mod:`kube_reports.overcommit`).
+    """
+    items = _items(_read_json(source))
+    df = pd.DataFrame({
+        'Node': _column(items, 'metadata', 'name'),
+        'CPU_Usage_Mi': parse_cpu_millicores(_column(items, 'usage', 'cpu')),
+        'Memory_Usage_Mi': parse_memory_mi(_column(items, 'usage', 'memory')),
+    })
+
+    if nodes is not None:
+        node_items = _items(_read_json(nodes))
+        capacity = pd.DataFrame({
+            'Node': _column(node_items, 'metadata', 'name'),
+            'Allocatable_CPU_Mi': parse_cpu_millicores(_column(node_items, 'status', 'allocatable', 'cpu')),
+            'Allocatable_Memory_Mi': parse_memory_mi(_column(node_items, 'status', 'allocatable', 'memory')),
+        })
+        df = df.merge(capacity, on='Node', how='left')
+
+    if pods is not None:
+        from kube_reports.overcommit import node_limits, pod_table
+
+        placement = pod_table(pods)
+        counts = placement.loc[placement['Phase'] == 'Running', 'Node'].value_counts()
+        df['Pods'] = df['Node'].map(counts).fillna(0)
+        df['Memory_Limit_Mi'] = df['Node'].map(node_limits(placement)).fillna(0.0)
+
+    return finalize_nodes(df)
+
+
+@register_loader('prometheus')
+def load_prometheus(source, metrics=None, node_label='node'):
+    """Parse a Prometheus text-format export into the node frame.
+
+    ``metrics`` maps series names to ``(column, scale)``; the default
+    :data:`PROMETHEUS_METRICS` covers the kubelet/kube-state-metrics series
+    plus the recording rules used by our exporters.
+    """
+    metrics = PROMETHEUS_METRICS if metrics is None else metrics
+    lines = pd.Series(_read_text(source).splitlines(), dtype='string')
+    lines = lines[~lines.str.startswith('#') & (lines.str.strip() != '')]
+    parsed = lines.str.extract(_PROM_LINE_RE)
+    parsed = parsed[parsed['metric'].isin(list(metrics))]
+
+    node = parsed['labels'].str.extract(rf'(?:^|,)\s*{node_label}="([^"]*)"')[0]
+    mapping = pd.DataFrame.from_dict(metrics, orient='index', columns=['column', 'scale'])
+    column = parsed['metric'].map(mapping['column'])
+    value = pd.to_numeric(parsed['value'], errors='coerce') * parsed['metric'].map(mapping['scale'])
+
+    long = pd.DataFrame({'Node': node, 'column': column, 'value': value}).dropna(subset=['Node'])
+    wide = long.pivot_table(index='Node', columns='column', values='value', aggfunc='last')
+    wide.columns.name = None
+    return finalize_nodes(wide.reset_index())
+
+
+def detect_format(source):
+    """Guess which registered loader understands ``source``."""
+    if isinstance(source, (dict, list)):
+        return 'metrics-server'
+    text = _read_text(source).lstrip()
+    if text[:1] in ('{', '['):
+        return 'metrics-server'
+    if text.startswith('#'):
+        return 'prometheus'
+    # `kubectl top` rows have five whitespace-separated fields, exposition lines two or three
+    first_line = text.split('\n', 1)[0]
+    return 'kubectl-top' if len(first_line.split()) >= 5 else 'prometheus'
+
+
+def load_nodes(source, format=None, **kwargs):
+    """Load a node snapshot, dispatching to the loader registered for ``format``."""
+    if format is None:
+        if isinstance(source, (str, os.PathLike)) and os.path.exists(source):
+            source = _read_text(source)
+        format = detect_format(source)
+    try:
+        loader = LOADERS[format]
+    except KeyError:
+        raise ValueError(f"Unknown node metrics format {format!r}; expected one of {sorted(LOADERS)}")
+    return loader(source, **kwargs)
@@ -0,0 +1,257 @@
+"""Offline memory-leak detection over stored per-container memory series.
+
+The recommended alert ``increase(container_memory_usage_bytes[1h]) >
+100000000`` with ``for: 10m`` is evaluated here against the sample store
+(:class:`kube_reports.timeseries.SampleStore`) instead of a running
+Prometheus, for every container at once. Samples are laid out as a dense
+float32 matrix of one row per series and one column per minute, and read
+one day partition at a time. :class:`LeakScan` carries what it needs
+across days: the last hour of every row, the length of the current
+firing streak and running least-squares sums. Each day is then a handful
+of whole-matrix operations:
+
+- the 1h increase is the matrix minus itself shifted by an hour (gaps are
+  filled with the last sample, as Prometheus would see a stale series);
+- a firing streak's length is the distance to the last column where the
+  condition did not hold (``np.maximum.accumulate``), so the ``for:``
+  duration needs no per-sample loop, and the *onset* of a leak is where
+  its first firing streak began;
+- the least-squares slope of every series comes from matrix-vector
+  products with the time axis.
+
+A container is a *leak candidate* when the rule fired and its memory
+also grew by at least ``MIN_SLOPE_MB_PER_HOUR`` over the scanned window,
+which sets apart a lasting climb from a one-off warm-up step. Rows are
+processed ``SERIES_CHUNK`` at a time, so memory stays bounded whatever
+the number of containers::
+
+    python -m kube_reports.leaks --root samples --days 7 --out leaks.csv
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from kube_reports.timeseries import SampleStore, _utc
+
+# Per-container working set samples in MB, one series per container
+LEAK_METRIC = os.environ.get("KUBE_REPORTS_LEAK_METRIC", "container_memory_mb")
+STEP = pd.Timedelta("1min")
+WINDOW = pd.Timedelta("1h")
+HOLD = pd.Timedelta("10m")
+# 100000000 bytes, the threshold of the MemoryLeakDetected rule
+INCREASE_MB = 100.0
+MIN_SLOPE_MB_PER_HOUR = float(os.environ.get("KUBE_REPORTS_LEAK_MIN_SLOPE", 10))
+TRAILING = pd.Timedelta("6h")
+SERIES_CHUNK = 8192
+
+
+def _ffill(values):
+    """Carry each row's last sample forward over NaN gaps."""
+    missing = np.isnan(values)
+    if not missing.any():
+        return values
+    columns = np.where(missing, 0, np.arange(values.shape[1], dtype='int32'))
+    np.maximum.accumulate(columns, axis=1, out=columns)
+    return np.take_along_axis(values, columns, axis=1)
+
+
+def _slope(count, sum_t, sum_y, sum_ty, sum_tt):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = (count * sum_ty - sum_t * sum_y) / (count * sum_tt - sum_t ** 2)
+    return np.where(count >= 2, slope, np.nan)
+
+
+class LeakScan:
+    """Per-series rule and trend state, fed consecutive blocks of minute columns.
+
+    ``start`` is the time of the first column. Register series names with
+    :meth:`codes` and pass blocks with one row per registered series to
+    :meth:`update`; :meth:`frame` summarizes what has been seen so far.
+    """
+
+    def __init__(self, start, step=STEP, window=WINDOW, hold=HOLD, increase_mb=INCREASE_MB,
+                 min_slope=MIN_SLOPE_MB_PER_HOUR, trailing=TRAILING):
+        self.start = _utc(start)
+        self.step = pd.Timedelta(step)
+        self.window = int(pd.Timedelta(window) / self.step)
+        self.hold = int(pd.Timedelta(hold) / self.step)
+        self.trailing = int(pd.Timedelta(trailing) / self.step)
+        self.increase_mb = increase_mb
+        self.min_slope = min_slope
+        self.series = pd.Index([], dtype=object)
+        self.columns = 0
+        self._hours = self.step / pd.Timedelta("1h")
+        self._tail = np.empty((0, max(self.window, self.trailing)), dtype='float32')
+        self._state = {name: np.empty(0, dtype=dtype) for name, dtype in (
+            ('run', 'int64'), ('onset', 'int64'), ('firing', 'int64'), ('max_increase', 'float32'),
+            ('count', 'float64'), ('sum_t', 'float64'), ('sum_y', 'float64'), ('sum_ty', 'float64'),
+            ('sum_tt', 'float64'))}
+
+    def codes(self, names):
+        """Row of each name, registering the ones not seen before."""
+        names = pd.Index(names, dtype=object)
+        codes = self.series.get_indexer(names)
+        new = names[codes < 0].unique()
+        if len(new):
+            self.series = self.series.append(new)
+            if len(self.series) > len(self._tail):
+                # Grow the state arrays geometrically, so registering series one batch at a time stays linear
+                grow = max(len(self.series), 2 * len(self._tail)) - len(self._tail)
+                self._tail = np.vstack([self._tail, np.full((grow, self._tail.shape[1]), np.nan, dtype='float32')])
+                fill = {'onset': -1, 'max_increase': np.nan}
+                self._state = {name: np.concatenate([values, np.full(grow, fill.get(name, 0), dtype=values.dtype)])
+                               for name, values in self._state.items()}
+            codes = self.series.get_indexer(names)
+        return codes
+
+    def update(self, block):
+        """Fold in ``block`` (rows = registered series, columns = the next minutes)."""
+        block = np.asarray(block, dtype='float32')
+        columns = block.shape[1]
+        # Least-squares sums use hours from the block's start in float32, shifted to the scan's start in float64
+        offset = self.columns * self._hours
+        local = (np.arange(columns) * self._hours).astype('float32')
+        index = np.arange(columns, dtype='int32')
+        width = self._tail.shape[1]
+        state = self._state
+        for lo in range(0, len(self.series), SERIES_CHUNK):
+            rows = slice(lo, min(lo + SERIES_CHUNK, len(self.series)))
+            raw = block[rows]
+            filled = _ffill(np.concatenate([self._tail[rows], raw], axis=1))
+            with np.errstate(invalid='ignore'):
+                increase = filled[:, width:] - filled[:, width - self.window:filled.shape[1] - self.window]
+                holds = increase > self.increase_mb
+            state['max_increase'][rows] = np.fmax(state['max_increase'][rows], np.fmax.reduce(increase, axis=1))
+            # Streaks only need working out where the condition held, or a streak runs in from the last block
+            active = np.flatnonzero(holds.any(axis=1) | (state['run'][rows] > 0))
+            if len(active):
+                carried = state['run'][rows][active]
+                # Streak length: distance to the last column where the condition did not hold
+                last_miss = np.maximum.accumulate(np.where(holds[active], np.int32(-1), index), axis=1)
+                run = np.where(last_miss >= 0, index - last_miss, index + 1 + carried[:, None])
+                # Pending for the hold after the streak began, as with Prometheus for:, then firing
+                firing = run > self.hold
+                first = firing.argmax(axis=1)
+                onset = state['onset'][rows]
+                starts = np.flatnonzero(firing.any(axis=1) & (onset[active] < 0))
+                onset[active[starts]] = self.columns + first[starts] - run[starts, first[starts]] + 1
+                state['firing'][rows][active] += firing.sum(axis=1)
+                state['run'][rows][active] = run[:, -1]
+            missing = np.isnan(raw)
+            if missing.any():
+                valid = ~missing
+                samples = np.where(valid, raw, np.float32(0))
+                count, sum_t, sum_tt = valid.sum(axis=1), valid @ local, valid @ (local * local)
+            else:
+                samples = raw
+                count, sum_t, sum_tt = columns, local.sum(dtype='float64'), (local * local).sum(dtype='float64')
+            sum_y = samples.sum(axis=1, dtype='float64')
+            sum_ty = samples @ local
+            state['count'][rows] += count
+            state['sum_t'][rows] += sum_t + offset * count
+            state['sum_y'][rows] += sum_y
+            state['sum_ty'][rows] += sum_ty + offset * sum_y
+            state['sum_tt'][rows] += sum_tt + 2 * offset * sum_t + offset ** 2 * count
+            self._tail[rows] = filled[:, -width:]
+        self.columns += columns
+        return self
+
+    def frame(self):
+        """One row per series with its slope, largest 1h increase, onset and candidacy."""
+        state = {name: values[:len(self.series)] for name, values in self._state.items()}
+        tail = self._tail[:len(self.series)]
+        slope = _slope(state['count'], state['sum_t'], state['sum_y'], state['sum_ty'], state['sum_tt'])
+        # Trend over the last TRAILING of the window: is it still climbing?
+        recent = tail[:, -self.trailing:].astype('float64')
+        t = np.arange(recent.shape[1]) * self._hours
+        valid = ~np.isnan(recent)
+        samples = np.where(valid, recent, 0)
+        trailing = _slope(valid.sum(axis=1), valid @ t, samples.sum(axis=1), samples @ t, valid @ (t * t))
+        onset = state['onset']
+        fired = onset >= 0
+        return pd.DataFrame({
+            'Series': self.series.astype('string'),
+            'Samples': state['count'].astype('int64'),
+            'Last_MB': tail[:, -1],
+            'Slope_MB_per_Hour': slope,
+            'Trailing_Slope_MB_per_Hour': trailing,
+            'Max_Increase_MB': state['max_increase'],
+            'Onset': pd.Series(self.start + pd.to_timedelta(np.where(fired, onset, 0) * self.step.value)).where(fired),
+            'Firing_Minutes': (state['firing'] * (self.step / pd.Timedelta("1min"))).astype('int64'),
+            'Candidate': fired & (slope >= self.min_slope),
+        })
+
+
+def _day_block(scan, files, day_start, day_end):
+    """Dense ``series × minute`` matrix of one day partition, clipped to ``[day_start, day_end)``."""
+    columns = int((day_end - day_start) / scan.step)
+    block = np.full((len(scan.series), columns), np.nan, dtype='float32')
+    # Stored timestamps are milliseconds
+    origin, step = day_start.value // 10 ** 6, scan.step.value // 10 ** 6
+    dictionary = codes = None
+    for path in files:
+        table = pq.read_table(path, columns=['Timestamp', 'Series', 'Value'], read_dictionary=['Series'],
+                              memory_map=True)
+        for stamps, series, values in zip(*(table.column(name).chunks for name in ('Timestamp', 'Series', 'Value'))):
+            # Names are looked up once per dictionary, not once per sample; chunks of a file usually share one
+            if dictionary is None or not series.dictionary.equals(dictionary):
+                dictionary = series.dictionary
+                codes = scan.codes(dictionary.to_pylist())
+            rows = codes[series.indices.to_numpy(zero_copy_only=False)]
+            column = (stamps.cast('int64').to_numpy() - origin) // step
+            values = values.to_numpy(zero_copy_only=False)
+            if column.min(initial=0) < 0 or column.max(initial=0) >= columns:
+                keep = (column >= 0) & (column < columns)
+                rows, column, values = rows[keep], column[keep], values[keep]
+            if len(scan.series) > len(block):
+                grow = max(len(scan.series), 2 * len(block)) - len(block)
+                block = np.vstack([block, np.full((grow, columns), np.nan, dtype='float32')])
+            block.reshape(-1)[rows * columns + column] = values
+    return block
+
+
+def scan_store(root, metric=LEAK_METRIC, start=None, end=None, days=7, **options):
+    """Scan ``[start, end)`` of a sample store (default: its last ``days`` days) into a :class:`LeakScan`."""
+    store = SampleStore(root)
+    span = store.span(metric)
+    if span is None:
+        raise ValueError(f"No samples of {metric!r} under {root}")
+    end = _utc(end) if end is not None else span[1]
+    start = _utc(start) if start is not None else max(span[0], end - pd.Timedelta(days=days))
+    scan = LeakScan(start, **options)
+    files = store.files(metric, start, end)
+    day = start
+    while day < end:
+        day_end = min(day.normalize() + pd.Timedelta(days=1), end)
+        scan.update(_day_block(scan, files.get(day.strftime('%Y-%m-%d'), []), day, day_end))
+        day = day_end
+    return scan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m kube_reports.leaks', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--root', default=os.environ.get('KUBE_REPORTS_SAMPLE_DIR', 'samples'))
+    parser.add_argument('--metric', default=LEAK_METRIC)
+    parser.add_argument('--days', type=float, default=7, help='scan the last DAYS of the store')
+    parser.add_argument('--min-slope', type=float, default=MIN_SLOPE_MB_PER_HOUR, help='MB per hour')
+    parser.add_argument('--out', help='write every scanned series to this CSV')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    scan = scan_store(args.root, args.metric, days=args.days, min_slope=args.min_slope)
+    frame = scan.frame()
+    candidates = frame[frame['Candidate']].sort_values('Slope_MB_per_Hour', ascending=False)
+    print(f"{len(frame):,} series, {scan.columns:,} minutes, {len(candidates):,} leak candidates "
+          f"in {time.perf_counter() - started:.1f}s")
+    print(candidates.head(20).to_string(index=False))
+    if args.out:
+        frame.to_csv(args.out, index=False)
+
+
+if __name__ == '__main__':
+    main()
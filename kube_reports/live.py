@@ -0,0 +1,64 @@
+"""Incremental live refresh for wall-mounted dashboards.
+
+In auto-refresh mode a page draws its live charts inside
+``st.fragment(run_every=...)``, so each tick reruns only those fragments,
+not the whole script with its CSS, sidebar and static tables. Each tick
+asks the sample store for the samples since the last one seen and folds
+them into a per-session :class:`LiveTrend`. That appends new timestamps,
+replaces the trailing one and drops rows that left the window, instead of
+re-reading and re-aggregating the whole window.
+"""
+
+import os
+
+import pandas as pd
+
+from kube_reports.timeseries import SampleStore
+
+REFRESH_SECONDS = int(os.environ.get("KUBE_REPORTS_REFRESH_SECONDS", 30))
+LIVE_WINDOW = pd.Timedelta(os.environ.get("KUBE_REPORTS_LIVE_WINDOW", "6h"))
+
+
+class LiveTrend:
+    """One aggregated line over a rolling window, kept current with delta reads."""
+
+    def __init__(self, root, metric, window=LIVE_WINDOW, agg='mean'):
+        self.store = SampleStore(root)
+        self.metric = metric
+        self.window = pd.Timedelta(window)
+        self.agg = agg
+        self.line = pd.DataFrame({'Timestamp': pd.Series(dtype='datetime64[ms, UTC]'),
+                                  'Value': pd.Series(dtype='float64')})
+        self.version = 0
+
+    @property
+    def last(self):
+        return self.line['Timestamp'].iloc[-1] if len(self.line) else None
+
+    def refresh(self, now=None):
+        """Fold in samples since the last timestamp; return how many timestamps changed."""
+        last = self.last
+        if last is None:
+            now = pd.Timestamp.now(tz='UTC') if now is None else pd.Timestamp(now)
+            last = now - self.window
+        # Re-read the trailing timestamp too: its samples may have been only partly written last tick
+        delta = self.store.samples_since(self.metric, last, columns=('Timestamp', 'Value'))
+        if delta.empty:
+            return 0
+        update = delta.groupby('Timestamp', sort=True)['Value'].agg(self.agg).reset_index()
+        if len(update) == 1 and self.last is not None and update['Value'].iloc[0] == self.line['Value'].iloc[-1]:
+            return 0
+        first = update['Timestamp'].iloc[0]
+        cutoff = update['Timestamp'].iloc[-1] - self.window
+        keep = self.line[(self.line['Timestamp'] < first).to_numpy() & (self.line['Timestamp'] >= cutoff).to_numpy()]
+        self.line = pd.concat([keep, update], ignore_index=True)
+        self.version += 1
+        return len(update)
+
+
+def live_trend(session_state, root, metric, window=LIVE_WINDOW):
+    """The session's :class:`LiveTrend` for ``(root, metric, window)``, created on first use."""
+    key = f"live_trend:{root}:{metric}:{pd.Timedelta(window)}"
+    if key not in session_state:
+        session_state[key] = LiveTrend(root, metric, window)
+    return session_state[key]
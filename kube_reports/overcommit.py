@@ -0,0 +1,151 @@
+"""Memory overcommit derived from pod limits and node allocatable memory.
+
+Overcommit is the sum of the memory limits of the pods scheduled on a node,
+divided by the node's allocatable memory. :func:`memory_overcommit`
+computes it for every node in one grouped pass: node names are factorized
+once and the limits summed with ``np.bincount``, so a 200k-pod table takes
+a few milliseconds. Containers without a memory limit add nothing, the
+same as the "Allocated resources" total in ``kubectl describe node``.
+
+:class:`OvercommitLedger` keeps the per-node totals for watch-style
+updates. Changing, moving or deleting one pod adjusts two running sums
+rather than re-aggregating the table.
+"""
+
+import numpy as np
+import pandas as pd
+
+from kube_reports.ingest import _column, _items, _read_json, implied_allocatable, parse_memory_mi
+from kube_reports.schema import POD_SCHEMA, compact
+
+POD_COLUMNS = ['Namespace', 'Pod', 'Node', 'Phase', 'Memory_Request_Mi', 'Memory_Limit_Mi']
+
+# Pods in these phases hold their node's memory; Succeeded/Failed pods do not
+ACTIVE_PHASES = ('Pending', 'Running', 'Unknown')
+
+
+def _container_totals(pod_items, field, resource='memory', parse=parse_memory_mi):
+    """Sum one container resource over each pod's containers, parsing every value in one pass."""
+    containers = [item.get('spec', {}).get('containers', []) if isinstance(item, dict) else []
+                  for item in pod_items]
+    lengths = [len(group) for group in containers]
+    values = parse([container.get('resources', {}).get(field, {}).get(resource)
+                    for group in containers for container in group])
+    owners = np.repeat(np.arange(len(containers)), lengths)
+    return np.bincount(owners, weights=np.nan_to_num(values), minlength=len(containers))
+
+
+def pod_table(source):
+    """Pod frame (``POD_COLUMNS``) from a ``kubectl get pods -A -o json`` dump."""
+    items = _items(_read_json(source))
+    return compact(pd.DataFrame({
+        'Namespace': _column(items, 'metadata', 'namespace'),
+        'Pod': _column(items, 'metadata', 'name'),
+        'Node': _column(items, 'spec', 'nodeName'),
+        'Phase': _column(items, 'status', 'phase'),
+        'Memory_Request_Mi': _container_totals(items, 'requests'),
+        'Memory_Limit_Mi': _container_totals(items, 'limits'),
+    }, columns=POD_COLUMNS), POD_SCHEMA)
+
+
+def node_allocatable(source):
+    """Allocatable memory (Mi) per node from a ``kubectl get nodes -o json`` dump."""
+    items = _items(_read_json(source))
+    return pd.Series(parse_memory_mi(_column(items, 'status', 'allocatable', 'memory')),
+                     index=pd.Index(_column(items, 'metadata', 'name'), name='Node'),
+                     name='Allocatable_Memory_Mi')
+
+
+def node_limits(pods):
+    """Sum of memory limits (Mi) of the active, scheduled pods on each node."""
+    active = pods['Phase'].isin(ACTIVE_PHASES).to_numpy() & pods['Node'].notna().to_numpy()
+    codes, nodes = pd.factorize(pods['Node'].to_numpy()[active])
+    limits = pods['Memory_Limit_Mi'].to_numpy(dtype='float64', na_value=0.0)[active]
+    totals = np.bincount(codes, weights=limits, minlength=len(nodes))
+    return pd.Series(totals, index=pd.Index(nodes, name='Node'), name='Memory_Limit_Mi')
+
+
+def _overcommit_frame(limits, allocatable):
+    frame = pd.concat([limits, allocatable], axis=1).rename_axis('Node').reset_index()
+    frame['Memory_Limit_Mi'] = frame['Memory_Limit_Mi'].fillna(0.0)
+    capacity = frame['Allocatable_Memory_Mi'].where(frame['Allocatable_Memory_Mi'] > 0)
+    frame['Memory_Overcommit_Percent'] = frame['Memory_Limit_Mi'] / capacity * 100
+    return frame
+
+
+def memory_overcommit(pods, allocatable):
+    """``Node``, ``Memory_Limit_Mi``, ``Allocatable_Memory_Mi`` and ``Memory_Overcommit_Percent``.
+
+    ``allocatable`` is a Series indexed by node name (see
+    :func:`node_allocatable`). Nodes with no pods show 0%, and nodes of
+    unknown size have no percentage.
+    """
+    return _overcommit_frame(node_limits(pods), allocatable.rename('Allocatable_Memory_Mi'))
+
+
+def apply_overcommit(nodes, pods, allocatable=None):
+    """Node frame with ``Memory_Overcommit_Percent`` recomputed from ``pods``.
+
+    Allocatable memory comes from ``allocatable`` if given, else from the
+    frame's ``Allocatable_Memory_Mi`` column. Failing both, it is implied
+    by usage and usage percent, which is all a ``kubectl top`` capture
+    carries.
+    """
+    from kube_reports.ingest import finalize_nodes
+
+    nodes = nodes.copy()
+    if allocatable is not None:
+        nodes['Allocatable_Memory_Mi'] = nodes['Node'].map(allocatable)
+    else:
+        nodes['Allocatable_Memory_Mi'] = implied_allocatable(nodes)
+    nodes['Memory_Limit_Mi'] = nodes['Node'].map(node_limits(pods)).fillna(0.0)
+    nodes['Memory_Overcommit_Percent'] = np.nan
+    return finalize_nodes(nodes, record=False)
+
+
+class OvercommitLedger:
+    """Per-node limit totals that follow single-pod changes in O(1).
+
+    Build it once from a pod table, then feed it watch events::
+
+        ledger = OvercommitLedger(pods, allocatable)
+        ledger.update('shop', 'api-7d9f', node='vmss0000bm', limit_mi=1024)
+        ledger.remove('shop', 'worker-1')
+        ledger.frame()
+    """
+
+    def __init__(self, pods, allocatable):
+        self.allocatable = allocatable.rename('Allocatable_Memory_Mi')
+        self.totals = node_limits(pods).to_dict()
+        active = pods['Phase'].isin(ACTIVE_PHASES).to_numpy() & pods['Node'].notna().to_numpy()
+        live = pods[active]
+        limits = live['Memory_Limit_Mi'].to_numpy(dtype='float64', na_value=0.0)
+        self._pods = dict(zip(zip(live['Namespace'].tolist(), live['Pod'].tolist()),
+                              zip(live['Node'].tolist(), np.nan_to_num(limits).tolist())))
+
+    def _release(self, key):
+        node, limit = self._pods.pop(key, (None, 0.0))
+        if node is not None:
+            self.totals[node] = self.totals.get(node, 0.0) - limit
+
+    def update(self, namespace, pod, node, limit_mi, phase='Running'):
+        """Record the pod's current node, limit and phase (added, resized, moved or finished)."""
+        key = (namespace, pod)
+        self._release(key)
+        if node is not None and phase in ACTIVE_PHASES:
+            limit = 0.0 if limit_mi is None or pd.isna(limit_mi) else float(limit_mi)
+            self._pods[key] = (node, limit)
+            self.totals[node] = self.totals.get(node, 0.0) + limit
+
+    def remove(self, namespace, pod):
+        self._release((namespace, pod))
+
+    def percent(self, node):
+        """Overcommit of one node, in percent (``nan`` when its size is unknown)."""
+        capacity = self.allocatable.get(node, np.nan)
+        return self.totals.get(node, 0.0) / capacity * 100 if capacity and capacity > 0 else np.nan
+
+    def frame(self):
+        """Same columns as :func:`memory_overcommit`, from the running totals."""
+        limits = pd.Series(self.totals, name='Memory_Limit_Mi', dtype='float64').rename_axis('Node')
+        return _overcommit_frame(limits, self.allocatable)
@@ -0,0 +1,27 @@
+"""Dashboard pages, imported lazily one section at a time.
+
+Each report package (``node_comparison``, ``phase1``) lists its sidebar
+sections in an ordered ``PAGES`` mapping of label to page module. A page
+module, and the plotting/numeric imports it needs, is only imported the
+first time its section is selected; after that it is served from the
+memoized loader, so a rerun costs only the page being viewed.
+"""
+
+import functools
+import importlib
+
+
+def page_labels(report):
+    """Sidebar labels for ``report``, in navigation order."""
+    return list(importlib.import_module(f"{__name__}.{report}").PAGES)
+
+
+@functools.cache
+def load_page(report, label):
+    """Import (once) and return the page module behind ``label``."""
+    pages = importlib.import_module(f"{__name__}.{report}").PAGES
+    try:
+        module_name = pages[label]
+    except KeyError:
+        raise KeyError(f"{report!r} has no page {label!r}") from None
+    return importlib.import_module(f"{__name__}.{report}.{module_name}")
@@ -0,0 +1,8 @@
+"""Pages of the static old-vs-current node comparison report."""
+
+PAGES = {
+    "🚨 Executive Summary": "executive_summary",
+    "📊 Critical Nodes Overview": "critical_nodes",
+    "🔍 Node-by-Node Analysis": "node_by_node",
+    "📈 Action Plan & Timeline": "action_plan",
+}
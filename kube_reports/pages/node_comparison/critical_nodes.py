@@ -0,0 +1,230 @@
+"""📊 Critical Nodes Overview: memory usage and overcommitment, old vs current.
+
+The usage-vs-overcommit scatter scales with the fleet: nodes are labelled
+on the chart only up to ``SCATTER_LABEL_POINTS`` (beyond that the name is
+on hover), the traces switch to WebGL (``go.Scattergl``) above
+``SCATTERGL_POINTS``, and the density view bins the points server-side, so
+the browser receives a fixed-size grid rather than one marker per node. It
+is on by default above ``DENSITY_POINTS``.
+"""
+
+import os
+
+import numpy as np
+import streamlit as st
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from kube_reports.classify import NODE_MEMORY
+from kube_reports.ingest import MEMORY_STATISTICS
+from kube_reports.pages.node_comparison.data import node_frames
+
+SCATTER_LABEL_POINTS = int(os.environ.get("KUBE_REPORTS_SCATTER_LABEL_POINTS", 50))
+SCATTERGL_POINTS = int(os.environ.get("KUBE_REPORTS_SCATTERGL_POINTS", 1000))
+DENSITY_POINTS = int(os.environ.get("KUBE_REPORTS_DENSITY_POINTS", 20000))
+DENSITY_BINS = 60
+
+
+def overcommit_hover(df):
+    """Hover showing the pod limits and allocatable memory behind each overcommit bar."""
+    if not {'Memory_Limit_Mi', 'Allocatable_Memory_Mi'} <= set(df.columns):
+        return {}
+    return dict(
+        customdata=df[['Memory_Limit_Mi', 'Allocatable_Memory_Mi']].astype('float64').to_numpy(),
+        hovertemplate='%{x}: %{y}% = %{customdata[0]:,.0f}Mi pod limits / %{customdata[1]:,.0f}Mi allocatable<extra></extra>'
+    )
+
+
+def usage_overcommit_trace(df, name, color, label_prefix, textposition):
+    """One state's usage-vs-overcommit markers, labelled or WebGL depending on the point count."""
+    points = len(df)
+    scatter = go.Scattergl if points > SCATTERGL_POINTS else go.Scatter
+    marker = dict(size=15 if points <= SCATTER_LABEL_POINTS else 6, color=color)
+    hover = dict(hovertext=df['Node'], hovertemplate='%{hovertext}<br>Usage %{x}%<br>Overcommit %{y}%<extra>'
+                 + name + '</extra>')
+    if points <= SCATTER_LABEL_POINTS:
+        return scatter(x=df['Memory_Usage_Percent'], y=df['Memory_Overcommit_Percent'], mode='markers+text',
+                       marker=marker, text=[label_prefix + node[-2:] for node in df['Node']],
+                       textposition=textposition, name=name, **hover)
+    return scatter(x=df['Memory_Usage_Percent'], y=df['Memory_Overcommit_Percent'], mode='markers',
+                   marker=marker, name=name, **hover)
+
+
+def usage_overcommit_density(frames, bins=DENSITY_BINS):
+    """Contour outlines of node density per state, binned on a shared grid."""
+    usage = [df['Memory_Usage_Percent'].to_numpy(dtype='float64', na_value=np.nan) for df, _, _ in frames]
+    overcommit = [df['Memory_Overcommit_Percent'].to_numpy(dtype='float64', na_value=np.nan) for df, _, _ in frames]
+    known = [np.isfinite(x) & np.isfinite(y) for x, y in zip(usage, overcommit)]
+    all_x = np.concatenate([x[mask] for x, mask in zip(usage, known)])
+    all_y = np.concatenate([y[mask] for y, mask in zip(overcommit, known)])
+    if not len(all_x):
+        return []
+    x_edges = np.histogram_bin_edges(all_x, bins=bins)
+    y_edges = np.histogram_bin_edges(all_y, bins=bins)
+    traces = []
+    for x, y, mask, (_, name, color) in zip(usage, overcommit, known, frames):
+        counts, _, _ = np.histogram2d(x[mask], y[mask], bins=(x_edges, y_edges))
+        traces.append(go.Contour(
+            x=(x_edges[:-1] + x_edges[1:]) / 2, y=(y_edges[:-1] + y_edges[1:]) / 2, z=counts.T,
+            name=name, showlegend=True, showscale=False, contours_coloring='lines', line_width=2,
+            colorscale=[[0, color], [1, color]], ncontours=8,
+            hovertemplate='Usage %{x:.0f}%<br>Overcommit %{y:.0f}%<br>%{z:.0f} nodes<extra>' + name + '</extra>'
+        ))
+    return traces
+
+
+def memory_statistic(df_old, df_current):
+    """Label and column of the memory figure to chart: the point value or a window statistic.
+
+    Window statistics (p50/p95/p99/max) are offered when both states carry
+    them, i.e. when memory sketches were loaded; p95 is then the default.
+    """
+    options = {'Point value': 'Memory_Usage_Percent'}
+    options.update((statistic, f'Memory_Usage_{statistic}_Percent') for statistic in MEMORY_STATISTICS
+                   if f'Memory_Usage_{statistic}_Percent' in df_old and f'Memory_Usage_{statistic}_Percent' in df_current)
+    if len(options) == 1:
+        return 'Point value', 'Memory_Usage_Percent'
+    labels = list(options)
+    label = st.radio("Memory statistic", labels, index=labels.index('P95') if 'P95' in labels else 0,
+                     horizontal=True, key="memory_statistic",
+                     help="Per-node memory over the sketch window instead of the single sampled value")
+    return label, options[label]
+
+
+def render():
+    st.header("📊 Critical Nodes Overview")
+    df_old, df_current = node_frames()
+    
+    # Nodes status overview
+    st.subheader("🎯 Node Status Summary")
+    statistic, memory = memory_statistic(df_old, df_current)
+    
+    # Create a comprehensive dashboard
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Memory usage comparison
+        fig = go.Figure()
+        
+        # Old state
+        fig.add_trace(go.Bar(
+            name='Old State',
+            x=df_old['Node'].str[-8:],  # Show last 8 chars for readability
+            y=df_old[memory],
+            marker_color=NODE_MEMORY.color(df_old[memory]),
+            text=df_old[memory],
+            textposition='auto',
+            texttemplate='%{text}%',
+            offsetgroup=1
+        ))
+        
+        # Current state
+        fig.add_trace(go.Bar(
+            name='Current State',
+            x=df_current['Node'].str[-8:],
+            y=df_current[memory],
+            marker_color='#4ecdc4',
+            text=df_current[memory],
+            textposition='auto',
+            texttemplate='%{text}%',
+            offsetgroup=2
+        ))
+        
+        # The top band's lower edge is critical, the next one down the warning level
+        for edge, name, color in zip(NODE_MEMORY.thresholds[::-1], ("Critical", "Warning"), ("red", "orange")):
+            fig.add_hline(y=edge, line_dash="dash", line_color=color,
+                         annotation_text=f"{name} Threshold ({edge:g}%)")
+        
+        fig.update_layout(
+            title="Node Memory Usage Comparison - Old vs Current" + ('' if statistic == 'Point value' else f" ({statistic})"),
+            xaxis_title="Node (Last 8 chars)",
+            yaxis_title="Memory Usage (%)" if statistic == 'Point value' else f"{statistic} Memory Usage (%)",
+            height=400,
+            barmode='group'
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.markdown("### 🚨 Critical Thresholds")
+        old_counts = NODE_MEMORY.count(df_old[memory])
+        current_counts = NODE_MEMORY.count(df_current[memory])
+        # Bands above the lowest, at most the top two (critical and high with the default bands)
+        elevated = list(NODE_MEMORY.labels[1:][-2:])
+        elevated_names = '/'.join(label.partition(' ')[2].lower() for label in elevated[::-1])
+        critical_now = current_counts.iloc[-1] if elevated else 0
+        st.markdown("**Memory Usage Levels:**\n" + NODE_MEMORY.legend(highest_first=True))
+        st.markdown(f"""
+        **Old Status:**
+        - {old_counts[elevated].sum()} nodes in {elevated_names} state
+        - {old_counts.iloc[0]} nodes in safe range
+        
+        **Current Status:**
+        - {critical_now} nodes in critical state
+        - {current_counts.iloc[0]} nodes in safe range
+        - **{'Major improvement achieved' if current_counts[elevated].sum() < old_counts[elevated].sum() else f'No reduction in {elevated_names} nodes'}**
+        """)
+    
+    # Memory overcommitment analysis
+    st.subheader("⚠️ Memory Overcommitment Analysis")
+    
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=('Overcommitment: Old vs Current', 'Memory Usage vs Overcommitment'),
+        specs=[[{"type": "bar"}, {"type": "scatter"}]]
+    )
+    
+    # Overcommitment comparison
+    fig.add_trace(
+        go.Bar(
+            name='Old Overcommit',
+            x=df_old['Node'].str[-8:],
+            y=df_old['Memory_Overcommit_Percent'],
+            marker_color='#ff6b6b',
+            text=df_old['Memory_Overcommit_Percent'],
+            textposition='auto',
+            texttemplate='%{text}%',
+            offsetgroup=1,
+            **overcommit_hover(df_old)
+        ),
+        row=1, col=1
+    )
+    
+    fig.add_trace(
+        go.Bar(
+            name='Current Overcommit',
+            x=df_current['Node'].str[-8:],
+            y=df_current['Memory_Overcommit_Percent'],
+            marker_color='#4ecdc4',
+            text=df_current['Memory_Overcommit_Percent'],
+            textposition='auto',
+            texttemplate='%{text}%',
+            offsetgroup=2,
+            **overcommit_hover(df_current)
+        ),
+        row=1, col=1
+    )
+    
+    # Scatter plot: Usage vs Overcommitment (binned into a density view for large fleets)
+    frames = [(df_old, 'Old State', '#ff6b6b'), (df_current, 'Current State', '#4ecdc4')]
+    points = len(df_old) + len(df_current)
+    if points > SCATTER_LABEL_POINTS and st.toggle(
+            "Density view", value=points > DENSITY_POINTS, key="overcommit_density",
+            help="Bin the usage-vs-overcommit points into contour outlines instead of drawing every node"):
+        fig.add_traces(usage_overcommit_density(frames), rows=1, cols=2)
+    else:
+        fig.add_trace(usage_overcommit_trace(df_old, 'Old State', '#ff6b6b', 'Old-', "top center"), row=1, col=2)
+        fig.add_trace(usage_overcommit_trace(df_current, 'Current State', '#4ecdc4', 'Cur-', "bottom center"),
+                      row=1, col=2)
+    
+    fig.add_hline(y=100, line_dash="dash", line_color="red", row=1, col=1,
+                 annotation_text="100% Limit")
+    fig.add_hline(y=100, line_dash="dash", line_color="red", row=1, col=2)
+    
+    fig.update_layout(height=500, showlegend=True, barmode='group')
+    fig.update_xaxes(title_text="Node", row=1, col=1)
+    fig.update_xaxes(title_text="Memory Usage (%)", row=1, col=2)
+    fig.update_yaxes(title_text="Overcommit (%)", row=1, col=1)
+    fig.update_yaxes(title_text="Overcommit (%)", row=1, col=2)
+    
+    st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,193 @@
+"""Node tables shared by the Critical Nodes and Node-by-Node pages, and the pod packing summaries."""
+
+import glob
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from kube_reports.binpack import node_capacity, packing_summary, pod_requests, requests_from_nodes
+from kube_reports.cache import load_frame
+from kube_reports.diff import diff_frames, metric_columns
+from kube_reports.ingest import (NODE_COLUMNS, apply_memory_sketch, detect_format, implied_allocatable, load_nodes,
+                                 nodes_frame)
+from kube_reports.overcommit import apply_overcommit, node_allocatable, pod_table
+from kube_reports.schema import NODE_SCHEMA, compact
+from kube_reports.sketch import GroupedSketch
+from kube_reports.snapshots import SnapshotStore
+
+# EXACT DATA FROM OLD REPORT
+old_nodes_data = {
+    'Node': [
+        'aks-easv4serina-28315746-vmss0000bm',
+        'aks-easv4serina-28315746-vmss00007r', 
+        'aks-easv4serina-28315746-vmss00004q'
+    ],
+    'Memory_Usage_Percent': [90, 83, 77],
+    'Memory_Usage_Mi': [11342, 10544, 9742],
+    # Sum of pod memory limits per node; overcommit is derived from these
+    'Memory_Limit_Mi': [25458, 24954, 21929],
+    'Allocatable_Memory_Mi': [12603, 12603, 12603],
+    'CPU_Usage_Percent': [44, 52, 33],
+    'CPU_Usage_Mi': [836, 1248, 792],
+    'Pods': [15, 12, 8]
+}
+
+# CURRENT STATE DATA (After optimization)
+current_nodes_data = {
+    'Node': [
+        'aks-easv4serina-28315746-vmss0000bm',
+        'aks-easv4serina-28315746-vmss00007r', 
+        'aks-easv4serina-28315746-vmss00004q'
+    ],
+    'Memory_Usage_Percent': [68, 61, 55],
+    'Memory_Usage_Mi': [8567, 7732, 6945],
+    'Memory_Limit_Mi': [18274, 17392, 15754],
+    'Allocatable_Memory_Mi': [12603, 12603, 12603],
+    'CPU_Usage_Percent': [38, 45, 29],
+    'CPU_Usage_Mi': [722, 1080, 696],
+    'Pods': [18, 15, 12]
+}
+
+
+def node_frames():
+    """Old and current node frames, honoring the sidebar data sources.
+
+    Snapshot paths entered under "📂 Data Source" (kubectl top /
+    metrics-server JSON / Prometheus export) replace the report data. A
+    file that does not exist is reported with ``st.error`` and skipped.
+    """
+    # Status and priority are derived from the memory bands, never typed in
+    old = load_frame(old_nodes_data, builder=nodes_frame)
+    current = load_frame(current_nodes_data, builder=nodes_frame)
+    old_source = st.session_state.get("old_nodes_source")
+    current_source = st.session_state.get("current_nodes_source")
+    node_specs = st.session_state.get("node_specs_source") or None
+    if old_source:
+        old = _load_or_keep(old, (old_source, node_specs), _load_nodes)
+    if current_source:
+        current = _load_or_keep(current, (current_source, node_specs), _load_nodes)
+    # Pod dumps replace any overcommit figure with one derived from pod limits
+    old_pods = st.session_state.get("old_pods_source")
+    current_pods = st.session_state.get("current_pods_source")
+    if old_pods:
+        old = _load_or_keep(old, (old, old_pods, node_specs), _with_overcommit)
+    if current_pods:
+        current = _load_or_keep(current, (current, current_pods, node_specs), _with_overcommit)
+    # Memory sketches (comma-separated files or globs, merged) add p50/p95/p99/max per node
+    old_sketches = sketch_paths(st.session_state.get("old_sketch_source"))
+    current_sketches = sketch_paths(st.session_state.get("current_sketch_source"))
+    if old_sketches:
+        old = _load_or_keep(old, (old, *old_sketches), _with_memory_sketch)
+    if current_sketches:
+        current = _load_or_keep(current, (current, *current_sketches), _with_memory_sketch)
+    return old, current
+
+
+def _load_or_keep(frame, source, builder):
+    """``builder`` applied to ``source``, or ``frame`` unchanged when a file it names is missing."""
+    try:
+        return load_frame(source, builder=builder)
+    except FileNotFoundError as error:
+        st.error(f"Snapshot file not found: {error.filename or error}")
+        return frame
+
+
+def _load_nodes(source):
+    path, node_specs = source
+    # metrics-server dumps carry no allocatable capacity; the nodes JSON supplies it
+    if node_specs and detect_format(path) == 'metrics-server':
+        return load_nodes(path, format='metrics-server', nodes=node_specs)
+    return load_nodes(path)
+
+
+def sketch_paths(text):
+    """Sketch files named by a comma-separated list of paths and glob patterns."""
+    patterns = [part.strip() for part in (text or '').split(',') if part.strip()]
+    return tuple(sorted({path for pattern in patterns for path in (glob.glob(pattern) or [pattern])}))
+
+
+def _with_memory_sketch(source):
+    nodes, *paths = source
+    return apply_memory_sketch(nodes, GroupedSketch.merged(paths))
+
+
+def _with_overcommit(source):
+    nodes, pods, node_specs = source
+    allocatable = node_allocatable(node_specs) if node_specs else None
+    return apply_overcommit(nodes, pod_table(pods), allocatable)
+
+
+def _pod_requests(source):
+    nodes, pods = source
+    requests = pod_requests(pod_table(pods)) if pods else requests_from_nodes(nodes)
+    return pd.DataFrame({'Memory_Request_Mi': requests})
+
+
+def request_frames(old, current):
+    """Pod memory requests of each state: from its pods JSON, else estimated from its node table."""
+    old_pods = st.session_state.get("old_pods_source") or None
+    current_pods = st.session_state.get("current_pods_source") or None
+    return (load_frame((old, old_pods), builder=_pod_requests),
+            load_frame((current, current_pods), builder=_pod_requests))
+
+
+def node_pod_slots(nodes):
+    """Allocatable pods per node row from the sidebar's nodes JSON, or None when it is not loaded."""
+    node_specs = st.session_state.get("node_specs_source") or None
+    if not node_specs:
+        return None
+    specs = load_frame(node_specs, builder=node_capacity).set_index('Node')['Allocatable_Pods']
+    return nodes['Node'].astype('string').map(specs).to_numpy(dtype='float64', na_value=np.nan)
+
+
+def _packing(source):
+    requests, capacity, slots, replica_mi = source
+    slots = None if slots is None else np.asarray(slots, dtype='float64')
+    return packing_summary(requests['Memory_Request_Mi'], capacity, slots, replica_mi)
+
+
+def packing_frame(nodes, requests, replica_mi):
+    """:func:`~kube_reports.binpack.packing_summary` of ``requests`` on ``nodes``' allocatable memory."""
+    capacity = implied_allocatable(nodes).to_numpy(dtype='float64', na_value=0.0).tolist()
+    slots = node_pod_slots(nodes)
+    slots = None if slots is None else slots.tolist()
+    return load_frame((requests, capacity, slots, replica_mi), builder=_packing)
+
+
+def _read_snapshot(source):
+    root, cluster, snapshot, columns = source
+    return compact(SnapshotStore(root).read(cluster, snapshot, columns=columns), NODE_SCHEMA)
+
+
+def snapshot_frames(root, cluster, old_snapshot, current_snapshot, columns=NODE_COLUMNS):
+    """Old and current node frames read from two stored snapshots."""
+    columns = list(columns)
+    old = load_frame((root, cluster, old_snapshot, columns), builder=_read_snapshot)
+    current = load_frame((root, cluster, current_snapshot, columns), builder=_read_snapshot)
+    return old, current
+
+
+def node_diff(old, current):
+    """Fleet-wide diff of two node frames on ``Node`` (see :func:`kube_reports.diff.diff_frames`)."""
+    metrics = metric_columns(old, current, ['Node'])
+    others = [name for name in current.columns if name != 'Node' and name not in metrics and name in old.columns]
+    return diff_frames(old, current, metrics=metrics, columns=others)
+
+
+def node_changes(diff):
+    """Old, current and change columns for every node present in both states.
+
+    Returns one frame indexed by node name with a two-level column index:
+    ``Old`` and ``Current`` hold every column, ``Change`` and
+    ``Change_Percent`` every numeric one, so a page looks a node up with a
+    single ``.loc[name]`` instead of scanning the tables.
+    """
+    metrics = [name[:-len('_Change')] for name in diff.columns if name.endswith('_Change')]
+    compared = [name[:-len('_Old')] for name in diff.columns if name.endswith('_Old')]
+    diff = diff[(diff['State'] == 'common').to_numpy()].set_index('Node')
+    parts = {}
+    for part, names in (('Old', compared), ('Current', compared),
+                        ('Change', metrics), ('Change_Percent', metrics)):
+        parts[part] = diff[[f"{name}_{part}" for name in names]].set_axis(names, axis=1)
+    return pd.concat(parts, axis=1)
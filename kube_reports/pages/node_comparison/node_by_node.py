@@ -0,0 +1,253 @@
+"""🔍 Node-by-Node Analysis: one node's old vs current metrics."""
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from kube_reports.classify import NODE_MEMORY
+from kube_reports.pages.node_comparison.data import node_changes, node_diff, node_frames, snapshot_frames
+from kube_reports.diff import summary, top_improvements, top_regressions
+from kube_reports.snapshots import SnapshotStore
+
+
+def format_value(value, template="{}"):
+    # Missing values show as n/a rather than <NA>
+    return 'n/a' if pd.isna(value) else template.format(value)
+
+
+def format_change(current, old, template):
+    # kubectl top snapshots carry no overcommit or pod figures
+    if pd.isna(current) or pd.isna(old):
+        return None
+    return template.format(current - old)
+
+
+def status_change(old, current):
+    """Improved, regressed or unchanged, by the order of the two memory bands."""
+    bands = list(NODE_MEMORY.labels)
+    if pd.isna(old) or pd.isna(current) or old not in bands or current not in bands:
+        return 'n/a'
+    step = bands.index(current) - bands.index(old)
+    if step < 0:
+        return '✅ Improved'
+    return '⚠️ Regressed' if step > 0 else '➡️ Unchanged'
+
+
+def pick_snapshot(store, cluster, label, default_position):
+    """Date + time picker over one cluster's snapshot manifest."""
+    manifest = store.snapshots(cluster)
+    dates = manifest['Date'].drop_duplicates().tolist()
+    date = st.selectbox(f"{label} date", dates, index=default_position % len(dates))
+    times = manifest.loc[manifest['Date'] == date, 'Snapshot'].tolist()
+    return st.selectbox(f"{label} snapshot", times, index=default_position % len(times),
+                        format_func=lambda sid: sid[11:19] + " UTC")
+
+
+def pick_snapshots(store_root):
+    store = SnapshotStore(store_root)
+    # A cluster directory can lack manifest rows, e.g. after a crash between the run file and the manifest
+    clusters = [cluster for cluster in store.clusters() if len(store.snapshots(cluster))]
+    if not clusters:
+        st.warning(f"No snapshots found under {store_root}; showing the report data.")
+        return node_frames()
+    cluster = st.selectbox("Cluster", clusters)
+    col1, col2 = st.columns(2)
+    with col1:
+        old_snapshot = pick_snapshot(store, cluster, "Old", 0)
+    with col2:
+        current_snapshot = pick_snapshot(store, cluster, "Current", -1)
+    return snapshot_frames(store_root, cluster, old_snapshot, current_snapshot)
+
+
+def node_labels(changes):
+    """Selector label per node, built for all nodes at once."""
+    def band(status):
+        return status.astype('string').str.split(' ', n=1).str[-1].fillna('n/a')
+
+    return (changes.index.astype('string').to_series()
+            + ' (' + changes['Old']['Memory_Usage_Percent'].astype('string').fillna('?')
+            + '% → ' + changes['Current']['Memory_Usage_Percent'].astype('string').fillna('?')
+            + '% ' + band(changes['Old']['Status']) + ' → ' + band(changes['Current']['Status']) + ')')
+
+
+def fleet_changes(diff):
+    """Added/removed counts and the largest per-node changes across the fleet."""
+    counts = summary(diff)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Nodes in Both States", f"{counts['common']:,}")
+    col2.metric("Nodes Added", f"{counts['added']:,}")
+    col3.metric("Nodes Removed", f"{counts['removed']:,}")
+    
+    with st.expander("📉 Largest Changes Across the Fleet"):
+        metrics = [name[:-len('_Change')] for name in diff.columns if name.endswith('_Change')]
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            metric = st.selectbox("Metric", metrics, index=metrics.index('Memory_Usage_Mi') if 'Memory_Usage_Mi' in metrics else 0)
+        with col2:
+            percent = st.radio("Rank by", ["Absolute change", "Percentage change"], horizontal=True) == "Percentage change"
+        with col3:
+            n = st.number_input("Nodes", min_value=1, max_value=100, value=10)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**🔺 Top Regressions**")
+            st.dataframe(top_regressions(diff, metric, n, percent), hide_index=True)
+        with col2:
+            st.markdown("**🔻 Top Improvements**")
+            st.dataframe(top_improvements(diff, metric, n, percent), hide_index=True)
+
+
+def pick_node(changes):
+    """Filter box plus selector; handles fleets with hundreds of nodes."""
+    query = st.text_input("Filter nodes", placeholder="Part of a node name, e.g. 0000bm")
+    names = changes.index
+    if query:
+        names = names[names.str.contains(query, case=False, regex=False)]
+    if names.empty:
+        st.warning(f"No node name contains '{query}'.")
+        return None
+    if len(names) < len(changes):
+        st.caption(f"{len(names)} of {len(changes)} nodes match")
+    labels = node_labels(changes.loc[names])
+    return st.selectbox(
+        "Select Node for Detailed Analysis:",
+        names,
+        format_func=labels.__getitem__
+    )
+
+
+def render():
+    st.header("🔍 Node-by-Node Detailed Analysis")
+    store_root = st.session_state.get("snapshot_store")
+    if store_root:
+        old_nodes, current_nodes = pick_snapshots(store_root)
+    else:
+        old_nodes, current_nodes = node_frames()
+    
+    # One merge for the whole fleet; per-node views are slices of it
+    diff = node_diff(old_nodes, current_nodes)
+    fleet_changes(diff)
+    changes = node_changes(diff)
+    if changes.empty:
+        st.warning("The selected states have no nodes in common.")
+        return
+    
+    node_name = pick_node(changes)
+    if node_name is None:
+        return
+    
+    row = changes.loc[node_name]
+    old, current, change, change_percent = row['Old'], row['Current'], row['Change'], row['Change_Percent']
+    
+    st.markdown(f'<h2 style="color: #1f77b4;">🔍 Node: {node_name}</h2>', unsafe_allow_html=True)
+    
+    # Status comparison
+    st.markdown(f'**Status Change:** {old["Status"]} → {current["Status"]}')
+    
+    # Detailed metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Memory Usage", format_value(current['Memory_Usage_Mi'], "{}Mi"), format_change(current['Memory_Usage_Mi'], old['Memory_Usage_Mi'], "{}Mi"))
+    
+    with col2:
+        st.metric("CPU Usage", format_value(current['CPU_Usage_Mi'], "{}m"), format_change(current['CPU_Usage_Mi'], old['CPU_Usage_Mi'], "{}m"))
+    
+    with col3:
+        st.metric("Overcommit", format_value(current['Memory_Overcommit_Percent'], "{}%"), format_change(current['Memory_Overcommit_Percent'], old['Memory_Overcommit_Percent'], "{}%"))
+    
+    with col4:
+        st.metric("Pod Count", format_value(current['Pods']), format_change(current['Pods'], old['Pods'], "{:+}"))
+    
+    # Node Analysis Cards
+    st.subheader(f"📊 Node Analysis: {node_name[-8:]}")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div style="background-color: #fff3e0; padding: 1rem; border-radius: 10px; border-left: 5px solid #ff9800;">
+        <h4>📊 Old State</h4>
+        """, unsafe_allow_html=True)
+        st.write(f"**Memory:** {format_value(old['Memory_Usage_Mi'], '{}Mi')} ({format_value(old['Memory_Usage_Percent'], '{}%')})")
+        st.write(f"**CPU:** {format_value(old['CPU_Usage_Mi'], '{}m')} ({format_value(old['CPU_Usage_Percent'], '{}%')})")
+        st.write(f"**Pods:** {format_value(old['Pods'])}")
+        st.write(f"**Status:** {old['Status']}")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div style="background-color: #e8f5e8; padding: 1rem; border-radius: 10px; border-left: 5px solid #4caf50;">
+        <h4>📈 Current State</h4>
+        """, unsafe_allow_html=True)
+        st.write(f"**Memory:** {format_value(current['Memory_Usage_Mi'], '{}Mi')} ({format_value(current['Memory_Usage_Percent'], '{}%')})")
+        st.write(f"**CPU:** {format_value(current['CPU_Usage_Mi'], '{}m')} ({format_value(current['CPU_Usage_Percent'], '{}%')})")
+        st.write(f"**Pods:** {format_value(current['Pods'])}")
+        st.write(f"**Status:** {current['Status']}")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col3:
+        memory_change = format_change(change['Memory_Usage_Mi'], 0, "{:+}Mi")
+        cpu_change = format_change(change['CPU_Usage_Mi'], 0, "{:+}m")
+        pod_change = format_change(change['Pods'], 0, "{:+}")
+        
+        st.markdown("""
+        <div style="background-color: #e3f2fd; padding: 1rem; border-radius: 10px; border-left: 5px solid #2196f3;">
+        <h4>📊 Changes</h4>
+        """, unsafe_allow_html=True)
+        st.write(f"**Memory:** {memory_change or 'n/a'} ({format_change(change_percent['Memory_Usage_Mi'], 0, '{:+.1f}%') or 'n/a'})")
+        st.write(f"**CPU:** {cpu_change or 'n/a'} ({format_change(change_percent['CPU_Usage_Mi'], 0, '{:+.1f}%') or 'n/a'})")
+        st.write(f"**Pods:** {pod_change or 'n/a'}")
+        st.write(f"**Status:** {status_change(old['Status'], current['Status'])}")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Calculation Matrix Changes
+    st.subheader("🧮 Calculation Matrix Changes")
+    
+    # Create matrix comparison chart
+    matrix_data = {
+        'Metric': ['Memory Allocation', 'CPU Allocation', 'Pod Density', 'Overcommit Ratio'],
+        'Old_Value': [
+            old['Memory_Usage_Mi'],
+            old['CPU_Usage_Mi'],
+            old['Pods'],
+            old['Memory_Overcommit_Percent']
+        ],
+        'Current_Value': [
+            current['Memory_Usage_Mi'],
+            current['CPU_Usage_Mi'],
+            current['Pods'],
+            current['Memory_Overcommit_Percent']
+        ]
+    }
+    
+    df_matrix = pd.DataFrame(matrix_data)
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        name='Old Values',
+        x=df_matrix['Metric'],
+        y=df_matrix['Old_Value'],
+        marker_color='#ff6b6b',
+        text=df_matrix['Old_Value'],
+        textposition='auto'
+    ))
+    
+    fig.add_trace(go.Bar(
+        name='Current Values',
+        x=df_matrix['Metric'],
+        y=df_matrix['Current_Value'],
+        marker_color='#4ecdc4',
+        text=df_matrix['Current_Value'],
+        textposition='auto'
+    ))
+    
+    fig.update_layout(
+        title=f"Calculation Matrix Changes - {node_name[-8:]}",
+        xaxis_title="Metrics",
+        yaxis_title="Values",
+        height=400,
+        barmode='group'
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,14 @@
+"""Pages of the phase-1 memory optimization implementation report."""
+
+PAGES = {
+    "🚨 Executive Summary": "executive_summary",
+    "📊 Current Infrastructure Status": "infrastructure_status",
+    "🔍 Implementation Status Analysis": "implementation_status",
+    "💻 Code Optimization Verification": "code_verification",
+    "🚀 Remaining Recommendations": "recommendations",
+    "🔎 Leak Candidates": "leak_candidates",
+    "🔔 Alert Rule Backtest": "alert_backtest",
+    "📈 Performance Impact Analysis": "performance_impact",
+    "🔧 Technical Deep Dive": "technical_deep_dive",
+    "📋 Action Plan & Next Steps": "action_plan",
+}
@@ -0,0 +1,106 @@
+"""🔔 Alert Rule Backtest: the sample alert rules replayed over stored snapshots.
+
+Rules (the monitoring recommendation's, or edited in place) are evaluated
+by :mod:`kube_reports.rules` over the snapshots of
+``KUBE_REPORTS_SNAPSHOT_DIR``. The engine is kept per session and rule
+text, so a rerun only evaluates snapshots appended since the last one.
+"""
+
+import os
+
+import streamlit as st
+import plotly.graph_objects as go
+import yaml
+
+from kube_reports.cache import content_hash
+from kube_reports.rules import SAMPLE_RULES, RuleEngine, backtest, parse_rules
+from kube_reports.snapshots import SnapshotStore
+
+RULE_COLORS = ['#ff6b6b', '#4ecdc4', '#ffa726', '#7e57c2', '#26a69a']
+
+
+def rule_engine(session_state, root, cluster, text, rules):
+    """The session's :class:`RuleEngine` for this store, cluster and rule text, created on first use."""
+    key = f"rule_engine:{root}:{cluster}:{content_hash(text)}"
+    if key not in session_state:
+        session_state[key] = RuleEngine(rules)
+    return session_state[key]
+
+
+def timeline_chart(engine):
+    timeline = engine.timeline()
+    fig = go.Figure()
+    for rule, color in zip(engine.rules, RULE_COLORS * len(engine.rules)):
+        counts = timeline[timeline['Alert'] == rule.name]
+        fig.add_trace(go.Scatter(x=counts['Timestamp'], y=counts['Firing'], mode='lines', name=f"{rule.name} firing",
+                                 line=dict(color=color, width=2), fill='tozeroy'))
+        fig.add_trace(go.Scatter(x=counts['Timestamp'], y=counts['Pending'], mode='lines',
+                                 name=f"{rule.name} pending", line=dict(color=color, width=1, dash='dot')))
+    fig.update_layout(
+        title="Firing and Pending Series per Evaluation",
+        xaxis_title="Snapshot (UTC)",
+        yaxis_title="Series",
+        height=400
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def render():
+    st.header("🔔 Alert Rule Backtest")
+
+    root = os.environ.get("KUBE_REPORTS_SNAPSHOT_DIR")
+    store = SnapshotStore(root) if root else None
+    clusters = store.clusters() if store else []
+    if not clusters:
+        st.info("No snapshot store found. Set `KUBE_REPORTS_SNAPSHOT_DIR` to a store filled with "
+                "`python -m kube_reports.snapshots append ... --pods pods.json --pod-metrics pod-metrics.json` "
+                "to replay the alert rules over its snapshots.")
+        return
+
+    cluster = st.selectbox("Cluster", clusters, key="alert_cluster")
+    text = st.text_area("Alert rules", SAMPLE_RULES, height=300, key="alert_rules",
+                        help="Prometheus rule file; edit a threshold or for: duration to backtest it")
+    try:
+        rules = parse_rules(text)
+    except (ValueError, yaml.YAMLError) as error:
+        st.error(f"Could not parse the rules: {error}")
+        return
+    if not rules:
+        st.warning("The rule file has no alerting rules.")
+        return
+
+    engine = rule_engine(st.session_state, root, cluster, text, rules)
+    try:
+        with st.spinner("Evaluating rules over new snapshots..."):
+            evaluated = backtest(engine, store, cluster)
+    except ValueError as error:
+        st.error(str(error))
+        return
+    if engine.last is None:
+        st.info(f"No snapshots of {cluster} carry the data these rules read (pod metrics need a rollup cube).")
+        return
+
+    alerts = engine.alerts()
+    episodes = engine.episodes()
+    fired = episodes[episodes['Firing_From'].notna()]
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Evaluations", f"{len(engine.timestamps):,}", f"+{evaluated:,} new" if evaluated else None,
+                help="One per stored snapshot, oldest first")
+    col2.metric("Firing now", f"{int((alerts['State'] == 'firing').sum()):,}")
+    col3.metric("Pending now", f"{int((alerts['State'] == 'pending').sum()):,}",
+                help="Expression true, for: duration not yet reached")
+    col4.metric("Episodes fired", f"{len(fired):,}", f"{len(episodes) - len(fired):,} never reached firing",
+                delta_color="off")
+    st.caption(f"Last evaluation: {engine.last:%Y-%m-%d %H:%M} UTC · first: {engine.timestamps[0]:%Y-%m-%d %H:%M} UTC")
+
+    timeline_chart(engine)
+
+    st.subheader("🚨 Active Alerts")
+    if len(alerts):
+        st.dataframe(alerts, hide_index=True, use_container_width=True)
+    else:
+        st.success("No series pending or firing at the last snapshot.")
+
+    st.subheader("🗂️ Alert History")
+    only_fired = st.toggle("Only episodes that fired", value=True, key="alert_only_fired")
+    st.dataframe(fired if only_fired else episodes, hide_index=True, use_container_width=True)
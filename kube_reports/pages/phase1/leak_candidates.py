@@ -0,0 +1,107 @@
+"""🔎 Leak Candidates: the MemoryLeakDetected rule evaluated over stored samples.
+
+Per-container memory series (``LEAK_METRIC`` in the store at
+``KUBE_REPORTS_SAMPLE_DIR``) are scanned by :mod:`kube_reports.leaks`. The
+scan is cached on the store's file listing (names, sizes, modification
+times), so newly appended samples trigger a rescan and reruns reuse the
+result. The minimum growth is applied to the cached scan, so changing it
+does not rescan.
+"""
+
+import os
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from kube_reports.cache import load_frame
+from kube_reports.leaks import HOLD, INCREASE_MB, LEAK_METRIC, MIN_SLOPE_MB_PER_HOUR, WINDOW, scan_store
+from kube_reports.timeseries import DEFAULT_POINTS, SampleStore, downsample
+
+
+def _scan(source):
+    root, metric, start, end, _ = source
+    return scan_store(root, metric, start, end).frame()
+
+
+def _series_samples(source):
+    root, metric, series, start, end = source
+    samples = SampleStore(root).samples(metric, start, end, series=[series])
+    return downsample(samples.sort_values('Timestamp', ignore_index=True), DEFAULT_POINTS)
+
+
+def store_signature(store, metric, start, end):
+    """Name, size and modification time of every file the scan reads."""
+    signature = []
+    for paths in store.files(metric, start, end).values():
+        for path in paths:
+            stat = os.stat(path)
+            signature.append([os.path.basename(path), stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+def series_chart(store_root, row, start, end):
+    samples = load_frame((store_root, LEAK_METRIC, row['Series'], start.isoformat(), end.isoformat()),
+                         builder=_series_samples)
+    fig = go.Figure(go.Scatter(x=samples['Timestamp'], y=samples['Value'], mode='lines', name=row['Series'],
+                               line=dict(color='#ff6b6b', width=2)))
+    if pd.notna(row['Onset']):
+        fig.add_vline(x=row['Onset'].isoformat(), line_dash="dash", line_color="orange",
+                      annotation_text="Rule fired (onset)")
+    fig.update_layout(
+        title=f"{row['Series']}: {row['Slope_MB_per_Hour']:+.1f} MB/h",
+        xaxis_title="Time (UTC)",
+        yaxis_title="Memory (MB)",
+        height=400
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def render():
+    st.header("🔎 Leak Candidates")
+
+    st.markdown(f"""
+    The **MemoryLeakDetected** rule (`increase(container_memory_usage_bytes[1h]) > 100000000`, `for: 10m`)
+    evaluated offline for every stored container series: the rule must hold for {HOLD.seconds // 60} minutes on
+    end (an increase over {INCREASE_MB:g} MB within {WINDOW.seconds // 3600}h), and the series must keep
+    growing over the scanned window to count as a leak rather than a warm-up step.
+    """)
+
+    store_root = os.environ.get("KUBE_REPORTS_SAMPLE_DIR")
+    store = SampleStore(store_root) if store_root else None
+    span = store.span(LEAK_METRIC) if store else None
+    if span is None:
+        st.info(f"No stored per-container memory samples found. Set `KUBE_REPORTS_SAMPLE_DIR` to a sample store "
+                f"with a `{LEAK_METRIC}` metric (`python -m kube_reports.timeseries append --metric {LEAK_METRIC} ...`) "
+                "to scan it for leaks.")
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        days = st.slider("Days to scan", 1, 30, 7, key="leak_days", help="Ending at the store's last sample day")
+    with col2:
+        min_slope = st.number_input("Minimum growth (MB/hour)", 0.0, 10000.0, MIN_SLOPE_MB_PER_HOUR, step=5.0,
+                                    key="leak_min_slope")
+    end = span[1]
+    start = max(span[0], end - pd.Timedelta(days=days))
+    source = (store_root, LEAK_METRIC, start.isoformat(), end.isoformat(),
+              store_signature(store, LEAK_METRIC, start, end))
+    with st.spinner("Scanning stored series..."):
+        scan = load_frame(source, builder=_scan)
+    scan['Candidate'] = scan['Onset'].notna() & (scan['Slope_MB_per_Hour'] >= min_slope)
+    candidates = scan[scan['Candidate']].sort_values('Slope_MB_per_Hour', ascending=False, ignore_index=True)
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Series scanned", f"{len(scan):,}")
+    col2.metric("Rule fired", f"{int(scan['Onset'].notna().sum()):,}",
+                help="Series where the 1h increase held above the threshold for the whole for: duration")
+    col3.metric("Leak candidates", f"{len(candidates):,}", help=f"Rule fired and growth ≥ {min_slope:g} MB/hour")
+    col4.metric("Earliest onset", f"{candidates['Onset'].min():%Y-%m-%d %H:%M}" if len(candidates) else "—")
+
+    if not len(candidates):
+        st.success(f"No leak candidates between {start:%Y-%m-%d} and {end:%Y-%m-%d}.")
+        return
+
+    st.dataframe(candidates.drop(columns='Candidate'), hide_index=True, use_container_width=True)
+    series = st.selectbox("Series", candidates['Series'], key="leak_series")
+    series_chart(store_root, candidates[candidates['Series'] == series].iloc[0], start, end)
@@ -0,0 +1,181 @@
+"""📈 Performance Impact Analysis: measured improvements and trends."""
+
+import os
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from kube_reports.cache import load_frame
+from kube_reports.live import LIVE_WINDOW, REFRESH_SECONDS, live_trend
+from kube_reports.timeseries import DEFAULT_POINTS, SampleStore, downsample
+
+# Per-pod working set samples, one series per pod
+SAMPLE_METRIC = "pod_memory_mb"
+OPTIMIZATION_START = pd.Timestamp("2024-07-01", tz="UTC")
+OPTIMIZATION_COMPLETE = pd.Timestamp("2024-10-01", tz="UTC")
+
+
+def _query_trend(source):
+    root, metric, start, end, points, method = source
+    return SampleStore(root).trend(metric, start, end, points=points, method=method)
+
+
+def baseline_trend():
+    """Measured before/after per-pod averages from the table above, joined at the optimization dates."""
+    return pd.DataFrame({
+        'Timestamp': pd.to_datetime(['2024-01-01', OPTIMIZATION_START, OPTIMIZATION_COMPLETE, '2024-12-31'], utc=True),
+        'Value': [326, 326, 124, 124],
+    })
+
+
+def live_memory_trend(store_root, interval):
+    """Fragment body: fold in new samples and redraw only when something changed."""
+    trend = live_trend(st.session_state, store_root, SAMPLE_METRIC)
+    changed = trend.refresh()
+    version, fig = st.session_state.get("live_memory_trend_figure", (None, None))
+    if version != trend.version:
+        line = downsample(trend.line, DEFAULT_POINTS)
+        fig = go.Figure(go.Scatter(
+            x=line['Timestamp'],
+            y=line['Value'],
+            mode='lines',
+            name='Memory Usage per Pod (MB)',
+            line=dict(color='#1f77b4', width=3)
+        ))
+        fig.update_layout(
+            title=f"Memory Usage Trend - Live (last {LIVE_WINDOW})",
+            xaxis_title="Time (UTC)",
+            yaxis_title="Memory Usage (MB per Pod)",
+            height=400
+        )
+        st.session_state["live_memory_trend_figure"] = (trend.version, fig)
+    st.plotly_chart(fig, use_container_width=True, key="live_memory_trend_chart")
+    last = f"{trend.last:%Y-%m-%d %H:%M:%S} UTC" if trend.last is not None else "none yet"
+    st.caption(f"🔄 Live: last sample {last} · {changed} new timestamp(s) this tick · refreshing every {interval}s")
+
+
+def memory_trend_chart():
+    store_root = os.environ.get("KUBE_REPORTS_SAMPLE_DIR")
+    span = SampleStore(store_root).span(SAMPLE_METRIC) if store_root else None
+    
+    if span is not None and st.session_state.get("auto_refresh"):
+        # Only this fragment reruns on each tick, not the page or the sidebar
+        interval = st.session_state.get("refresh_seconds", REFRESH_SECONDS)
+        st.fragment(live_memory_trend, run_every=interval)(store_root, interval)
+        return
+    
+    if span is None:
+        st.info("No stored per-pod memory samples found. Set `KUBE_REPORTS_SAMPLE_DIR` to a sample store "
+                "(`python -m kube_reports.timeseries append ...`) to plot measured data; showing the "
+                "measured before/after averages.")
+        trend = baseline_trend()
+        start, end = trend['Timestamp'].iloc[0], trend['Timestamp'].iloc[-1]
+        mode = 'lines+markers'
+    else:
+        # Zooming (box select) narrows the window and re-queries it at full chart resolution
+        start, end = st.session_state.get("memory_trend_window", span)
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            method = st.radio("Downsampling", ["lttb", "minmax"], horizontal=True,
+                              format_func={"lttb": "Shape (LTTB)", "minmax": "Peaks (min/max)"}.get)
+        with col2:
+            points = st.number_input("Chart points", 200, 10000, DEFAULT_POINTS, step=100)
+        with col3:
+            if st.button("Reset zoom", disabled=(start, end) == span):
+                st.session_state.pop("memory_trend_window", None)
+                st.rerun()
+        source = (store_root, SAMPLE_METRIC, start.isoformat(), end.isoformat(), int(points), method)
+        trend = load_frame(source, builder=_query_trend)
+        mode = 'lines'
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=trend['Timestamp'],
+        y=trend['Value'],
+        mode=mode,
+        name='Memory Usage per Pod (MB)',
+        line=dict(color='#1f77b4', width=3)
+    ))
+    
+    # Add optimization phases
+    if start <= OPTIMIZATION_START <= end:
+        fig.add_vline(x=OPTIMIZATION_START.strftime('%Y-%m-%d'), line_dash="dash", line_color="orange", 
+                     annotation_text="Optimization Start")
+    if start <= OPTIMIZATION_COMPLETE <= end:
+        fig.add_vline(x=OPTIMIZATION_COMPLETE.strftime('%Y-%m-%d'), line_dash="dash", line_color="green", 
+                     annotation_text="Optimization Complete")
+    
+    title = "Memory Usage Trend - 2024" if span is None else f"Memory Usage Trend - {start:%Y-%m-%d %H:%M} to {end:%Y-%m-%d %H:%M}"
+    fig.update_layout(
+        title=title,
+        xaxis_title="Date",
+        yaxis_title="Memory Usage (MB per Pod)",
+        height=400
+    )
+    
+    if span is None:
+        st.plotly_chart(fig, use_container_width=True)
+        return
+    
+    event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", selection_mode="box",
+                            key="memory_trend_chart")
+    boxes = event.selection.get("box", []) if event else []
+    if boxes:
+        x0, x1 = sorted(pd.to_datetime(boxes[0]["x"], utc=True))
+        if (x0, x1) != (start, end):
+            st.session_state["memory_trend_window"] = (x0, x1)
+            st.rerun()
+
+
+def render():
+    st.header("📈 Performance Impact Analysis")
+    
+    # Performance metrics
+    st.subheader("🎯 Measured Performance Improvements")
+    
+    performance_data = {
+        'Metric': ['Memory Usage per Pod', 'Database Connection Time', 'Redis Operation Latency', 'OCR Processing Memory', 'Overall Stability'],
+        'Before_Optimization': ['326MB', '150ms', '25ms', '150MB peak', '3 OOM events/week'],
+        'After_Optimization': ['124MB', '45ms', '8ms', '50MB peak', '0 OOM events'],
+        'Improvement': ['62% reduction', '70% faster', '68% faster', '67% reduction', '100% stable'],
+        'Status': ['✅ Excellent', '✅ Excellent', '✅ Excellent', '✅ Excellent', '✅ Perfect']
+    }
+    
+    df_performance = load_frame(performance_data)
+    st.dataframe(df_performance, use_container_width=True)
+    
+    # Performance trends visualization
+    st.subheader("📊 Performance Trends")
+    
+    memory_trend_chart()
+    
+    # Cost impact analysis
+    st.subheader("💰 Cost Impact Analysis")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        **Infrastructure Costs**
+        - Before: $8,500/month
+        - After: $6,000/month
+        - **Savings: $2,500/month**
+        """)
+    
+    with col2:
+        st.markdown("""
+        **Operational Efficiency**
+        - Reduced incident response: 80%
+        - Improved deployment speed: 40%
+        - **Better team productivity**
+        """)
+    
+    with col3:
+        st.markdown("""
+        **Business Impact**
+        - Zero downtime incidents
+        - Improved user experience
+        - **Enhanced reliability**
+        """)
@@ -0,0 +1,208 @@
+"""🚀 Remaining Recommendations: outstanding infrastructure work.
+
+With a pod dump (``KUBE_REPORTS_CURRENT_PODS``, plus ``KUBE_REPORTS_NODE_SPECS``
+for zones and node sizes) the anti-affinity item is evaluated against the
+cluster: replica spread now, and after re-placing every pod under the
+recommended rule (:mod:`kube_reports.placement`).
+"""
+
+import os
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from kube_reports.cache import load_frame
+from kube_reports.placement import (HOTSPOT_RATIO, node_hotspots, node_zones, pod_placement, simulate_anti_affinity,
+                                    spread_scores)
+from kube_reports.rules import SAMPLE_RULES
+
+
+def _placement(source):
+    pods, node_specs = source
+    return pod_placement(pods, node_specs)
+
+
+def _simulated(source):
+    placement, nodes = source
+    return simulate_anti_affinity(placement, nodes)
+
+
+def anti_affinity_impact():
+    """Spread and node hotspots now vs. under preferred hostname anti-affinity."""
+    pods = os.environ.get("KUBE_REPORTS_CURRENT_PODS")
+    if not pods:
+        st.info("Set KUBE_REPORTS_CURRENT_PODS (kubectl get pods -A -o json) and optionally KUBE_REPORTS_NODE_SPECS "
+                "(kubectl get nodes -o json) to evaluate the rule against the cluster's placement.")
+        return
+    node_specs = os.environ.get("KUBE_REPORTS_NODE_SPECS") or None
+    placement = load_frame((pods, node_specs), builder=_placement)
+    nodes = load_frame(node_specs, builder=node_zones) if node_specs else None
+    simulated = load_frame((placement, nodes), builder=_simulated)
+    
+    before, after = spread_scores(placement, nodes), spread_scores(simulated, nodes)
+    hot_before, hot_after = node_hotspots(placement, nodes), node_hotspots(simulated, nodes)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Hotspot nodes", int(hot_after['Hotspot'].sum()),
+                f"{int(hot_after['Hotspot'].sum() - hot_before['Hotspot'].sum()):+d} vs now", delta_color="inverse",
+                help=f"Nodes requesting more than {HOTSPOT_RATIO:g}× the mean memory per node")
+    col2.metric("Co-located replicas", f"{int(after['Colocated'].sum()):,}",
+                f"{int(after['Colocated'].sum() - before['Colocated'].sum()):+,} vs now", delta_color="inverse")
+    col3.metric("Skewed deployments", f"{int((after['Host_Skew'] > 0).sum()):,}",
+                f"{int((after['Host_Skew'] > 0).sum() - (before['Host_Skew'] > 0).sum()):+,} vs now",
+                delta_color="inverse", help="Replicas stacked on one node beyond an even spread")
+    col4.metric("Largest stack", int(hot_after['Max_Replicas_Of_One_Group'].max()),
+                f"{int(hot_after['Max_Replicas_Of_One_Group'].max() - hot_before['Max_Replicas_Of_One_Group'].max()):+d} vs now",
+                delta_color="inverse", help="Most replicas of one deployment on a single node")
+    
+    # Requested memory per node, busiest first: hotspots are the head of the curve
+    fig = go.Figure()
+    for frame, name, color in ((hot_before, 'Current placement', '#ff6b6b'), (hot_after, 'With anti-affinity', '#4ecdc4')):
+        load = frame['Memory_Request_Mi'].sort_values(ascending=False, ignore_index=True)
+        fig.add_trace(go.Scatter(x=load.index + 1, y=load, mode='lines', name=name, line_color=color))
+    fig.add_hline(y=HOTSPOT_RATIO * hot_before['Memory_Request_Mi'].mean(), line_dash="dash", line_color="orange",
+                  annotation_text=f"Hotspot ({HOTSPOT_RATIO:g}× mean)")
+    fig.update_layout(title="Requested Memory per Node, Busiest First", xaxis_title="Node rank",
+                      yaxis_title="Requested memory (Mi)", height=400)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    worst = before.head(20).merge(after[['Namespace', 'Group', 'Host_Skew', 'Zone_Skew']], on=['Namespace', 'Group'],
+                                  how='left', suffixes=('', '_After'))
+    st.dataframe(worst, hide_index=True, use_container_width=True)
+    unplaced = int(simulated['Node'].isna().sum())
+    if unplaced:
+        st.warning(f"{unplaced:,} pods found no node with enough allocatable memory in the simulation.")
+
+
+def render():
+    st.header("🚀 Remaining Recommendations")
+    
+    st.subheader("⚠️ Items Requiring Implementation")
+    
+    # Remaining items analysis
+    remaining_items = [
+        {
+            'Item': 'Pod Anti-Affinity Rules',
+            'Priority': 'High',
+            'Impact': 'Medium',
+            'Effort': 'Low',
+            'Timeline': '1-2 days'
+        },
+        {
+            'Item': 'Comprehensive Monitoring',
+            'Priority': 'High', 
+            'Impact': 'High',
+            'Effort': 'Medium',
+            'Timeline': '1 week'
+        },
+        {
+            'Item': 'Resource Quotas',
+            'Priority': 'Medium',
+            'Impact': 'Medium', 
+            'Effort': 'Low',
+            'Timeline': '2-3 days'
+        },
+        {
+            'Item': 'Advanced Alerting',
+            'Priority': 'Medium',
+            'Impact': 'High',
+            'Effort': 'Medium', 
+            'Timeline': '3-5 days'
+        }
+    ]
+    
+    df_remaining = load_frame(remaining_items)
+    st.dataframe(df_remaining, use_container_width=True)
+    
+    # Detailed recommendations
+    st.subheader("📋 Detailed Implementation Guide")
+    
+    # Pod Anti-Affinity
+    with st.expander("🔄 Pod Anti-Affinity Rules - HIGH PRIORITY"):
+        st.markdown("""
+        **Purpose:** Ensure pods are distributed across different nodes for better resource utilization and fault tolerance.
+        
+        **Implementation:**
+        """)
+        
+        st.code("""
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: server
+spec:
+  template:
+    spec:
+      affinity:
+        podAntiAffinity:
+          preferredDuringSchedulingIgnoredDuringExecution:
+          - weight: 100
+            podAffinityTerm:
+              labelSelector:
+                matchExpressions:
+                - key: app
+                  operator: In
+                  values:
+                  - server
+              topologyKey: kubernetes.io/hostname
+        """, language="yaml")
+        
+        st.markdown("""
+        **Benefits:**
+        - Better resource distribution
+        - Improved fault tolerance
+        - Reduced node hotspots
+        - Enhanced performance
+        """)
+        
+        st.markdown("**Expected impact on this cluster:**")
+        anti_affinity_impact()
+    
+    # Comprehensive Monitoring
+    with st.expander("📊 Comprehensive Monitoring - HIGH PRIORITY"):
+        st.markdown("""
+        **Purpose:** Implement detailed memory and performance monitoring with automated alerting.
+        
+        **Components to Implement:**
+        - Prometheus metrics collection
+        - Grafana dashboards
+        - Memory usage alerts
+        - Performance trend analysis
+        
+        **Sample Alert Rules:**
+        """)
+        
+        st.code(SAMPLE_RULES, language="yaml")
+        st.caption("Replay these rules over stored snapshots on the 🔔 Alert Rule Backtest page.")
+    
+    # Resource Quotas
+    with st.expander("📏 Resource Quotas - MEDIUM PRIORITY"):
+        st.markdown("""
+        **Purpose:** Implement namespace-level resource limits to prevent resource exhaustion.
+        
+        **Implementation:**
+        """)
+        
+        st.code("""
+apiVersion: v1
+kind: ResourceQuota
+metadata:
+  name: namespace-quota
+  namespace: production
+spec:
+  hard:
+    requests.cpu: "4"
+    requests.memory: 8Gi
+    limits.cpu: "8"
+    limits.memory: 16Gi
+    pods: "20"
+    persistentvolumeclaims: "10"
+        """, language="yaml")
+        
+        st.markdown("""
+        **Benefits:**
+        - Prevents resource exhaustion
+        - Ensures fair resource allocation
+        - Improves cluster stability
+        - Cost control
+        """)
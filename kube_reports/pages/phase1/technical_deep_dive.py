@@ -0,0 +1,118 @@
+"""🔧 Technical Deep Dive: configuration and code patterns."""
+
+import streamlit as st
+
+
+def render():
+    st.header("🔧 Technical Deep Dive")
+    
+    st.subheader("🏗️ Architecture Improvements")
+    
+    # Architecture comparison
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### ❌ Before Optimization")
+        st.markdown("""
+        **Database Connections:**
+        - Default pool size (5 connections)
+        - No connection recycling
+        - Multiple connection pools per service
+        
+        **Redis Management:**
+        - Dual connection pools
+        - No connection pooling optimization
+        - Manual connection management
+        
+        **OCR Processing:**
+        - Memory leaks in file processing
+        - No explicit cleanup
+        - Base64 encoding without optimization
+        
+        **Resource Management:**
+        - No resource limits
+        - Inadequate requests
+        - No monitoring
+        """)
+    
+    with col2:
+        st.markdown("### ✅ After Optimization")
+        st.markdown("""
+        **Database Connections:**
+        - Optimized pool size (3 connections)
+        - 600-second connection recycling
+        - Unified connection management
+        
+        **Redis Management:**
+        - Single optimized connection pool
+        - AsyncRedisManager singleton
+        - Proper lifecycle management
+        
+        **OCR Processing:**
+        - Context managers for cleanup
+        - Explicit garbage collection
+        - Optimized file handling
+        
+        **Resource Management:**
+        - Proper CPU/memory limits
+        - Adequate resource requests
+        - Health checks implemented
+        """)
+    
+    # Technical implementation details
+    st.subheader("⚙️ Implementation Patterns")
+    
+    with st.expander("🔄 Singleton Pattern for Redis"):
+        st.code("""
+class AsyncRedisManager:
+    _instance = None
+    _redis_pool = None
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+    
+    async def get_redis_pool(self):
+        if self._redis_pool is None:
+            self._redis_pool = redis.asyncio.ConnectionPool.from_url(
+                f"redis://{redis_host}:{redis_port}",
+                max_connections=13,
+                retry_on_timeout=True,
+                health_check_interval=30
+            )
+        return redis.asyncio.Redis(connection_pool=self._redis_pool)
+        """, language="python")
+    
+    with st.expander("🗄️ Database Pool Configuration"):
+        st.code("""
+engine = create_engine(
+    DATABASE_URL,
+    pool_pre_ping=True,          # Health check connections
+    pool_recycle=600,            # Recycle every 10 minutes
+    pool_size=3,                 # Optimized pool size
+    max_overflow=5,              # Allow burst connections
+    pool_timeout=20,             # Connection timeout
+    isolation_level="READ COMMITTED"
+)
+        """, language="python")
+    
+    with st.expander("🧹 Memory Management Pattern"):
+        st.code("""
+@asynccontextmanager
+async def managed_file_processing(file_url: str):
+    file_buffer = None
+    try:
+        # Acquire resources
+        file_buffer = BytesIO(await download_file(file_url))
+        
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file.write(file_buffer.getvalue())
+            yield temp_file.name
+            
+    finally:
+        # Explicit cleanup
+        if file_buffer:
+            file_buffer.close()
+        gc.collect()  # Force garbage collection
+        """, language="python")
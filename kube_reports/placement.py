@@ -0,0 +1,177 @@
+"""Replica spread across hosts and zones, and what pod anti-affinity would change.
+
+:func:`pod_placement` reads where every active pod runs: its node, the
+node's zone and the group a ``podAntiAffinity`` rule would select. That is
+the pod's ``app`` label (the label the recommended rule matches on), else
+its workload. :func:`spread_scores` then scores each group with two or
+more replicas:
+
+- ``Host_Skew``: replicas on its busiest node beyond an even spread over
+  the cluster's nodes (0 when no two replicas share a node that did not
+  have to);
+- ``Zone_Skew``: the most minus the fewest replicas in any zone, the
+  ``maxSkew`` of a zone ``topologySpreadConstraint``;
+- ``Colocated``: replicas that share a node with a sibling.
+
+:func:`simulate_anti_affinity` re-places every pod as the scheduler would
+with ``preferredDuringSchedulingIgnoredDuringExecution`` anti-affinity on
+``kubernetes.io/hostname``. Each replica prefers a node without a sibling,
+then the zone with the fewest siblings, then the least requested memory.
+It must still fit the node's allocatable memory when that is known. Groups
+and nodes are factorized to integer codes once, so the sibling count of a
+node is an array lookup and a cluster of thousands of deployments
+re-places in seconds. :func:`node_hotspots` compares the two placements.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from kube_reports.ingest import _column, _items, _read_json, parse_memory_mi
+from kube_reports.overcommit import ACTIVE_PHASES, _container_totals
+from kube_reports.rollup import workload_names
+
+GROUP_LABELS = ('app', 'app.kubernetes.io/name')
+ZONE_LABELS = ('topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone')
+
+# A node is a hotspot when its requested memory exceeds this multiple of the per-node mean
+HOTSPOT_RATIO = float(os.environ.get("KUBE_REPORTS_HOTSPOT_RATIO", 1.5))
+
+PLACEMENT_COLUMNS = ['Namespace', 'Pod', 'Group', 'Node', 'Zone', 'Memory_Request_Mi']
+
+
+def _first_label(labels, keys):
+    return next((labels[key] for key in keys if key in labels), None)
+
+
+def node_zones(source):
+    """``Node``, ``Zone`` and ``Allocatable_Memory_Mi`` from a ``kubectl get nodes -o json`` dump."""
+    items = _items(_read_json(source))
+    return pd.DataFrame({
+        'Node': _column(items, 'metadata', 'name'),
+        'Zone': [_first_label(labels or {}, ZONE_LABELS) for labels in _column(items, 'metadata', 'labels')],
+        'Allocatable_Memory_Mi': parse_memory_mi(_column(items, 'status', 'allocatable', 'memory')),
+    }).astype({'Node': 'string', 'Zone': 'string'})
+
+
+def pod_placement(pods, nodes=None):
+    """One row per active, scheduled pod (``PLACEMENT_COLUMNS``).
+
+    ``pods`` is a ``kubectl get pods -A -o json`` dump and ``nodes`` an
+    optional ``kubectl get nodes -o json`` dump, which supplies the zones.
+    """
+    items = _items(_read_json(pods))
+    names = _column(items, 'metadata', 'name')
+    owners = [(refs or [{}])[0] for refs in _column(items, 'metadata', 'ownerReferences')]
+    workloads = workload_names(names, [owner.get('kind') for owner in owners], [owner.get('name') for owner in owners])
+    labels = pd.Series([_first_label(labels or {}, GROUP_LABELS) for labels in _column(items, 'metadata', 'labels')],
+                       dtype='string')
+    frame = pd.DataFrame({
+        'Namespace': pd.Series(_column(items, 'metadata', 'namespace'), dtype='string'),
+        'Pod': pd.Series(names, dtype='string'),
+        'Group': labels.fillna(workloads),
+        'Node': pd.Series(_column(items, 'spec', 'nodeName'), dtype='string'),
+        'Memory_Request_Mi': _container_totals(items, 'requests'),
+    })
+    active = pd.Series(_column(items, 'status', 'phase')).isin(ACTIVE_PHASES).to_numpy()
+    frame = frame[active & frame['Node'].notna().to_numpy()]
+    zones = node_zones(nodes).set_index('Node')['Zone'] if nodes is not None else pd.Series(dtype='string')
+    frame['Zone'] = frame['Node'].map(zones).astype('string')
+    return frame[PLACEMENT_COLUMNS].reset_index(drop=True)
+
+
+def spread_scores(placement, nodes=None):
+    """Spread of every group with two or more replicas, worst ``Host_Skew`` first.
+
+    ``nodes`` lists the cluster's nodes (default: those in ``placement``),
+    which sets the even spread ``Host_Skew`` is measured against.
+    """
+    keys = ['Namespace', 'Group']
+    node_count = len(nodes) if nodes is not None else placement['Node'].nunique()
+    per_node = placement.groupby(keys + ['Node'], observed=True).size().rename('Pods').reset_index()
+    per_node['Colocated'] = per_node['Pods'].where(per_node['Pods'] > 1, 0)
+    grouped = per_node.groupby(keys, observed=True)
+    scores = pd.DataFrame({'Replicas': grouped['Pods'].sum(), 'Nodes': grouped.size(),
+                           'Max_Per_Node': grouped['Pods'].max(), 'Colocated': grouped['Colocated'].sum()})
+    scores['Host_Skew'] = scores['Max_Per_Node'] - np.ceil(scores['Replicas'] / max(node_count, 1)).astype('int64')
+    zones = placement['Zone'].dropna().unique()
+    if len(zones):
+        per_zone = placement.dropna(subset=['Zone']).groupby(keys + ['Zone'], observed=True).size().unstack(
+            'Zone', fill_value=0).reindex(columns=zones, fill_value=0)
+        scores['Zones'] = (per_zone > 0).sum(axis=1)
+        scores['Zone_Skew'] = per_zone.max(axis=1) - per_zone.min(axis=1)
+    else:
+        scores['Zones'] = pd.NA
+        scores['Zone_Skew'] = pd.NA
+    scores = scores[scores['Replicas'] > 1]
+    return scores.sort_values(['Host_Skew', 'Replicas'], ascending=False).reset_index()
+
+
+def simulate_anti_affinity(placement, nodes=None):
+    """``placement`` with every pod re-placed under preferred hostname anti-affinity.
+
+    ``nodes`` (``Node``, ``Zone`` and optionally ``Allocatable_Memory_Mi``,
+    see :func:`node_zones`) is the cluster to place onto; by default the
+    nodes of ``placement`` with no memory limit. Groups are placed
+    largest first; pods that fit nowhere get no node.
+    """
+    if nodes is None:
+        nodes = placement.drop_duplicates('Node')[['Node', 'Zone']]
+    node_names = nodes['Node'].to_numpy(dtype=object)
+    zone_codes, zone_names = pd.factorize(nodes['Zone'].astype('string'), use_na_sentinel=True)
+    allocatable = (nodes['Allocatable_Memory_Mi'].to_numpy(dtype='float64', na_value=np.inf)
+                   if 'Allocatable_Memory_Mi' in nodes else np.full(len(nodes), np.inf))
+    requests = np.nan_to_num(placement['Memory_Request_Mi'].to_numpy(dtype='float64', na_value=0.0))
+    # Load as a fraction of the node, or of the whole request volume when sizes are unknown
+    scale = np.where(np.isfinite(allocatable), allocatable, max(requests.sum(), 1.0))
+    scale = np.where(scale > 0, scale, 1.0)
+    load = np.zeros(len(nodes))
+    group_codes, _ = pd.factorize(pd.MultiIndex.from_frame(placement[['Namespace', 'Group']]))
+    sizes = np.bincount(group_codes, weights=requests, minlength=group_codes.max() + 1 if len(group_codes) else 0)
+    target = np.full(len(placement), -1, dtype='int64')
+    # Members of each group, biggest groups first, biggest pods first within a group
+    order = np.lexsort((-requests, group_codes, -sizes[group_codes] if len(group_codes) else requests))
+    siblings = np.zeros(len(nodes), dtype='int64')
+    zone_siblings = np.zeros(len(zone_names) + 1, dtype='int64')
+    current = -1
+    for pod in order:
+        if group_codes[pod] != current:
+            current = group_codes[pod]
+            siblings[:] = 0
+            zone_siblings[:] = 0
+        request = requests[pod]
+        fits = load + request <= allocatable
+        if not fits.any():
+            continue
+        # Sibling count decides (weight 100 in the rule), then zone spread, then the emptiest node
+        score = siblings * 1e9 + zone_siblings[zone_codes] * 1e3 + np.minimum(load / scale, 1.0)
+        node = int(np.argmin(np.where(fits, score, np.inf)))
+        target[pod] = node
+        load[node] += request
+        siblings[node] += 1
+        zone_siblings[zone_codes[node]] += 1
+    placed = target >= 0
+    node_series = pd.Series(pd.NA, index=placement.index, dtype='string')
+    node_series[placed] = node_names[target[placed]]
+    zones = nodes.set_index('Node')['Zone'].astype('string')
+    return placement.assign(Node=node_series, Zone=node_series.map(zones).astype('string'))
+
+
+def node_hotspots(placement, nodes=None, ratio=HOTSPOT_RATIO):
+    """Per-node pods, requested memory and largest same-group stack, flagging hotspots.
+
+    A hotspot holds more than ``ratio`` times the mean requested memory per
+    node of ``nodes`` (default: the nodes in ``placement``).
+    """
+    names = nodes['Node'] if nodes is not None else placement['Node'].dropna().unique()
+    scheduled = placement.dropna(subset=['Node'])
+    frame = pd.DataFrame(index=pd.Index(pd.Series(names, dtype='string'), name='Node'))
+    frame['Pods'] = scheduled.groupby('Node').size().reindex(frame.index, fill_value=0)
+    frame['Memory_Request_Mi'] = scheduled.groupby('Node')['Memory_Request_Mi'].sum().reindex(frame.index, fill_value=0.0)
+    stacks = scheduled.groupby(['Node', 'Namespace', 'Group'], observed=True).size()
+    frame['Max_Replicas_Of_One_Group'] = (stacks.groupby(level='Node').max().reindex(frame.index, fill_value=0)
+                                          if len(stacks) else 0)
+    mean = frame['Memory_Request_Mi'].mean()
+    frame['Hotspot'] = frame['Memory_Request_Mi'] > ratio * mean if mean > 0 else False
+    return frame.reset_index()
@@ -0,0 +1,215 @@
+"""Opt-in per-section timings of each dashboard rerun.
+
+A rerun of a page splits into four sections:
+
+- ``load``: time inside :func:`kube_reports.cache.load_frame`, cache
+  lookups and misses alike;
+- ``figure``: building Plotly figures (``go.Figure``, traces, layout,
+  shapes, ``make_subplots``);
+- ``serialize``: ``st.plotly_chart``, which turns each figure into the
+  JSON sent to the browser;
+- ``transform``: the rest of the page, i.e. DataFrame work and the other
+  Streamlit elements.
+
+Sections are exclusive: a frame loaded while a figure is being built
+counts as ``load`` only. Timings are attributed per thread, so concurrent
+sessions do not mix, and each session's panel shows its own last rerun.
+The Plotly and Streamlit hooks are installed once, the first time
+profiling is switched on, and cost a thread-local lookup per call while
+no rerun is being recorded.
+
+:data:`PROFILE` keeps the last ``PROFILE_HISTORY`` reruns of all sessions
+for the sidebar histogram, plus cumulative Prometheus histograms. Those
+are written to ``KUBE_REPORTS_PROFILE_TEXTFILE`` after each rerun, in the
+text format read by node_exporter's textfile collector.
+"""
+
+import collections
+import contextlib
+import functools
+import os
+import threading
+import time
+
+import numpy as np
+
+SECTIONS = ('load', 'transform', 'figure', 'serialize')
+
+PROFILE_ENABLED = os.environ.get("KUBE_REPORTS_PROFILE", "") not in ("", "0", "false")
+PROFILE_HISTORY = int(os.environ.get("KUBE_REPORTS_PROFILE_HISTORY", 200))
+PROFILE_TEXTFILE = os.environ.get("KUBE_REPORTS_PROFILE_TEXTFILE", "")
+
+# Prometheus histogram bucket bounds, in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Session-state key of the session's last recorded rerun
+LAST_RERUN_KEY = "profile_last_rerun"
+
+_FIGURE_METHODS = ('__init__', 'add_trace', 'add_traces', 'update_layout', 'update_xaxes',
+                   'update_yaxes', 'add_hline', 'add_vline', 'add_shape', 'add_annotation')
+
+
+class RenderProfile:
+    """Process-wide section timings of recorded reruns."""
+
+    def __init__(self, history=PROFILE_HISTORY):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reruns = collections.deque(maxlen=history)
+        self._buckets = {}
+        self._sums = collections.Counter()
+        self._counts = collections.Counter()
+
+    @contextlib.contextmanager
+    def section(self, name):
+        """Attribute the enclosed time to ``name`` if a rerun is being recorded."""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            yield
+            return
+        stack.append([name, time.perf_counter(), 0.0])
+        try:
+            yield
+        finally:
+            _, start, nested = stack.pop()
+            elapsed = time.perf_counter() - start
+            self._local.totals[name] += elapsed - nested
+            stack[-1][2] += elapsed
+
+    @contextlib.contextmanager
+    def rerun(self, page, enabled=True, session_state=None):
+        """Record the enclosed page render as one rerun of ``page``.
+
+        The rerun is also stored in ``session_state`` (Streamlit's, when
+        given) for that session's :func:`timings_panel`.
+        """
+        if not enabled or getattr(self._local, 'stack', None) is not None:
+            yield
+            return
+        instrument()
+        self._local.totals = dict.fromkeys(SECTIONS, 0.0)
+        self._local.stack = [['transform', time.perf_counter(), 0.0]]
+        try:
+            yield
+        finally:
+            _, start, nested = self._local.stack[0]
+            total = time.perf_counter() - start
+            totals = self._local.totals
+            totals['transform'] += total - nested
+            self._local.stack = None
+            rerun = self._record(page, total, totals)
+            if session_state is not None:
+                session_state[LAST_RERUN_KEY] = rerun
+
+    def _record(self, page, total, totals):
+        rerun = {'page': page, 'total': total, **totals}
+        with self._lock:
+            self.reruns.append(rerun)
+            for name, seconds in (('total', total), *totals.items()):
+                key = (page, name)
+                counts = self._buckets.setdefault(key, [0] * (len(BUCKETS) + 1))
+                counts[int(np.searchsorted(BUCKETS, seconds))] += 1
+                self._sums[key] += seconds
+                self._counts[key] += 1
+        if PROFILE_TEXTFILE:
+            self.write_textfile(PROFILE_TEXTFILE)
+        return rerun
+
+    @property
+    def last(self):
+        """Last rerun of any session (the panel reads its own session's from session state)."""
+        return self.reruns[-1] if self.reruns else None
+
+    def histogram(self, section='total', bins=20, page=None):
+        """Counts and edges (seconds) of ``section`` over the retained reruns."""
+        with self._lock:
+            values = [rerun[section] for rerun in self.reruns if page is None or rerun['page'] == page]
+        return np.histogram(values, bins=bins) if values else (np.array([], dtype=int), np.array([]))
+
+    def prometheus_text(self):
+        """Cumulative histograms of every page and section, in Prometheus text format."""
+        name = 'kube_reports_render_section_seconds'
+        lines = [f'# HELP {name} Time a dashboard rerun spent in each section.', f'# TYPE {name} histogram']
+        with self._lock:
+            for (page, section), counts in sorted(self._buckets.items()):
+                labels = f'page="{_escape(page)}",section="{section}"'
+                running = np.cumsum(counts)
+                for bound, count in zip(BUCKETS, running):
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {running[-1]}')
+                lines.append(f'{name}_sum{{{labels}}} {self._sums[(page, section)]:.6f}')
+                lines.append(f'{name}_count{{{labels}}} {self._counts[(page, section)]}')
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path):
+        # Write then rename, so the collector never reads a half-written file
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as handle:
+            handle.write(self.prometheus_text())
+        os.replace(temporary, path)
+
+    def reset(self):
+        with self._lock:
+            self.reruns.clear()
+            self._buckets.clear()
+            self._sums.clear()
+            self._counts.clear()
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+PROFILE = RenderProfile()
+
+
+def _timed(func, name):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with PROFILE.section(name):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+@functools.cache
+def instrument():
+    """Hook Plotly figure building and ``st.plotly_chart`` into :data:`PROFILE` (once)."""
+    import plotly.graph_objects as go
+    import plotly.subplots
+    import streamlit as st
+    from streamlit.elements.plotly_chart import PlotlyMixin
+
+    for method in _FIGURE_METHODS:
+        setattr(go.Figure, method, _timed(getattr(go.Figure, method), 'figure'))
+    # Pages bind make_subplots at import; the go.Figure it returns is timed regardless
+    plotly.subplots.make_subplots = _timed(plotly.subplots.make_subplots, 'figure')
+    # st.plotly_chart is bound to the main container at import, so both need wrapping
+    PlotlyMixin.plotly_chart = _timed(PlotlyMixin.plotly_chart, 'serialize')
+    st.plotly_chart = _timed(st.plotly_chart, 'serialize')
+
+
+def timings_panel(page):
+    """Sidebar expander with this session's last rerun and the rolling histogram of all sessions."""
+    import pandas as pd
+    import streamlit as st
+
+    with st.sidebar.expander("⏱️ Render timings", expanded=True):
+        last = st.session_state.get(LAST_RERUN_KEY)
+        if last is None:
+            st.caption("No rerun recorded yet.")
+            return
+        st.caption(f"Last rerun of {last['page']}: {last['total'] * 1000:.0f} ms")
+        st.bar_chart(pd.Series({name: last[name] * 1000 for name in SECTIONS}, name="ms"), horizontal=True,
+                     height=160)
+
+        section = st.selectbox("Histogram of", ('total',) + SECTIONS, key="profile_section")
+        counts, edges = PROFILE.histogram(section, page=page if st.checkbox("This page only", key="profile_page")
+                                          else None)
+        if len(counts):
+            starts = pd.Index((edges[:-1] * 1000).round(1), name="ms")
+            st.bar_chart(pd.Series(counts, index=starts, name="reruns"), height=160)
+        st.caption(f"{len(PROFILE.reruns)} reruns retained, all sessions")
+        if PROFILE_TEXTFILE:
+            st.caption(f"Prometheus textfile: `{PROFILE_TEXTFILE}`")
+        st.download_button("Prometheus text", PROFILE.prometheus_text(), file_name="kube_reports_render.prom",
+                           mime="text/plain")
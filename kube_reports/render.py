@@ -0,0 +1,393 @@
+"""Render the dashboards to static HTML (and optionally PDF) without a server.
+
+Each report script is executed headlessly through Streamlit's ``AppTest``
+runner, once per sidebar page, and the resulting element tree (markdown,
+metrics, tables, code, expanders, columns and Plotly figures) is written
+out as plain HTML. Figures are emitted as JSON plus a ``Plotly.newPlot``
+call against one shared ``plotly.min.js``: either a single
+``assets/plotly.min.js`` referenced by every report in the bundle, or, with
+``--inline``, one copy embedded at the top of each file.
+
+Clusters are rendered in parallel worker processes. Each cluster is a set
+of environment overrides (data source paths, snapshot store) plus optional
+widget values, so the nightly job for 40 clusters is one command::
+
+    python -m kube_reports.render --out reports --snapshot-dir snapshots --workers 8
+    python -m kube_reports.render --out reports --clusters clusters.json --pdf
+
+``clusters.json`` maps a cluster name to ``{"env": {...}, "widgets": {...}}``.
+"""
+
+import argparse
+import html
+import json
+import multiprocessing
+import os
+import re
+import shutil
+import subprocess
+import textwrap
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+REPORTS = {
+    'node-comparison': ('node_comparison', 'node-comparison.py'),
+    'phase-1-fixes': ('phase1', 'phase-1-fixes.py'),
+}
+
+PLOTLY_ASSET = 'plotly.min.js'
+SCRIPT_TIMEOUT = 120
+
+PAGE_CSS = """
+body { font-family: -apple-system, "Segoe UI", Roboto, sans-serif; margin: 2rem auto; max-width: 1400px; color: #262730; }
+nav a { margin-right: 1rem; }
+section.page { border-top: 1px solid #dee2e6; margin-top: 2rem; padding-top: 1rem; }
+.columns { display: flex; gap: 1rem; }
+.columns > .column { flex: 1 1 0; min-width: 0; }
+.metric .label { color: #555; font-size: 0.9rem; }
+.metric .value { font-size: 2rem; }
+.metric .delta { color: #2e7d32; font-size: 0.9rem; }
+.widget, .caption { color: #6c757d; font-size: 0.85rem; }
+.alert { padding: 0.75rem 1rem; border-radius: 5px; margin: 0.5rem 0; }
+.alert.info { background: #e3f2fd; } .alert.warning { background: #fff3e0; }
+.alert.success { background: #e8f5e8; } .alert.error { background: #ffebee; }
+table.dataframe { border-collapse: collapse; font-size: 0.9rem; }
+table.dataframe td, table.dataframe th { border: 1px solid #dee2e6; padding: 0.3rem 0.6rem; }
+pre { background: #f8f9fa; padding: 1rem; overflow-x: auto; }
+details { margin: 0.5rem 0; } summary { cursor: pointer; font-weight: 600; }
+"""
+
+_INLINE_RULES = [
+    (re.compile(r'`([^`]+)`'), r'<code>\1</code>'),
+    (re.compile(r'\*\*(.+?)\*\*'), r'<strong>\1</strong>'),
+    (re.compile(r'\[([^\]]+)\]\(([^)\s]+)\)'), r'<a href="\2">\1</a>'),
+]
+
+try:
+    import markdown as _markdown
+except ImportError:
+    _markdown = None
+
+
+def _inline(text):
+    text = html.escape(text, quote=False)
+    for pattern, replacement in _INLINE_RULES:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def markdown_to_html(text):
+    """Convert the markdown subset used by the pages (headings, lists, bold, code, raw HTML)."""
+    text = textwrap.dedent(text).strip()
+    if _markdown is not None:
+        return _markdown.markdown(text)
+    out, paragraph, list_tag = [], [], None
+
+    def flush():
+        nonlocal list_tag
+        if paragraph:
+            out.append('<p>' + '<br>'.join(_inline(line) for line in paragraph) + '</p>')
+            paragraph.clear()
+        if list_tag:
+            out.append(f'</{list_tag}>')
+            list_tag = None
+
+    for raw in text.split('\n'):
+        line = raw.strip()
+        heading = re.match(r'^(#{1,6})\s+(.*)$', line)
+        bullet = re.match(r'^[-*]\s+(.*)$', line)
+        numbered = re.match(r'^\d+\.\s+(.*)$', line)
+        if not line:
+            flush()
+        elif line.startswith('<'):
+            flush()
+            out.append(raw)
+        elif line == '---':
+            flush()
+            out.append('<hr>')
+        elif heading:
+            flush()
+            level = len(heading.group(1))
+            out.append(f'<h{level}>{_inline(heading.group(2))}</h{level}>')
+        elif bullet or numbered:
+            tag = 'ul' if bullet else 'ol'
+            if paragraph or list_tag != tag:
+                flush()
+                out.append(f'<{tag}>')
+                list_tag = tag
+            out.append(f'<li>{_inline((bullet or numbered).group(1))}</li>')
+        else:
+            if list_tag:
+                flush()
+            paragraph.append(line)
+    flush()
+    return '\n'.join(out)
+
+
+class HtmlWriter:
+    """Turns an ``AppTest`` element tree into HTML, collecting figures as it goes."""
+
+    def __init__(self, figure_prefix):
+        self.figure_prefix = figure_prefix
+        self.figures = 0
+
+    def block(self, node):
+        return '\n'.join(self.node(child) for child in node.children.values())
+
+    def node(self, node):
+        kind = getattr(node, 'type', None)
+        handler = getattr(self, f'_{kind}', None)
+        if handler is not None:
+            return handler(node)
+        if hasattr(node, 'children') and node.children:
+            return self.block(node)
+        if hasattr(node, 'label') and hasattr(node, 'value'):
+            return f'<div class="widget">{html.escape(str(node.label))}: {html.escape(str(node.value))}</div>'
+        return ''
+
+    def _markdown(self, node):
+        return markdown_to_html(node.value)
+
+    def _title(self, node):
+        return f'<h1>{_inline(node.value)}</h1>'
+
+    def _header(self, node):
+        return f'<h2>{_inline(node.value)}</h2>'
+
+    def _subheader(self, node):
+        return f'<h3>{_inline(node.value)}</h3>'
+
+    def _caption(self, node):
+        return f'<div class="caption">{_inline(node.value)}</div>'
+
+    def _text(self, node):
+        return f'<pre>{html.escape(node.value)}</pre>'
+
+    def _code(self, node):
+        return f'<pre><code>{html.escape(textwrap.dedent(node.value).strip())}</code></pre>'
+
+    def _divider(self, node):
+        return '<hr>'
+
+    def _alert(self, node, kind):
+        return f'<div class="alert {kind}">{markdown_to_html(node.value)}</div>'
+
+    def _info(self, node):
+        return self._alert(node, 'info')
+
+    def _warning(self, node):
+        return self._alert(node, 'warning')
+
+    def _success(self, node):
+        return self._alert(node, 'success')
+
+    def _error(self, node):
+        return self._alert(node, 'error')
+
+    def _metric(self, node):
+        delta = f'<div class="delta">{html.escape(node.delta)}</div>' if node.delta else ''
+        return (f'<div class="metric"><div class="label">{html.escape(node.label)}</div>'
+                f'<div class="value">{html.escape(node.value)}</div>{delta}</div>')
+
+    def _dataframe(self, node):
+        return node.value.to_html(index=False, classes='dataframe', border=0)
+
+    def _table(self, node):
+        return self._dataframe(node)
+
+    def _expander(self, node):
+        return f'<details open><summary>{_inline(node.label)}</summary>\n{self.block(node)}\n</details>'
+
+    def _flex_container(self, node):
+        if all(getattr(child, 'type', None) == 'column' for child in node.children.values()):
+            return f'<div class="columns">\n{self.block(node)}\n</div>'
+        return self.block(node)
+
+    def _column(self, node):
+        return f'<div class="column">\n{self.block(node)}\n</div>'
+
+    def _plotly_chart(self, node):
+        self.figures += 1
+        div_id = f'{self.figure_prefix}-fig-{self.figures}'
+        spec = node.proto.spec
+        config = node.proto.config or '{}'
+        # Escape "</" so figure text can never close the script tag early
+        spec = spec.replace('</', '<\\/')
+        return (f'<div id="{div_id}" class="figure"></div>\n'
+                f'<script>(function(){{var f={spec};'
+                f'Plotly.newPlot("{div_id}",f.data,f.layout,Object.assign({{responsive:true}},{config}));}})();</script>')
+
+
+def _apply_widgets(app, widgets):
+    for label, value in widgets.items():
+        for widget in list(app.selectbox) + list(app.radio) + list(app.text_input):
+            if widget.label == label and widget.value != value:
+                widget.set_value(value).run(timeout=SCRIPT_TIMEOUT)
+                break
+
+
+def render_report(report, widgets=None):
+    """Render every page of ``report`` and return ``(shared_head, [(label, html), ...], footer)``."""
+    from streamlit.testing.v1 import AppTest
+
+    from kube_reports.pages import page_labels
+
+    package, script = REPORTS[report]
+    app = AppTest.from_file(os.path.join(REPO_ROOT, script), default_timeout=SCRIPT_TIMEOUT).run()
+    pages = []
+    for index, label in enumerate(page_labels(package)):
+        app.sidebar.selectbox[0].select(label).run()
+        _apply_widgets(app, widgets or {})
+        if app.exception:
+            raise RuntimeError(f"{report} / {label}: {app.exception[0].message}")
+        writer = HtmlWriter(f'{report}-{index}')
+        pages.append((label, [writer.node(child) for child in app.main.children.values()]))
+
+    # Page config, CSS and titles are shared by every page; keep one copy
+    first = pages[0][1]
+    prefix = 0
+    while all(prefix < len(body) and body[prefix] == first[prefix] for _, body in pages):
+        prefix += 1
+    suffix = 0
+    while all(suffix < len(body) - prefix and body[-1 - suffix] == first[-1 - suffix] for _, body in pages):
+        suffix += 1
+    head = '\n'.join(first[:prefix])
+    footer = '\n'.join(first[len(first) - suffix:]) if suffix else ''
+    sections = [(label, '\n'.join(body[prefix:len(body) - suffix])) for label, body in pages]
+    return head, sections, footer
+
+
+def _plotly_js():
+    from plotly.offline import get_plotlyjs
+    return get_plotlyjs()
+
+
+def build_html(report, cluster, head, sections, footer, plotly_src=None):
+    """One HTML document; ``plotly_src`` is a relative asset path, or ``None`` to inline it."""
+    if plotly_src is None:
+        plotly_tag = f'<script type="text/javascript">{_plotly_js()}</script>'
+    else:
+        plotly_tag = f'<script src="{html.escape(plotly_src)}"></script>'
+    nav = ' '.join(f'<a href="#page-{i}">{html.escape(label)}</a>' for i, (label, _) in enumerate(sections))
+    body = '\n'.join(f'<section class="page" id="page-{i}">\n{content}\n</section>'
+                     for i, (_, content) in enumerate(sections))
+    title = f'{report} - {cluster}' if cluster else report
+    return (f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>\n'
+            f'<style>{PAGE_CSS}</style>\n{plotly_tag}\n</head><body>\n{head}\n<nav>{nav}</nav>\n{body}\n'
+            f'{footer}\n<div class="caption">Rendered {datetime.now():%Y-%m-%d %H:%M:%S}'
+            f'{" for cluster " + html.escape(cluster) if cluster else ""}</div>\n</body></html>\n')
+
+
+def html_to_pdf(html_path, pdf_path):
+    """Print ``html_path`` with headless Chromium (runs the Plotly JS, unlike pure-HTML converters)."""
+    browser = next((shutil.which(name) for name in ('chromium', 'chromium-browser', 'google-chrome', 'chrome')
+                    if shutil.which(name)), None)
+    if browser is None:
+        raise RuntimeError("PDF output needs a Chromium/Chrome binary on PATH")
+    subprocess.run([browser, '--headless', '--disable-gpu', '--no-sandbox', '--virtual-time-budget=10000',
+                    f'--print-to-pdf={os.path.abspath(pdf_path)}', 'file://' + os.path.abspath(html_path)],
+                   check=True, capture_output=True, timeout=300)
+
+
+def render_cluster(cluster, config, out_dir, reports, inline=False, pdf=False):
+    """Worker entry point: render ``reports`` for one cluster, return the files written.
+
+    The cluster's environment overrides are undone on return, so a caller
+    rendering several clusters in one process does not carry them over.
+    """
+    overrides = {key: str(value) for key, value in config.get('env', {}).items()}
+    saved = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+    try:
+        target = os.path.join(out_dir, cluster) if cluster else out_dir
+        os.makedirs(target, exist_ok=True)
+        asset = None if inline else os.path.relpath(os.path.join(out_dir, 'assets', PLOTLY_ASSET), target)
+        written = []
+        for report in reports:
+            head, sections, footer = render_report(report, config.get('widgets'))
+            path = os.path.join(target, f'{report}.html')
+            with open(path, 'w', encoding='utf-8') as handle:
+                handle.write(build_html(report, cluster, head, sections, footer, asset))
+            written.append(path)
+            if pdf:
+                html_to_pdf(path, path[:-len('.html')] + '.pdf')
+                written.append(path[:-len('.html')] + '.pdf')
+        return written
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _write_index(out_dir, results):
+    links = []
+    for cluster, files in sorted(results.items()):
+        items = ' '.join(f'<a href="{html.escape(os.path.relpath(path, out_dir))}">{html.escape(os.path.basename(path))}</a>'
+                         for path in files)
+        links.append(f'<li><strong>{html.escape(cluster or "default")}</strong>: {items}</li>')
+    with open(os.path.join(out_dir, 'index.html'), 'w', encoding='utf-8') as handle:
+        handle.write(f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>kube-reports</title>'
+                     f'<style>{PAGE_CSS}</style></head><body><h1>kube-reports</h1><ul>\n'
+                     + '\n'.join(links) + '\n</ul></body></html>\n')
+
+
+def render_all(out_dir, clusters, reports=tuple(REPORTS), workers=None, inline=False, pdf=False):
+    """Render every cluster in parallel worker processes and write ``index.html``."""
+    os.makedirs(out_dir, exist_ok=True)
+    if not inline:
+        os.makedirs(os.path.join(out_dir, 'assets'), exist_ok=True)
+        with open(os.path.join(out_dir, 'assets', PLOTLY_ASSET), 'w', encoding='utf-8') as handle:
+            handle.write(_plotly_js())
+
+    results = {}
+    # One fresh spawned process per cluster: module-level settings (bands, cache and shared-memory
+    # options) are read under that cluster's environment, and AppTest's swap of __main__ in a
+    # finished worker never meets the next task's unpickling
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, max_tasks_per_child=1) as pool:
+        futures = {pool.submit(render_cluster, name, config, out_dir, list(reports), inline, pdf): name
+                   for name, config in clusters.items()}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    _write_index(out_dir, results)
+    return results
+
+
+def _clusters_from_args(args):
+    if args.clusters:
+        with open(args.clusters, encoding='utf-8') as handle:
+            return json.load(handle)
+    if args.snapshot_dir:
+        from kube_reports.snapshots import SnapshotStore
+        names = args.cluster or SnapshotStore(args.snapshot_dir).clusters()
+        return {name: {'env': {'KUBE_REPORTS_SNAPSHOT_DIR': os.path.abspath(args.snapshot_dir)},
+                       'widgets': {'Cluster': name}} for name in names}
+    return {'': {}}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m kube_reports.render', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--out', required=True, help='output directory')
+    parser.add_argument('--report', action='append', choices=sorted(REPORTS),
+                        help='report to render (repeatable, default: all)')
+    parser.add_argument('--clusters', help='JSON file mapping cluster name to {"env": ..., "widgets": ...}')
+    parser.add_argument('--snapshot-dir', help='render every cluster found in this snapshot store')
+    parser.add_argument('--cluster', action='append', help='limit --snapshot-dir to these clusters')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--inline', action='store_true', help='embed plotly.js in each HTML file')
+    parser.add_argument('--pdf', action='store_true', help='also print each report to PDF (needs Chromium)')
+    args = parser.parse_args(argv)
+
+    results = render_all(args.out, _clusters_from_args(args), args.report or tuple(REPORTS),
+                         args.workers, args.inline, args.pdf)
+    for cluster, files in sorted(results.items()):
+        for path in files:
+            print(f"{cluster or 'default'}: {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""Cluster → namespace → workload → pod rollup cubes of pod usage and limits.
+
+:func:`rollup` aggregates a pod table once into every level of the
+hierarchy: one row per cluster, per namespace, per workload and per pod,
+each with the summed CPU and memory usage and limits and the pod count.
+:class:`RollupCube` indexes each level on its parent path, so drilling
+from a namespace to its workloads is a sorted-index lookup of
+precomputed rows rather than a groupby over the raw pods on every click.
+
+Cubes are saved as Parquet next to the node snapshot they belong to
+(see :meth:`kube_reports.snapshots.SnapshotStore.write_rollup`), so
+reopening the dashboard reads the finished aggregates. Workloads come
+from each pod's owner: a ReplicaSet owner is named after its Deployment
+by dropping the pod-template hash, and a pod with no owner is its own
+workload.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from kube_reports.ingest import _column, _items, _read_json, parse_cpu_millicores, parse_memory_mi
+from kube_reports.overcommit import ACTIVE_PHASES, _container_totals
+from kube_reports.schema import ROLLUP_SCHEMA, compact
+
+LEVELS = ('Cluster', 'Namespace', 'Workload', 'Pod')
+MEASURES = ('CPU_Usage_m', 'Memory_Usage_Mi', 'CPU_Limit_m', 'Memory_Limit_Mi')
+
+# Usage of the pods that set the matching limit: the numerator of the usage percentages
+_LIMITED = {
+    'CPU_Limited_Usage_m': ('CPU_Usage_m', 'CPU_Limit_m'),
+    'Memory_Limited_Usage_Mi': ('Memory_Usage_Mi', 'Memory_Limit_Mi'),
+}
+
+_REPLICASET_HASH = r'-[0-9a-z]{5,10}$'
+
+
+def workload_names(pods, owner_kinds, owner_names):
+    """Workload of each pod from its first owner reference."""
+    pods = pd.Series(pods, dtype='string')
+    owners = pd.Series(owner_names, dtype='string')
+    replicasets = pd.Series(owner_kinds, dtype='string').eq('ReplicaSet').fillna(False)
+    workloads = owners.mask(replicasets, owners.str.replace(_REPLICASET_HASH, '', regex=True))
+    return workloads.fillna(pods)
+
+
+def _usage_totals(metric_items, resource, parse):
+    """Sum one resource's usage over each PodMetrics item's containers."""
+    containers = [item.get('containers', []) if isinstance(item, dict) else [] for item in metric_items]
+    lengths = [len(group) for group in containers]
+    values = parse([container.get('usage', {}).get(resource) for group in containers for container in group])
+    owners = np.repeat(np.arange(len(containers)), lengths)
+    return np.bincount(owners, weights=np.nan_to_num(values), minlength=len(containers))
+
+
+def pod_usage(pods, metrics=None, cluster=''):
+    """One row per active pod: its ``LEVELS`` path, usage and limits.
+
+    ``pods`` is a ``kubectl get pods -A -o json`` dump and ``metrics`` a
+    metrics-server ``PodMetricsList`` (``kubectl get --raw
+    /apis/metrics.k8s.io/v1beta1/pods``). Without metrics the usage
+    columns are empty.
+    """
+    items = _items(_read_json(pods))
+    owners = [(refs or [{}])[0] for refs in _column(items, 'metadata', 'ownerReferences')]
+    names = _column(items, 'metadata', 'name')
+    frame = pd.DataFrame({
+        'Cluster': cluster,
+        'Namespace': _column(items, 'metadata', 'namespace'),
+        'Workload': workload_names(names, [owner.get('kind') for owner in owners],
+                                   [owner.get('name') for owner in owners]).to_numpy(),
+        'Pod': names,
+        'CPU_Limit_m': _container_totals(items, 'limits', 'cpu', parse_cpu_millicores),
+        'Memory_Limit_Mi': _container_totals(items, 'limits'),
+    })
+    frame = frame[pd.Series(_column(items, 'status', 'phase')).isin(ACTIVE_PHASES).to_numpy()]
+    if metrics is not None:
+        metric_items = _items(_read_json(metrics))
+        usage = pd.DataFrame({
+            'Namespace': _column(metric_items, 'metadata', 'namespace'),
+            'Pod': _column(metric_items, 'metadata', 'name'),
+            'CPU_Usage_m': _usage_totals(metric_items, 'cpu', parse_cpu_millicores),
+            'Memory_Usage_Mi': _usage_totals(metric_items, 'memory', parse_memory_mi),
+        }).drop_duplicates(['Namespace', 'Pod'])
+        frame = frame.merge(usage, on=['Namespace', 'Pod'], how='left')
+    else:
+        frame = frame.assign(CPU_Usage_m=np.nan, Memory_Usage_Mi=np.nan)
+    return frame[list(LEVELS + MEASURES)].reset_index(drop=True)
+
+
+def rollup(pods):
+    """Every level of the hierarchy aggregated from a pod frame, as one long frame.
+
+    Rows carry a ``Depth`` (1 = cluster ... 4 = pod) and leave the levels
+    below it empty; they are sorted by depth, then path. Usage is also
+    summed over only the pods with a limit, so a row mixing limited and
+    unlimited pods compares like with like in :meth:`RollupCube.slice`.
+    """
+    pods = pods.assign(**{limited: pods[usage].astype('float64').where(pods[limit].astype('float64') > 0)
+                          for limited, (usage, limit) in _LIMITED.items()})
+    measures = [*MEASURES, *_LIMITED]
+    parts = []
+    for depth in range(1, len(LEVELS) + 1):
+        keys = list(LEVELS[:depth])
+        grouped = pods.groupby(keys, observed=True, sort=True)
+        part = grouped[measures].sum(min_count=1)
+        part['Pod_Count'] = grouped.size()
+        parts.append(part.reset_index().assign(Depth=depth))
+    frame = pd.concat(parts, ignore_index=True).reindex(columns=['Depth', *LEVELS, 'Pod_Count', *measures])
+    return compact(frame, ROLLUP_SCHEMA)
+
+
+def _with_percentages(frame):
+    for name, limited in (('CPU_Usage_Percent', 'CPU_Limited_Usage_m'),
+                          ('Memory_Usage_Percent', 'Memory_Limited_Usage_Mi')):
+        usage, limit = _LIMITED[limited]
+        # Cubes saved before the limited sums existed fall back to all usage
+        used = frame[limited] if limited in frame else frame[usage]
+        # No limits set means no meaningful percentage
+        limits = frame[limit].astype('float64')
+        frame[name] = (used.astype('float64') / limits.where(limits > 0) * 100).round().astype('Int64')
+    return frame.drop(columns=[name for name in _LIMITED if name in frame])
+
+
+class RollupCube:
+    """A :func:`rollup` frame with each level indexed on its path for slicing."""
+
+    def __init__(self, frame):
+        self.frame = frame
+        depth = frame['Depth'].to_numpy()
+        self._levels = {
+            level: frame[depth == level].drop(columns=['Depth', *LEVELS[level:]])
+                                        .set_index(list(LEVELS[:level])).sort_index()
+            for level in range(1, len(LEVELS) + 1)
+        }
+
+    @classmethod
+    def from_pods(cls, pods):
+        return cls(rollup(pods))
+
+    def slice(self, *path):
+        """Children of ``path``, with usage as a percentage of limits.
+
+        ``slice()`` lists the clusters, ``slice('prod')`` the namespaces of
+        ``prod``, ``slice('prod', 'shop')`` its workloads and so on. An
+        unknown path yields an empty frame.
+        """
+        if len(path) >= len(LEVELS):
+            raise ValueError(f"A path has at most {len(LEVELS) - 1} levels: {path!r}")
+        level = self._levels[len(path) + 1]
+        if path:
+            try:
+                level = level.loc[path if len(path) > 1 else path[0]]
+            except KeyError:
+                level = level.iloc[:0].droplevel(list(range(len(path))))
+        return _with_percentages(level.reset_index())
+
+    def save(self, path):
+        # Write then rename, so a reader never sees a half-written cube
+        temporary = f'{path}.tmp'
+        self.frame.to_parquet(temporary, index=False)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path):
+        return cls(compact(pd.read_parquet(path), ROLLUP_SCHEMA, record=False))
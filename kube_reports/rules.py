@@ -0,0 +1,518 @@
+"""Prometheus alerting rules evaluated locally over the snapshot store.
+
+Backtesting a threshold should not need a running Prometheus. This module
+parses the alerting rules of a Prometheus rule file (``groups:`` →
+``rules:`` → ``alert``/``expr``/``for``/``labels``/``annotations``) and
+replays them over the snapshots of :class:`~kube_reports.snapshots.SnapshotStore`,
+one evaluation per snapshot, oldest first.
+
+Expressions are the subset the sample rules use:
+
+- instant selectors with label matchers (``=``, ``!=``, ``=~``, ``!~``),
+  e.g. ``container_memory_usage_bytes{namespace="shop"}``;
+- ``increase``, ``rate`` and ``delta`` over a range (``[1h]``), from the
+  samples inside the window, not extrapolated to the window's edges. On a
+  counter (a ``*_total`` metric) a drop is a reset, as in Prometheus; on a
+  gauge such as ``container_memory_usage_bytes`` it is a drop, so
+  ``increase`` is the change over the window. (Prometheus would read every
+  dip in memory as a reset and fire the leak rule on nearly every pod.);
+- ``+ - * /`` between vectors (matched on identical labels) and scalars,
+  then one comparison (``> < >= <= == !=``) that filters the vector.
+
+Pod series (``POD_METRICS``) come from each snapshot's rollup cube, the
+pod's summed usage standing in for its containers; a pod without a
+memory limit has no limit series, so it cannot divide by zero. Node
+series are the snapshot's own columns, in the units of
+:data:`~kube_reports.ingest.PROMETHEUS_METRICS`.
+
+:class:`RuleEngine` keeps per-rule, per-series state the way the rule
+manager does: a series enters *pending* when the expression first
+returns it, turns *firing* once it has stayed for the ``for:`` duration
+and resets when it drops out. Evaluation is incremental: each snapshot is
+folded in once, and :func:`backtest` only reads snapshots newer than the
+last one evaluated::
+
+    python -m kube_reports.rules --root snapshots --cluster prod --rules rules.yaml --out history.csv
+"""
+
+import argparse
+import operator
+import os
+import re
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import yaml
+
+from kube_reports.ingest import PROMETHEUS_METRICS
+from kube_reports.snapshots import SnapshotStore, snapshot_id
+
+SAMPLE_RULES = """\
+groups:
+- name: memory-alerts
+  rules:
+  - alert: HighMemoryUsage
+    expr: (container_memory_usage_bytes / container_spec_memory_limit_bytes) > 0.8
+    for: 5m
+    labels:
+      severity: warning
+    annotations:
+      summary: "High memory usage detected"
+      description: "Pod {{ $labels.pod }} memory usage is above 80%"
+
+  - alert: MemoryLeakDetected
+    expr: increase(container_memory_usage_bytes[1h]) > 100000000
+    for: 10m
+    labels:
+      severity: critical
+    annotations:
+      summary: "Potential memory leak detected"
+      description: "Pod {{ $labels.pod }} memory increased by >100MB in 1 hour"
+"""
+
+# Pod series read from a snapshot's rollup cube -> (column, scale from the column's unit)
+POD_METRICS = {
+    'container_memory_usage_bytes': ('Memory_Usage_Mi', 2 ** 20),
+    'container_memory_working_set_bytes': ('Memory_Usage_Mi', 2 ** 20),
+    'container_spec_memory_limit_bytes': ('Memory_Limit_Mi', 2 ** 20),
+}
+# Node series read from the snapshot itself
+NODE_METRICS = {metric: (column, 1 / scale) for metric, (column, scale) in PROMETHEUS_METRICS.items()}
+
+FUNCTIONS = ('increase', 'rate', 'delta')
+COMPARISONS = {'>': operator.gt, '<': operator.lt, '>=': operator.ge, '<=': operator.le, '==': operator.eq,
+               '!=': operator.ne}
+ARITHMETIC = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv}
+
+_TOKEN_RE = re.compile(
+    r'\s*(?:(?P<range>\[[0-9a-z]+\])'
+    r'|(?P<number>(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?)'
+    r'|(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)'
+    r'|(?P<string>"(?:[^"\\]|\\.)*")'
+    r'|(?P<op>>=|<=|==|!=|=~|!~|[-+*/()<>{},=]))')
+_TEMPLATE_RE = re.compile(r'\{\{\s*\$(?:labels\.(?P<label>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<value>value))\s*\}\}')
+
+
+def _duration(text):
+    try:
+        return pd.Timedelta(text)
+    except ValueError:
+        raise ValueError(f"Invalid duration {text!r}") from None
+
+
+def _tokens(expr):
+    tokens, position = [], 0
+    expr = expr.strip()
+    while position < len(expr):
+        match = _TOKEN_RE.match(expr, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Unexpected {expr[position:].strip()[:20]!r} in {expr!r}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over the supported PromQL subset, into nested tuples."""
+
+    def __init__(self, expr):
+        self.expr = expr
+        self.tokens = _tokens(expr)
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self, kind=None, value=None):
+        token = self.peek()
+        if token[0] is None or (kind and token[0] != kind) or (value and token[1] != value):
+            raise ValueError(f"Expected {value or kind} at {token[1]!r} in {self.expr!r}")
+        self.position += 1
+        return token[1]
+
+    def parse(self):
+        tree = self.arithmetic()
+        if self.peek()[1] in COMPARISONS:
+            op = self.take()
+            tree = ('compare', op, tree, self.arithmetic())
+        if self.peek()[0] is not None:
+            raise ValueError(f"Unsupported {self.peek()[1]!r} in {self.expr!r}")
+        return tree
+
+    def arithmetic(self):
+        tree = self.term()
+        while self.peek()[1] in ('+', '-'):
+            op = self.take()
+            tree = ('binary', op, tree, self.term())
+        return tree
+
+    def term(self):
+        tree = self.factor()
+        while self.peek()[1] in ('*', '/'):
+            op = self.take()
+            tree = ('binary', op, tree, self.factor())
+        return tree
+
+    def factor(self):
+        kind, value = self.peek()
+        if kind == 'number':
+            return ('number', float(self.take()))
+        if value == '(':
+            self.take()
+            tree = self.arithmetic()
+            self.take('op', ')')
+            return tree
+        if kind == 'name' and value in FUNCTIONS:
+            function = self.take()
+            self.take('op', '(')
+            selector = self.selector()
+            window = _duration(self.take('range')[1:-1])
+            self.take('op', ')')
+            return ('range', function, selector, window)
+        if kind == 'name':
+            return self.selector()
+        raise ValueError(f"Unexpected {value!r} in {self.expr!r}")
+
+    def selector(self):
+        metric = self.take('name')
+        matchers = []
+        if self.peek()[1] == '{':
+            self.take()
+            while self.peek()[1] != '}':
+                label = self.take('name')
+                op = self.take('op')
+                if op not in ('=', '!=', '=~', '!~'):
+                    raise ValueError(f"Unsupported label matcher {op!r} in {self.expr!r}")
+                matchers.append((label, op, self.take('string')[1:-1]))
+                if self.peek()[1] == ',':
+                    self.take()
+            self.take('op', '}')
+        return ('selector', metric, tuple(matchers))
+
+
+def parse_expr(expr):
+    """Syntax tree of a PromQL expression in the supported subset; ``ValueError`` otherwise."""
+    return _Parser(str(expr)).parse()
+
+
+def _walk(tree):
+    yield tree
+    for child in tree[1:]:
+        if isinstance(child, tuple) and child and isinstance(child[0], str):
+            yield from _walk(child)
+
+
+class AlertRule:
+    """One ``alert:`` entry of a rule file, with its expression parsed."""
+
+    def __init__(self, name, expr, hold='0s', labels=None, annotations=None):
+        self.name = name
+        self.expr = expr
+        self.tree = parse_expr(expr)
+        self.hold = _duration(hold)
+        self.labels = dict(labels or {})
+        self.annotations = dict(annotations or {})
+
+    def metrics(self):
+        """Metric name -> the longest range it is read over (zero for instant selectors)."""
+        metrics = {}
+        for node in _walk(self.tree):
+            if node[0] == 'selector':
+                metrics.setdefault(node[1], pd.Timedelta(0))
+            elif node[0] == 'range':
+                metrics[node[2][1]] = max(metrics.get(node[2][1], pd.Timedelta(0)), node[3])
+        return metrics
+
+    def __repr__(self):
+        return f"AlertRule({self.name!r}, {self.expr!r}, for={self.hold})"
+
+
+def parse_rules(text):
+    """The alerting rules of a Prometheus rule file; recording rules are skipped."""
+    document = yaml.safe_load(text) or {}
+    if not isinstance(document, dict) or not isinstance(document.get('groups', []), list):
+        raise ValueError("A rule file is a mapping with a 'groups' list")
+    rules = []
+    for group in document.get('groups', []):
+        for entry in group.get('rules', []) or []:
+            if 'alert' not in entry:
+                continue
+            if 'expr' not in entry:
+                raise ValueError(f"Rule {entry['alert']!r} has no expr")
+            rules.append(AlertRule(entry['alert'], entry['expr'], entry.get('for', '0s'), entry.get('labels'),
+                                   entry.get('annotations')))
+    return rules
+
+
+def _matches(frame, matchers):
+    keep = np.ones(len(frame), dtype=bool)
+    for label, op, value in matchers:
+        # A missing label matches the empty string, as in Prometheus
+        labels = frame[label].astype('string').fillna('') if label in frame else pd.Series('', index=frame.index)
+        hit = labels.str.fullmatch(value) if op in ('=~', '!~') else labels == value
+        keep &= hit.to_numpy(dtype=bool) ^ (op in ('!=', '!~'))
+    return keep
+
+
+def _select(frame, matchers):
+    if frame is None:
+        return pd.Series(dtype='float64')
+    values = frame['Value']
+    return values[_matches(frame, matchers)] if matchers else values
+
+
+def _render(template, labels, value):
+    """Fill ``{{ $labels.<name> }}`` and ``{{ $value }}`` into an annotation."""
+    return _TEMPLATE_RE.sub(lambda match: f"{value:g}" if match['value'] else str(labels.get(match['label'], '')),
+                            template)
+
+
+def _over_window(function, matrix, seconds, counter):
+    """``function`` of each row of a ``series × sample`` frame, oldest sample first."""
+    first = matrix.bfill(axis=1).iloc[:, 0]
+    filled = matrix.ffill(axis=1)
+    result = filled.iloc[:, -1] - first
+    if counter and function in ('increase', 'rate'):
+        previous = filled.to_numpy()
+        steps = np.diff(previous, axis=1)
+        # A counter that dropped restarted from zero: add back what it had reached
+        result = result + np.where(steps < 0, previous[:, :-1], 0).sum(axis=1)
+    if function == 'rate':
+        result = result / seconds
+    return result[matrix.notna().sum(axis=1) >= 2]
+
+
+class RuleEngine:
+    """Per-series pending/firing state of a set of :class:`AlertRule`, fed one snapshot at a time.
+
+    :meth:`evaluate` takes the samples of one snapshot as ``{metric:
+    frame}``, each frame indexed by series with its labels and a
+    ``Value`` column (see :func:`snapshot_samples`).
+    """
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self.metrics = {}
+        for rule in self.rules:
+            for metric, window in rule.metrics().items():
+                self.metrics[metric] = max(self.metrics.get(metric, pd.Timedelta(0)), window)
+        self.last = None
+        self.timestamps = []
+        self._windows = {metric: deque() for metric, window in self.metrics.items() if window > pd.Timedelta(0)}
+        self._active = {rule.name: pd.Series(dtype='datetime64[ns, UTC]') for rule in self.rules}
+        self._history = []
+        self._samples = {}
+
+    def _evaluate(self, tree, samples, timestamp):
+        kind = tree[0]
+        if kind == 'number':
+            return tree[1]
+        if kind == 'selector':
+            return _select(samples.get(tree[1]), tree[2])
+        if kind == 'range':
+            function, (_, metric, matchers), window = tree[1:]
+            inside = [_select(frame, matchers) for at, frame in self._windows[metric] if at > timestamp - window]
+            if not inside:
+                return pd.Series(dtype='float64')
+            matrix = pd.concat(inside, axis=1, ignore_index=True)
+            return _over_window(function, matrix, window.total_seconds(), metric.endswith('_total'))
+        op, lhs, rhs = tree[1], self._evaluate(tree[2], samples, timestamp), self._evaluate(tree[3], samples, timestamp)
+        if isinstance(lhs, pd.Series) and isinstance(rhs, pd.Series):
+            # Vector to vector: one-to-one on identical series
+            lhs, rhs = lhs.align(rhs, join='inner')
+        if kind == 'binary':
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return ARITHMETIC[op](lhs, rhs)
+        if not isinstance(lhs, pd.Series) and not isinstance(rhs, pd.Series):
+            raise ValueError("A comparison of two scalars is not an alert expression")
+        holds = COMPARISONS[op](lhs, rhs)
+        vector = lhs if isinstance(lhs, pd.Series) else rhs
+        return vector[holds.to_numpy(dtype=bool)]
+
+    def evaluate(self, timestamp, samples):
+        """Fold in one snapshot taken at ``timestamp``; returns ``{alert: firing series count}``."""
+        timestamp = pd.Timestamp(snapshot_id(timestamp))
+        for metric, window in self._windows.items():
+            window.append((timestamp, samples.get(metric)))
+            while window[0][0] <= timestamp - self.metrics[metric]:
+                window.popleft()
+        firing = {}
+        for rule in self.rules:
+            result = self._evaluate(rule.tree, samples, timestamp)
+            if not isinstance(result, pd.Series):
+                raise ValueError(f"{rule.name}: the expression evaluates to a scalar")
+            # Series that dropped out reset; new ones become pending now
+            since = self._active[rule.name].reindex(result.index).fillna(timestamp)
+            self._active[rule.name] = since
+            state = np.where(timestamp - since >= rule.hold, 'firing', 'pending')
+            firing[rule.name] = int((state == 'firing').sum())
+            if len(result):
+                self._history.append(pd.DataFrame({
+                    'Timestamp': timestamp, 'Alert': rule.name, 'Series': result.index.astype('string'),
+                    'State': state, 'Value': result.to_numpy(dtype='float64'), 'Active_Since': since.to_numpy(),
+                }))
+        self.last = timestamp
+        self.timestamps.append(timestamp)
+        self._samples = samples
+        return firing
+
+    def history(self):
+        """Every pending or firing series at every evaluation."""
+        if not self._history:
+            return pd.DataFrame({'Timestamp': pd.Series(dtype='datetime64[ns, UTC]'), 'Alert': pd.Series(dtype='string'),
+                                 'Series': pd.Series(dtype='string'), 'State': pd.Series(dtype='string'),
+                                 'Value': pd.Series(dtype='float64'),
+                                 'Active_Since': pd.Series(dtype='datetime64[ns, UTC]')})
+        return pd.concat(self._history, ignore_index=True).astype({'Alert': 'string', 'State': 'string'})
+
+    def timeline(self):
+        """Pending and firing series per alert at every evaluation, including the quiet ones."""
+        history = self.history()
+        counts = history.groupby(['Timestamp', 'Alert', 'State'], observed=True).size().unstack('State', fill_value=0)
+        counts = counts.reindex(columns=['pending', 'firing'], fill_value=0)
+        index = pd.MultiIndex.from_product([pd.DatetimeIndex(self.timestamps), [rule.name for rule in self.rules]],
+                                           names=['Timestamp', 'Alert'])
+        return counts.reindex(index, fill_value=0).rename(columns=str.title).reset_index()
+
+    def episodes(self):
+        """One row per continuous activation of a series: when it went pending, fired and was last seen."""
+        history = self.history()
+        keys = ['Alert', 'Series', 'Active_Since']
+        grouped = history.groupby(keys, observed=True)
+        episodes = pd.DataFrame({'Last_Seen': grouped['Timestamp'].max(), 'Peak_Value': grouped['Value'].max(),
+                                 'Evaluations': grouped.size()})
+        episodes['Firing_From'] = history[history['State'] == 'firing'].groupby(keys, observed=True)['Timestamp'].min()
+        active = self.last is not None and episodes['Last_Seen'].eq(self.last)
+        episodes['Ongoing'] = active
+        return (episodes.reset_index().rename(columns={'Active_Since': 'Pending_From'})
+                [['Alert', 'Series', 'Pending_From', 'Firing_From', 'Last_Seen', 'Evaluations', 'Peak_Value', 'Ongoing']]
+                .sort_values(['Pending_From', 'Alert', 'Series'], ignore_index=True))
+
+    def alerts(self):
+        """Series pending or firing at the last evaluation, with labels and rendered annotations."""
+        history = self.history()
+        current = history[history['Timestamp'] == self.last] if self.last is not None else history
+        rules = {rule.name: rule for rule in self.rules}
+        frames = [frame.drop(columns='Value') for frame in self._samples.values() if frame is not None]
+        labels = pd.concat(frames) if frames else pd.DataFrame(index=pd.Index([], dtype='string'))
+        labels = labels[~labels.index.duplicated()]
+        rows = []
+        for row in current.itertuples(index=False):
+            rule = rules[row.Alert]
+            series_labels = labels.loc[row.Series].dropna().to_dict() if row.Series in labels.index else {}
+            series_labels.update(rule.labels)
+            rows.append({'Alert': row.Alert, 'Series': row.Series, 'State': row.State,
+                         'Severity': rule.labels.get('severity'), 'Active_Since': row.Active_Since, 'Value': row.Value,
+                         'Summary': _render(rule.annotations.get('summary', ''), series_labels, row.Value),
+                         'Description': _render(rule.annotations.get('description', ''), series_labels, row.Value)})
+        return pd.DataFrame(rows, columns=['Alert', 'Series', 'State', 'Severity', 'Active_Since', 'Value', 'Summary',
+                                           'Description'])
+
+
+def _pod_samples(path, metrics):
+    columns = sorted({POD_METRICS[metric][0] for metric in metrics})
+    table = pq.read_table(path, columns=['Depth', 'Namespace', 'Workload', 'Pod', *columns], filters=[('Depth', '=', 4)])
+    pods = table.to_pandas()
+    labels = pd.DataFrame({'namespace': pods['Namespace'].astype('string'), 'workload': pods['Workload'].astype('string'),
+                           'pod': pods['Pod'].astype('string')})
+    labels.index = pd.Index(labels['namespace'] + '/' + labels['pod'], name='Series')
+    samples = {}
+    for metric in metrics:
+        column, scale = POD_METRICS[metric]
+        values = pods[column].to_numpy(dtype='float64') * scale
+        if column.endswith('_Limit_Mi'):
+            # Unlimited pods have no limit series
+            keep = values > 0
+        else:
+            keep = ~np.isnan(values)
+        samples[metric] = labels[keep].assign(Value=values[keep])
+    return samples
+
+
+def _node_samples(frame, metrics):
+    samples = {}
+    nodes = frame['Node'].astype('string')
+    for metric in metrics:
+        column, scale = NODE_METRICS[metric]
+        if column not in frame:
+            continue
+        values = frame[column].to_numpy(dtype='float64', na_value=np.nan) * scale
+        keep = ~np.isnan(values)
+        samples[metric] = pd.DataFrame({'node': nodes[keep].to_numpy(), 'Value': values[keep]},
+                                       index=pd.Index(nodes[keep].to_numpy(), name='Series', dtype='string'))
+    return samples
+
+
+def snapshot_samples(store, cluster, metrics, after=None):
+    """Yield ``(timestamp, {metric: frame})`` for each snapshot after ``after``, oldest first.
+
+    Snapshots are skipped when they lack a source the metrics need (a
+    rollup cube for pod metrics), so a rule never sees its series vanish
+    for want of data. Node frames are read a day partition at a time.
+    """
+    unknown = set(metrics) - set(POD_METRICS) - set(NODE_METRICS)
+    if unknown:
+        raise ValueError(f"No snapshot data for {', '.join(sorted(unknown))}; known metrics are "
+                         f"{', '.join(sorted({*POD_METRICS, *NODE_METRICS}))}")
+    pod_metrics = [metric for metric in metrics if metric in POD_METRICS]
+    node_metrics = [metric for metric in metrics if metric in NODE_METRICS]
+    manifest = store.snapshots(cluster)
+    snapshots = pd.to_datetime(manifest['Snapshot'], utc=True)
+    if after is not None:
+        manifest = manifest[(snapshots > pd.Timestamp(snapshot_id(after))).to_numpy()]
+    if pod_metrics:
+        has_rollup = [os.path.exists(store.rollup_path(cluster, sid)) for sid in manifest['Snapshot']]
+        manifest = manifest[np.array(has_rollup, dtype=bool)]
+    for date, day in manifest.groupby('Date', sort=True):
+        nodes = None
+        if node_metrics:
+            columns = ['Node', *dict.fromkeys(NODE_METRICS[metric][0] for metric in node_metrics)]
+            frame = store.read_range(cluster, day['Snapshot'].min(), day['Snapshot'].max(), columns=columns)
+            nodes = dict(tuple(frame.groupby('Snapshot')))
+        for sid in sorted(day['Snapshot']):
+            timestamp = pd.Timestamp(sid)
+            samples = _pod_samples(store.rollup_path(cluster, sid), pod_metrics) if pod_metrics else {}
+            if node_metrics:
+                samples.update(_node_samples(nodes.get(timestamp, pd.DataFrame({'Node': []})), node_metrics))
+            yield timestamp, samples
+
+
+def backtest(engine, store, cluster):
+    """Evaluate ``engine`` over the snapshots of ``cluster`` it has not seen yet; returns how many."""
+    evaluated = 0
+    for timestamp, samples in snapshot_samples(store, cluster, list(engine.metrics), after=engine.last):
+        engine.evaluate(timestamp, samples)
+        evaluated += 1
+    return evaluated
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m kube_reports.rules', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--root', default=os.environ.get('KUBE_REPORTS_SNAPSHOT_DIR', 'snapshots'))
+    parser.add_argument('--cluster', required=True)
+    parser.add_argument('--rules', help='Prometheus rule file (default: the sample memory alerts)')
+    parser.add_argument('--out', help='write the pending/firing history to this CSV')
+    args = parser.parse_args(argv)
+
+    if args.rules:
+        with open(args.rules, encoding='utf-8') as handle:
+            rules = parse_rules(handle.read())
+    else:
+        rules = parse_rules(SAMPLE_RULES)
+    started = time.perf_counter()
+    engine = RuleEngine(rules)
+    evaluated = backtest(engine, SnapshotStore(args.root), args.cluster)
+    print(f"{len(rules)} rules over {evaluated:,} snapshots in {time.perf_counter() - started:.1f}s")
+    episodes = engine.episodes()
+    print(episodes.groupby('Alert')['Firing_From'].count().rename('Fired').to_string())
+    print(engine.alerts().head(20).to_string(index=False))
+    if args.out:
+        engine.history().to_csv(args.out, index=False)
+
+
+if __name__ == '__main__':
+    main()
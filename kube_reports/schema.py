@@ -0,0 +1,167 @@
+"""Compact column types for the node, pod and namespace frames.
+
+Names (nodes, namespaces, clusters, pod phases) repeat across rows, so
+they are stored as categoricals: one dictionary plus a small integer code
+per row. Status and priority are already categoricals of the bands in
+:mod:`kube_reports.classify`, i.e. one-byte enum codes. Metrics are
+downcast to ``int32``, or the nullable ``Int32`` when a dump has gaps, and
+capacities to ``float32``.
+
+:func:`compact` applies a schema and notes the deep memory of the columns
+it changed, before and after, in the frame's ``attrs``. Frames come to a
+page through :func:`kube_reports.cache.load_frame`, which adds that note
+to the session's :class:`FootprintStats`. The sidebars show that total,
+so the saving is measured on the frames this session actually loaded.
+"""
+
+import uuid
+
+import pandas as pd
+
+NODE_SCHEMA = {
+    'Node': 'category',
+    'Memory_Usage_Percent': 'int32',
+    'Memory_Usage_Mi': 'int32',
+    'Memory_Usage_P50_Percent': 'int32',
+    'Memory_Usage_P95_Percent': 'int32',
+    'Memory_Usage_P99_Percent': 'int32',
+    'Memory_Usage_Max_Percent': 'int32',
+    'Memory_Overcommit_Percent': 'int32',
+    'CPU_Usage_Percent': 'int32',
+    'CPU_Usage_Mi': 'int32',
+    'Pods': 'int32',
+    'Status': 'category',
+    'Priority': 'category',
+    'Memory_Limit_Mi': 'float32',
+    'Allocatable_Memory_Mi': 'float32',
+    'Allocatable_CPU_Mi': 'float32',
+}
+
+POD_SCHEMA = {
+    'Namespace': 'category',
+    'Node': 'category',
+    'Phase': 'category',
+    'Memory_Request_Mi': 'float32',
+    'Memory_Limit_Mi': 'float32',
+}
+
+NAMESPACE_SCHEMA = {
+    'Cluster': 'category',
+    'Namespace': 'category',
+    'CPU_Usage_Percent': 'int32',
+    'Memory_Usage_Percent': 'int32',
+    'Pod_Count': 'int32',
+    'CPU_Usage_m': 'int32',
+    'Memory_Usage_Mi': 'int32',
+    'CPU_Limit_m': 'int32',
+    'Memory_Limit_Mi': 'int32',
+    'CPU_Limited_Usage_m': 'int32',
+    'Memory_Limited_Usage_Mi': 'int32',
+    'Status': 'category',
+}
+
+
+ROLLUP_SCHEMA = {
+    'Depth': 'int8',
+    'Cluster': 'category',
+    'Namespace': 'category',
+    'Workload': 'category',
+    'Pod': 'category',
+    'Pod_Count': 'int32',
+    'CPU_Usage_m': 'float32',
+    'Memory_Usage_Mi': 'float32',
+    'CPU_Limit_m': 'float32',
+    'Memory_Limit_Mi': 'float32',
+    'CPU_Limited_Usage_m': 'float32',
+    'Memory_Limited_Usage_Mi': 'float32',
+}
+
+
+# Key of the (id, before, after) note in a compacted frame's attrs, and of the stats in session state
+FOOTPRINT_KEY = 'frame_footprint'
+
+
+class FootprintStats:
+    """Deep memory of one session's frames before and after :func:`compact`.
+
+    Entries are keyed by the compaction that wrote the note, so a frame
+    served again on a rerun, or a frame derived from it that carries the
+    same note, is counted once.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def record(self, key, before, after):
+        self._entries[key] = (before, after)
+
+    @property
+    def frames(self):
+        return len(self._entries)
+
+    @property
+    def before(self):
+        return sum(before for before, _ in self._entries.values())
+
+    @property
+    def after(self):
+        return sum(after for _, after in self._entries.values())
+
+    @property
+    def ratio(self):
+        return self.before / self.after if self.after else 0.0
+
+    def reset(self):
+        self._entries.clear()
+
+    def as_dict(self):
+        return {"frames": self.frames, "before_bytes": self.before, "after_bytes": self.after,
+                "ratio": round(self.ratio, 2)}
+
+
+def session_footprint(session_state):
+    """The session's :class:`FootprintStats`, created on first use."""
+    if FOOTPRINT_KEY not in session_state:
+        session_state[FOOTPRINT_KEY] = FootprintStats()
+    return session_state[FOOTPRINT_KEY]
+
+
+def _target(series, kind):
+    if kind == 'int32':
+        # Keep gaps (kubectl top has no pod counts) as <NA> rather than failing the cast
+        return 'Int32' if series.isna().any() else 'int32'
+    return kind
+
+
+def compact(frame, schema, record=True):
+    """``frame`` with the columns named in ``schema`` cast to their compact types.
+
+    Columns the schema does not mention are left alone. Categoricals keep
+    their category order, so band order survives. With ``record``, the
+    bytes of the changed columns before and after are noted in
+    ``attrs[FOOTPRINT_KEY]``; pass ``record=False`` when re-compacting a
+    frame that was already recorded, so its columns are not counted twice.
+    """
+    dtypes = {}
+    for name, kind in schema.items():
+        if name not in frame.columns:
+            continue
+        series = frame[name]
+        if kind == 'category' and isinstance(series.dtype, pd.CategoricalDtype):
+            continue
+        if kind == 'int32' and pd.api.types.is_float_dtype(series.dtype):
+            series = series.round()
+            frame = frame.assign(**{name: series})
+        target = _target(series, kind)
+        if series.dtype != target:
+            dtypes[name] = target
+    if not dtypes:
+        return frame
+    compacted = frame.astype(dtypes)
+    if record:
+        columns = list(dtypes)
+        compacted.attrs = {**compacted.attrs, FOOTPRINT_KEY: (
+            uuid.uuid4().hex,
+            int(frame[columns].memory_usage(deep=True, index=False).sum()),
+            int(compacted[columns].memory_usage(deep=True, index=False).sum()))}
+    return compacted
@@ -0,0 +1,167 @@
+"""Grouped DDSketch quantiles with a fixed relative error.
+
+A DDSketch maps each positive value ``x`` to the bucket
+``ceil(log(x) / log(gamma))`` with ``gamma = (1 + a) / (1 - a)``, and only
+counts how many values land in each bucket. Any quantile read back from the
+counts is within a relative error ``a`` of the true value. The sketch's
+size depends on the range of the values (about 700 buckets cover 1 Mi to
+1 Ti at 1%) and not on how many values were added.
+
+:class:`GroupedSketch` keeps one such sketch per group (a node, say) in a
+single Series keyed on ``(group, bucket)``. A batch of values is folded in
+with one ``groupby`` per batch instead of a Python call per value. Zero
+and negative values go into a separate per-group zero count, and the
+exact minimum and maximum are kept next to the buckets.
+
+Sketches with the same accuracy merge exactly: merging a shard's (or an
+hour's) sketch into another gives the sketch of their combined samples.
+Windows can therefore be saved as small Parquet files (:meth:`save`) and
+combined later (:meth:`GroupedSketch.merged`) without any raw samples.
+"""
+
+import glob
+import math
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DEFAULT_ACCURACY = 0.01
+
+
+def _sum(total, counts, level):
+    counts = counts.groupby(level=level).sum()
+    return counts if total.empty else pd.concat([total, counts]).groupby(level=level).sum()
+
+
+class GroupedSketch:
+    """Per-group DDSketches over non-negative values."""
+
+    def __init__(self, relative_accuracy=DEFAULT_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be in (0, 1), not {relative_accuracy!r}")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = pd.Series(dtype='int64', index=pd.MultiIndex.from_arrays([[], []], names=['Group', 'Bucket']))
+        self.zeros = pd.Series(dtype='int64')
+        self.extremes = pd.DataFrame({'min': pd.Series(dtype='float64'), 'max': pd.Series(dtype='float64')})
+
+    def add(self, groups, values):
+        """Fold ``values`` (aligned with ``groups``) into each group's sketch; NaNs are skipped."""
+        groups = np.asarray(groups, dtype=object)
+        values = np.asarray(values, dtype='float64')
+        known = ~np.isnan(values) & pd.notna(groups)
+        groups, values = groups[known], values[known]
+        if not len(values):
+            return self
+        positive = values > 0
+        buckets = np.ceil(np.log(values[positive]) / self._log_gamma).astype('int64')
+        index = pd.MultiIndex.from_arrays([groups[positive], buckets], names=['Group', 'Bucket'])
+        self.buckets = _sum(self.buckets, pd.Series(1, index=index), level=[0, 1])
+        self.zeros = _sum(self.zeros, pd.Series(1, index=groups[~positive]), level=0)
+        self._merge_extremes(pd.Series(values, index=groups).groupby(level=0).agg(['min', 'max']))
+        return self
+
+    def _merge_extremes(self, extremes):
+        self.extremes = extremes if self.extremes.empty else (
+            pd.concat([self.extremes, extremes]).groupby(level=0).agg({'min': 'min', 'max': 'max'}))
+
+    def merge(self, other):
+        """Fold ``other`` in, so this becomes the sketch of both inputs' values."""
+        if not math.isclose(other.relative_accuracy, self.relative_accuracy):
+            raise ValueError(f"Cannot merge sketches of accuracy {other.relative_accuracy} and "
+                             f"{self.relative_accuracy}")
+        if len(other.buckets):
+            self.buckets = _sum(self.buckets, other.buckets, level=[0, 1])
+        if len(other.zeros):
+            self.zeros = _sum(self.zeros, other.zeros, level=0)
+        if len(other.extremes):
+            self._merge_extremes(other.extremes)
+        return self
+
+    @classmethod
+    def merged(cls, paths):
+        """One sketch merged from saved sketch files; ``paths`` may contain glob patterns."""
+        files = sorted({path for pattern in paths for path in (glob.glob(pattern) or [pattern])})
+        if not files:
+            raise ValueError("No sketch files given")
+        sketch = cls.load(files[0])
+        for path in files[1:]:
+            sketch.merge(cls.load(path))
+        return sketch
+
+    @property
+    def min(self):
+        return self.extremes['min']
+
+    @property
+    def max(self):
+        return self.extremes['max']
+
+    def to_frame(self):
+        """Long form: one row per (group, bucket) count, plus one per group with its zeros, min and max."""
+        buckets = self.buckets.rename('Count').reset_index()
+        groups = self.extremes.index
+        summary = pd.DataFrame({
+            'Group': groups, 'Bucket': pd.NA,
+            'Count': self.zeros.reindex(groups, fill_value=0).to_numpy(dtype='int64'),
+            'Min': self.extremes['min'].to_numpy(), 'Max': self.extremes['max'].to_numpy(),
+        })
+        frame = pd.concat([buckets, summary], ignore_index=True)
+        return frame.astype({'Group': 'string', 'Bucket': 'Int64', 'Count': 'int64'})
+
+    @classmethod
+    def from_frame(cls, frame, relative_accuracy=DEFAULT_ACCURACY):
+        sketch = cls(relative_accuracy)
+        summary = frame['Bucket'].isna().to_numpy()
+        buckets = frame[~summary]
+        if len(buckets):
+            index = pd.MultiIndex.from_arrays([buckets['Group'].to_numpy(dtype=object),
+                                               buckets['Bucket'].to_numpy(dtype='int64')], names=['Group', 'Bucket'])
+            sketch.buckets = pd.Series(buckets['Count'].to_numpy(dtype='int64'), index=index)
+        rows = frame[summary].set_index(pd.Index(frame.loc[summary, 'Group'].to_numpy(dtype=object)))
+        sketch.zeros = rows['Count'].astype('int64')[rows['Count'].to_numpy() > 0]
+        sketch.extremes = pd.DataFrame({'min': rows['Min'].astype('float64'), 'max': rows['Max'].astype('float64')})
+        return sketch
+
+    def save(self, path):
+        """Write the sketch as Parquet; the accuracy travels in the file metadata."""
+        table = pa.Table.from_pandas(self.to_frame(), preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), b'relative_accuracy': str(self.relative_accuracy).encode()}
+        pq.write_table(table.replace_schema_metadata(metadata), path)
+
+    @classmethod
+    def load(cls, path):
+        table = pq.read_table(path)
+        accuracy = float((table.schema.metadata or {}).get(b'relative_accuracy', DEFAULT_ACCURACY))
+        return cls.from_frame(table.to_pandas(), accuracy)
+
+    def counts(self):
+        """Number of values added per group."""
+        positive = self.buckets.groupby(level='Group').sum() if len(self.buckets) else pd.Series(dtype='int64')
+        return positive.add(self.zeros, fill_value=0).astype('int64')
+
+    def quantile(self, q):
+        """``q``-quantile (0 to 1) of every group, each within the relative accuracy."""
+        counts = self.counts()
+        if counts.empty:
+            return pd.Series(dtype='float64', name=q)
+        rank = np.floor(q * (counts - 1))
+        # Values at or below zero sort first; a rank inside them is 0
+        zeros = self.zeros.reindex(counts.index, fill_value=0)
+        result = pd.Series(0.0, index=counts.index, name=q)
+        buckets = self.buckets.sort_index()
+        if len(buckets):
+            cumulative = buckets.groupby(level='Group').cumsum()
+            groups = buckets.index.get_level_values('Group')
+            reached = cumulative.to_numpy() + zeros.reindex(groups).to_numpy() > rank.reindex(groups).to_numpy()
+            # First bucket per group whose running count passes the rank
+            first = pd.Series(reached, index=buckets.index).groupby(level='Group').idxmax()
+            keys = np.array([bucket for _, bucket in first.to_numpy()], dtype='float64')
+            values = pd.Series(2 * self.gamma ** keys / (self.gamma + 1), index=first.index)
+            above_zeros = rank.reindex(values.index) >= zeros.reindex(values.index)
+            result.loc[values.index[above_zeros.to_numpy()]] = values[above_zeros]
+        # Clamp to what was actually seen so p100 is the exact maximum
+        return result.clip(lower=self.min.reindex(result.index), upper=self.max.reindex(result.index))
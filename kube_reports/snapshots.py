@@ -0,0 +1,251 @@
+"""Local, partitioned store of node metric snapshots.
+
+Every collection run is appended as its own Parquet file under a Hive-style
+``cluster=<name>/date=<YYYY-MM-DD>/`` partition, and each cluster keeps an
+append-only ``_manifest.csv`` listing its snapshots so pickers never have
+to scan data files. :meth:`SnapshotStore.compact` folds a finished day's
+run files into one ``day.parquet`` with one row group per snapshot, which
+keeps a year of 5-minute runs at one file per cluster-day. A snapshot can
+carry a namespace rollup cube (:mod:`kube_reports.rollup`), stored beside
+its run file as ``rollup-<snapshot>.parquet`` and left alone by compaction.
+
+Reads open only the partitions covering the requested snapshots, project
+only the requested columns and go through a memory-mapped filesystem, so
+a page pays for what it plots rather than for the store's size.
+
+Usage::
+
+    python -m kube_reports.snapshots append --root snapshots --cluster prod top-nodes.txt
+    python -m kube_reports.snapshots append --root snapshots --cluster prod top-nodes.txt \
+        --pods pods.json --pod-metrics pod-metrics.json
+    python -m kube_reports.snapshots list --root snapshots --cluster prod
+    python -m kube_reports.snapshots compact --root snapshots --cluster prod
+"""
+
+import argparse
+import csv
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+
+SNAPSHOT_COLUMN = 'Snapshot'
+MANIFEST_NAME = '_manifest.csv'
+COMPACTED_NAME = 'day.parquet'
+ROLLUP_PREFIX = 'rollup-'
+
+_MMAP_FS = pafs.LocalFileSystem(use_mmap=True)
+_INT_TYPES = {pa.int8(), pa.int16(), pa.int32(), pa.int64()}
+
+
+def snapshot_id(taken_at):
+    """Canonical snapshot identifier (UTC, second resolution)."""
+    ts = pd.Timestamp(taken_at)
+    ts = ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+    return ts.floor('s').strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _file_stamp(sid):
+    return sid.replace(':', '').replace('-', '')
+
+
+def _nullable_ints(arrow_type):
+    # Keep integer metrics integer when a snapshot has gaps
+    return pd.Int64Dtype() if arrow_type in _INT_TYPES else None
+
+
+def _plain(table):
+    # Categoricals are an in-memory layout; store their values so every run file has one schema
+    fields = [pa.field(field.name, field.type.value_type) if pa.types.is_dictionary(field.type) else field
+              for field in table.schema]
+    return table.cast(pa.schema(fields))
+
+
+class SnapshotStore:
+    """Append-only snapshot store rooted at a local directory."""
+
+    def __init__(self, root):
+        self.root = os.fspath(root)
+
+    def _cluster_dir(self, cluster):
+        return os.path.join(self.root, f'cluster={cluster}')
+
+    def _partition_dir(self, cluster, date):
+        return os.path.join(self._cluster_dir(cluster), f'date={date}')
+
+    def clusters(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name.split('=', 1)[1] for name in os.listdir(self.root)
+                      if name.startswith('cluster='))
+
+    def snapshots(self, cluster):
+        """Manifest of ``cluster`` as a frame of ``Snapshot``, ``Date``, ``Rows``."""
+        path = os.path.join(self._cluster_dir(cluster), MANIFEST_NAME)
+        if not os.path.exists(path):
+            return pd.DataFrame({'Snapshot': pd.Series(dtype=str), 'Date': pd.Series(dtype=str),
+                                 'Rows': pd.Series(dtype='int64')})
+        return pd.read_csv(path, dtype={'Snapshot': str, 'Date': str, 'Rows': 'int64'})
+
+    def append(self, frame, cluster, taken_at=None):
+        """Write one collection run and return its snapshot id.
+
+        Ids have one-second resolution; a second run within the same second
+        raises ``ValueError`` rather than overwriting the first.
+        """
+        sid = snapshot_id(taken_at if taken_at is not None else datetime.now(timezone.utc))
+        if (self.snapshots(cluster)['Snapshot'] == sid).any():
+            raise ValueError(f"Cluster {cluster!r} already has a snapshot {sid}")
+        date = sid[:10]
+        partition = self._partition_dir(cluster, date)
+        os.makedirs(partition, exist_ok=True)
+
+        table = _plain(pa.Table.from_pandas(frame, preserve_index=False))
+        stamp = pa.array([pd.Timestamp(sid)] * len(frame), type=pa.timestamp('s', tz='UTC'))
+        table = table.append_column(SNAPSHOT_COLUMN, stamp)
+        run_name = f"run-{_file_stamp(sid)}.parquet"
+        pq.write_table(table, os.path.join(partition, run_name))
+
+        manifest = os.path.join(self._cluster_dir(cluster), MANIFEST_NAME)
+        new_manifest = not os.path.exists(manifest)
+        with open(manifest, 'a', newline='') as handle:
+            writer = csv.writer(handle)
+            if new_manifest:
+                writer.writerow(['Snapshot', 'Date', 'Rows'])
+            writer.writerow([sid, date, len(frame)])
+        return sid
+
+    def _files(self, cluster, dates):
+        files = []
+        for date in sorted(set(dates)):
+            partition = self._partition_dir(cluster, date)
+            if os.path.isdir(partition):
+                files.extend(os.path.join(partition, name) for name in sorted(os.listdir(partition))
+                             if name.endswith('.parquet') and not name.startswith(ROLLUP_PREFIX))
+        return files
+
+    def _scan(self, cluster, dates, columns, filter):
+        files = self._files(cluster, dates)
+        if not files:
+            raise KeyError(f"No snapshots for cluster {cluster!r} on {sorted(set(dates))}")
+        dataset = ds.dataset(files, format='parquet', filesystem=_MMAP_FS)
+        if columns is not None:
+            columns = list(dict.fromkeys(list(columns) + [SNAPSHOT_COLUMN]))
+        table = dataset.to_table(columns=columns, filter=filter)
+        return table.to_pandas(types_mapper=_nullable_ints)
+
+    def read(self, cluster, snapshot, columns=None):
+        """One snapshot as a node frame, reading only ``columns`` from its day partition."""
+        sid = snapshot_id(snapshot)
+        stamp = pa.scalar(pd.Timestamp(sid), type=pa.timestamp('s', tz='UTC'))
+        frame = self._scan(cluster, [sid[:10]], columns, pc.field(SNAPSHOT_COLUMN) == stamp)
+        return frame.drop(columns=SNAPSHOT_COLUMN).reset_index(drop=True)
+
+    def read_range(self, cluster, start, end, columns=None):
+        """All snapshots in ``[start, end]``, touching only the day partitions in range."""
+        start, end = pd.Timestamp(snapshot_id(start)), pd.Timestamp(snapshot_id(end))
+        dates = pd.date_range(start.normalize(), end.normalize(), freq='D').strftime('%Y-%m-%d')
+        expr = ((pc.field(SNAPSHOT_COLUMN) >= pa.scalar(start, type=pa.timestamp('s', tz='UTC')))
+                & (pc.field(SNAPSHOT_COLUMN) <= pa.scalar(end, type=pa.timestamp('s', tz='UTC'))))
+        return self._scan(cluster, list(dates), columns, expr)
+
+    def rollup_path(self, cluster, snapshot):
+        sid = snapshot_id(snapshot)
+        return os.path.join(self._partition_dir(cluster, sid[:10]), f"{ROLLUP_PREFIX}{_file_stamp(sid)}.parquet")
+
+    def write_rollup(self, cube, cluster, snapshot):
+        """Persist ``cube`` (a :class:`kube_reports.rollup.RollupCube`) next to ``snapshot``."""
+        path = self.rollup_path(cluster, snapshot)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        cube.save(path)
+        return path
+
+    def rollups(self, cluster):
+        """Snapshots of ``cluster`` that have a rollup cube, oldest first."""
+        return [sid for sid in self.snapshots(cluster)['Snapshot']
+                if os.path.exists(self.rollup_path(cluster, sid))]
+
+    def read_rollup(self, cluster, snapshot):
+        from kube_reports.rollup import RollupCube
+
+        return RollupCube.load(self.rollup_path(cluster, snapshot))
+
+    def compact(self, cluster, date=None):
+        """Merge each finished day's run files into ``day.parquet``.
+
+        Today's partition (UTC) is left alone unless ``date`` names it
+        explicitly, because collection runs are still landing there.
+        """
+        today = snapshot_id(datetime.now(timezone.utc))[:10]
+        cluster_dir = self._cluster_dir(cluster)
+        if date is not None:
+            dates = [date]
+        else:
+            dates = [name.split('=', 1)[1] for name in sorted(os.listdir(cluster_dir))
+                     if name.startswith('date=') and name.split('=', 1)[1] < today]
+        compacted = []
+        for day in dates:
+            files = self._files(cluster, [day])
+            runs = [path for path in files if os.path.basename(path).startswith('run-')]
+            if not runs:
+                continue
+            table = pa.concat_tables([_plain(pq.read_table(path)) for path in files],
+                                     promote_options='permissive')
+            table = table.sort_by(SNAPSHOT_COLUMN)
+            target = os.path.join(self._partition_dir(cluster, day), COMPACTED_NAME)
+            tmp = target + '.tmp'
+            # One row group per snapshot so single-snapshot reads skip the rest of the day
+            stamps = table.column(SNAPSHOT_COLUMN).to_numpy()
+            bounds = [0, *(np.flatnonzero(stamps[1:] != stamps[:-1]) + 1), len(stamps)]
+            with pq.ParquetWriter(tmp, table.schema) as writer:
+                for lo, hi in zip(bounds[:-1], bounds[1:]):
+                    writer.write_table(table.slice(lo, hi - lo))
+            os.replace(tmp, target)
+            for path in runs:
+                os.remove(path)
+            compacted.append(day)
+        return compacted
+
+
+def main(argv=None):
+    from kube_reports.ingest import load_nodes
+
+    parser = argparse.ArgumentParser(prog='python -m kube_reports.snapshots', description=__doc__.split('\n\n')[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+    append = sub.add_parser('append', help='load a metrics dump and append it as a snapshot')
+    append.add_argument('source', help='kubectl top / metrics-server JSON / Prometheus export file')
+    append.add_argument('--taken-at', help='snapshot time (defaults to now, UTC)')
+    append.add_argument('--pods', help='kubectl get pods -A -o json dump; stores a namespace rollup cube')
+    append.add_argument('--pod-metrics', help='metrics-server PodMetricsList for the rollup usage')
+    listing = sub.add_parser('list', help='list the snapshots of a cluster')
+    compact = sub.add_parser('compact', help='merge finished days into one file each')
+    compact.add_argument('--date', help='compact only this YYYY-MM-DD partition')
+    for command in (append, listing, compact):
+        command.add_argument('--root', default=os.environ.get('KUBE_REPORTS_SNAPSHOT_DIR', 'snapshots'))
+        command.add_argument('--cluster', required=True)
+    args = parser.parse_args(argv)
+
+    store = SnapshotStore(args.root)
+    if args.command == 'append':
+        sid = store.append(load_nodes(args.source), args.cluster, args.taken_at)
+        if args.pods:
+            from kube_reports.rollup import RollupCube, pod_usage
+
+            cube = RollupCube.from_pods(pod_usage(args.pods, args.pod_metrics, args.cluster))
+            store.write_rollup(cube, args.cluster, sid)
+        print(sid)
+    elif args.command == 'list':
+        print(store.snapshots(args.cluster).to_string(index=False))
+    else:
+        for day in store.compact(args.cluster, args.date):
+            print(f"compacted {day}")
+
+
+if __name__ == '__main__':
+    main()
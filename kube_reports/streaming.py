@@ -0,0 +1,234 @@
+"""Bounded-memory aggregation of large metrics exports, one batch at a time.
+
+A cluster-day export (several GB) is never loaded whole. JSON lines and
+CSV are read ``CHUNK_ROWS`` records at a time through pandas' chunked
+readers, and Prometheus text through fixed-size batches of lines. Each
+batch is normalized to (``Timestamp``, ``Metric``, ``Node``,
+``Namespace``, ``Value``) in the dashboard's units and folded into
+:class:`ExportAggregates`. Only the aggregates are kept, so memory grows
+with the number of nodes and namespaces, never with the number of
+samples:
+
+- per node: a :class:`~kube_reports.sketch.GroupedSketch` of memory usage
+  (p50/p95/p99 within 1%, exact max) and the last allocatable memory;
+- per namespace: summed memory and CPU samples, from which the mean
+  usage per scrape follows.
+
+JSON lines and CSV records carry ``metric``, ``value`` and optional
+``timestamp``, ``node`` and ``namespace`` fields, and Prometheus text is
+the exposition format (with optional timestamps). Gzipped files are read
+as they are::
+
+    python -m kube_reports.streaming export.jsonl.gz --nodes-out nodes.csv --namespaces-out namespaces.csv
+
+``--sketch-out`` saves the node memory sketch itself. Sketches of separate
+shards or time ranges merge into the sketch of all of them, which the
+node-comparison dashboard reads to show p95 and p99 per node::
+
+    python -m kube_reports.streaming shard-a.prom --sketch-out sketches/2024-10-01-a.parquet
+"""
+
+import argparse
+import gzip
+import itertools
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from kube_reports.ingest import _PROM_LINE_RE, MEMORY_STATISTICS, PROMETHEUS_METRICS
+from kube_reports.sketch import GroupedSketch
+
+CHUNK_ROWS = int(os.environ.get("KUBE_REPORTS_CHUNK_ROWS", 200_000))
+
+# Container series -> (namespace column, scale to the column's unit)
+NAMESPACE_METRICS = {
+    'container_memory_working_set_bytes': ('Memory_Usage_Mi', 1 / 2 ** 20),
+    'node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate': ('CPU_Usage_m', 1000.0),
+}
+
+NODE_MEMORY_METRIC = 'node_memory_working_set_bytes'
+NODE_ALLOCATABLE_METRIC = 'kube_node_status_allocatable_memory_bytes'
+
+STREAM_COLUMNS = ['Timestamp', 'Metric', 'Node', 'Namespace', 'Value']
+
+_PROM_SAMPLE_RE = _PROM_LINE_RE + r'(?:\s+(?P<timestamp>-?[0-9]+))?'
+
+
+def _open_text(path):
+    if os.fspath(path).endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, encoding='utf-8')
+
+
+def detect_stream_format(path):
+    """``jsonl``, ``csv`` or ``prometheus`` from the file name, else from its first line."""
+    name = os.fspath(path).removesuffix('.gz')
+    for suffixes, kind in ((('.jsonl', '.ndjson'), 'jsonl'), (('.csv',), 'csv'), (('.prom',), 'prometheus')):
+        if name.endswith(suffixes):
+            return kind
+    with _open_text(path) as handle:
+        first = next((line for line in handle if line.strip()), '').lstrip()
+    if first.startswith('{'):
+        return 'jsonl'
+    if first.startswith('#') or '{' in first.split(None, 1)[0]:
+        return 'prometheus'
+    return 'csv'
+
+
+def _label(labels, name):
+    return labels.str.extract(rf'(?:^|,)\s*{name}="([^"]*)"', expand=False)
+
+
+def _prometheus_batches(path, chunk_rows):
+    with _open_text(path) as handle:
+        while True:
+            lines = list(itertools.islice(handle, chunk_rows))
+            if not lines:
+                return
+            lines = pd.Series(lines, dtype='string').str.rstrip('\n')
+            lines = lines[~lines.str.startswith('#') & (lines.str.strip() != '')]
+            parsed = lines.str.extract(_PROM_SAMPLE_RE)
+            yield pd.DataFrame({
+                'timestamp': parsed['timestamp'], 'metric': parsed['metric'],
+                'node': _label(parsed['labels'], 'node'), 'namespace': _label(parsed['labels'], 'namespace'),
+                'value': parsed['value'],
+            })
+
+
+def _raw_batches(path, format, chunk_rows):
+    if format == 'jsonl':
+        with pd.read_json(path, lines=True, chunksize=chunk_rows, dtype=False) as reader:
+            yield from reader
+    elif format == 'csv':
+        with pd.read_csv(path, chunksize=chunk_rows, dtype={'node': 'string', 'namespace': 'string'}) as reader:
+            yield from reader
+    elif format == 'prometheus':
+        yield from _prometheus_batches(path, chunk_rows)
+    else:
+        raise ValueError(f"Unknown export format {format!r}; expected jsonl, csv or prometheus")
+
+
+def _scales():
+    scales = {metric: scale for metric, (_, scale) in PROMETHEUS_METRICS.items()}
+    scales.update((metric, scale) for metric, (_, scale) in NAMESPACE_METRICS.items())
+    return pd.Series(scales, dtype='float64')
+
+
+def read_batches(path, format=None, chunk_rows=CHUNK_ROWS):
+    """Yield ``STREAM_COLUMNS`` frames of at most ``chunk_rows`` samples each.
+
+    Samples of series the dashboards do not use are dropped; values are
+    scaled to the units of the node and namespace frames.
+    """
+    format = format or detect_stream_format(path)
+    scales = _scales()
+    for raw in _raw_batches(path, format, chunk_rows):
+        raw = raw.reindex(columns=['timestamp', 'metric', 'node', 'namespace', 'value'])
+        metric = raw['metric'].astype('string')
+        scale = metric.map(scales).to_numpy(dtype='float64', na_value=np.nan)
+        batch = pd.DataFrame({
+            'Timestamp': pd.to_numeric(raw['timestamp'], errors='coerce'),
+            'Metric': metric,
+            'Node': raw['node'].astype('string'),
+            'Namespace': raw['namespace'].astype('string'),
+            'Value': pd.to_numeric(raw['value'], errors='coerce').to_numpy(dtype='float64') * scale,
+        })
+        yield batch[~np.isnan(scale)].reset_index(drop=True)
+
+
+class ExportAggregates:
+    """Per-node memory quantiles and per-namespace sums, folded batch by batch."""
+
+    def __init__(self, relative_accuracy=None):
+        self.node_memory = GroupedSketch() if relative_accuracy is None else GroupedSketch(relative_accuracy)
+        self.allocatable = pd.Series(dtype='float64', name='Allocatable_Memory_Mi')
+        self.namespace_sums = pd.DataFrame(columns=list(dict.fromkeys(
+            column for column, _ in NAMESPACE_METRICS.values())), dtype='float64')
+        # Scrape times seen, so namespace sums can be averaged per scrape; one entry per scrape, not per sample
+        self.timestamps = set()
+        self.samples = 0
+        self.batches = 0
+
+    def update(self, batch):
+        """Fold one :func:`read_batches` frame into the aggregates."""
+        self.samples += len(batch)
+        self.batches += 1
+        metric = batch['Metric']
+
+        memory = batch[(metric == NODE_MEMORY_METRIC).to_numpy()]
+        self.node_memory.add(memory['Node'].to_numpy(dtype=object, na_value=None), memory['Value'].to_numpy())
+
+        allocatable = batch[(metric == NODE_ALLOCATABLE_METRIC).to_numpy()].dropna(subset=['Node', 'Value'])
+        if len(allocatable):
+            latest = allocatable.groupby('Node')['Value'].last()
+            self.allocatable = latest.combine_first(self.allocatable).rename('Allocatable_Memory_Mi')
+
+        containers = batch[metric.isin(list(NAMESPACE_METRICS)).to_numpy()].dropna(subset=['Namespace'])
+        if len(containers):
+            column = containers['Metric'].map({name: column for name, (column, _) in NAMESPACE_METRICS.items()})
+            sums = containers.assign(Column=column).pivot_table(index='Namespace', columns='Column', values='Value',
+                                                                aggfunc='sum')
+            self.namespace_sums = sums.add(self.namespace_sums, fill_value=0) if len(self.namespace_sums) else sums
+            self.timestamps.update(containers['Timestamp'].dropna().unique().tolist())
+        return self
+
+    def node_frame(self):
+        """``Node``, ``Memory_Usage_<P50|P95|P99|Max>_Mi``, samples and allocatable."""
+        sketch = self.node_memory
+        frame = pd.DataFrame({f'Memory_Usage_{statistic}_Mi': sketch.max if q == 1 else sketch.quantile(q)
+                              for statistic, q in MEMORY_STATISTICS.items()})
+        frame['Samples'] = sketch.counts()
+        frame['Allocatable_Memory_Mi'] = self.allocatable.reindex(frame.index)
+        return frame.rename_axis('Node').reset_index()
+
+    def namespace_frame(self):
+        """Summed samples per namespace and their mean per scrape."""
+        sums = self.namespace_sums.copy()
+        scrapes = len(self.timestamps)
+        for column in list(sums.columns):
+            sums[f'{column}_Sum'] = sums.pop(column)
+            if scrapes:
+                sums[f'{column}_Mean'] = sums[f'{column}_Sum'] / scrapes
+        sums.columns.name = None
+        return sums.rename_axis('Namespace').reset_index()
+
+
+def aggregate_export(path, format=None, chunk_rows=CHUNK_ROWS, aggregates=None):
+    """Stream ``path`` into ``aggregates`` (a new :class:`ExportAggregates` by default)."""
+    aggregates = ExportAggregates() if aggregates is None else aggregates
+    for batch in read_batches(path, format, chunk_rows):
+        aggregates.update(batch)
+    return aggregates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m kube_reports.streaming', description=__doc__.split('\n\n')[0])
+    parser.add_argument('exports', nargs='+', help='JSON lines, CSV or Prometheus text files (optionally .gz)')
+    parser.add_argument('--format', choices=['jsonl', 'csv', 'prometheus'], help='skip format detection')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help='samples per batch')
+    parser.add_argument('--nodes-out', help='write the per-node quantiles to this CSV')
+    parser.add_argument('--namespaces-out', help='write the per-namespace sums to this CSV')
+    parser.add_argument('--sketch-out', help='save the mergeable node memory sketch (Parquet) here')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    aggregates = ExportAggregates()
+    for path in args.exports:
+        aggregate_export(path, args.format, args.chunk_rows, aggregates)
+    nodes, namespaces = aggregates.node_frame(), aggregates.namespace_frame()
+    print(f"{aggregates.samples:,} samples in {aggregates.batches} batches, {len(nodes)} nodes, "
+          f"{len(namespaces)} namespaces in {time.perf_counter() - start:.1f}s")
+    if args.nodes_out:
+        nodes.to_csv(args.nodes_out, index=False)
+    else:
+        print(nodes.head(20).to_string(index=False))
+    if args.namespaces_out:
+        namespaces.to_csv(args.namespaces_out, index=False)
+    if args.sketch_out:
+        aggregates.node_memory.save(args.sketch_out)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""Local stand-in for many kube API servers, for exercising the collector.
+
+Serves ``/clusters/<name>/api/v1/namespaces``, the per-namespace pod list
+and the metrics-server pod metrics for a synthetic fleet with
+deterministic values. It can add latency and stall chosen clusters to
+check timeouts. It writes the matching ``clusters.json`` so the collector
+and the dashboard can run against it without a real cluster::
+
+    python -m kube_reports.stub_api --clusters 50 --namespaces 200 --config clusters.json
+    python -m kube_reports.collector --clusters clusters.json
+"""
+
+import argparse
+import asyncio
+import json
+import zlib
+
+from aiohttp import web
+
+
+def _seed(*parts):
+    return zlib.crc32('/'.join(parts).encode())
+
+
+class StubFleet:
+    """Synthetic clusters → namespaces → pods, generated on demand."""
+
+    def __init__(self, clusters=50, namespaces=200, pods=8, latency=0.0, stalled=()):
+        self.clusters = [f'cluster-{i:03d}' for i in range(clusters)]
+        self.namespaces = [f'ns-{i:04d}' for i in range(namespaces)]
+        self.pods = pods
+        self.latency = latency
+        self.stalled = set(stalled)
+
+    def _pods(self, cluster, namespace):
+        seed = _seed(cluster, namespace)
+        count = 1 + seed % self.pods
+        return [(f'{namespace}-pod-{i}', 50 + (seed >> 3) % 400 + 7 * i, 20 + (seed >> 5) % 300 + 11 * i)
+                for i in range(count)]
+
+    def namespace_list(self, cluster):
+        return {'kind': 'NamespaceList', 'items': [{'metadata': {'name': name}} for name in self.namespaces]}
+
+    def pod_list(self, cluster, namespace):
+        items = [{
+            'metadata': {'name': name, 'namespace': namespace},
+            'spec': {'containers': [{'name': 'app', 'resources': {'limits': {'cpu': '500m', 'memory': '512Mi'}}}]},
+            'status': {'phase': 'Running'},
+        } for name, _, _ in self._pods(cluster, namespace)]
+        return {'kind': 'PodList', 'items': items}
+
+    def pod_metrics(self, cluster, namespace):
+        items = [{
+            'metadata': {'name': name, 'namespace': namespace},
+            'containers': [{'name': 'app', 'usage': {'cpu': f'{cpu}m', 'memory': f'{memory}Mi'}}],
+        } for name, memory, cpu in self._pods(cluster, namespace)]
+        return {'kind': 'PodMetricsList', 'items': items}
+
+    def config(self, base_url, timeout=10):
+        return {name: {'server': f'{base_url}/clusters/{name}', 'token': 'stub', 'timeout': timeout}
+                for name in self.clusters}
+
+    def app(self):
+        async def respond(request, build):
+            cluster = request.match_info['cluster']
+            if cluster not in self.clusters:
+                raise web.HTTPNotFound()
+            if cluster in self.stalled:
+                await asyncio.sleep(3600)
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return web.json_response(build(cluster, request.match_info.get('namespace')))
+
+        async def namespaces(request):
+            return await respond(request, lambda cluster, _: self.namespace_list(cluster))
+
+        async def pods(request):
+            return await respond(request, self.pod_list)
+
+        async def metrics(request):
+            return await respond(request, self.pod_metrics)
+
+        app = web.Application()
+        app.router.add_get('/clusters/{cluster}/api/v1/namespaces', namespaces)
+        app.router.add_get('/clusters/{cluster}/api/v1/namespaces/{namespace}/pods', pods)
+        app.router.add_get('/clusters/{cluster}/apis/metrics.k8s.io/v1beta1/namespaces/{namespace}/pods', metrics)
+        return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m kube_reports.stub_api', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--clusters', type=int, default=50)
+    parser.add_argument('--namespaces', type=int, default=200)
+    parser.add_argument('--pods', type=int, default=8, help='maximum pods per namespace')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--stall', action='append', default=[], help='cluster that never answers (repeatable)')
+    parser.add_argument('--config', help='write the matching clusters.json here')
+    args = parser.parse_args(argv)
+
+    fleet = StubFleet(args.clusters, args.namespaces, args.pods, args.latency, args.stall)
+    if args.config:
+        with open(args.config, 'w', encoding='utf-8') as handle:
+            json.dump(fleet.config(f'http://{args.host}:{args.port}'), handle, indent=2)
+    web.run_app(fleet.app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == '__main__':
+    main()
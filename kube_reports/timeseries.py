@@ -0,0 +1,211 @@
+"""Stored metric samples and server-side downsampling for trend charts.
+
+Samples are kept as a long table (``Timestamp``, ``Series``, ``Value``) in
+Parquet files partitioned by ``metric=<name>/date=<YYYY-MM-DD>``, e.g. one
+``Series`` per pod for ``pod_memory_mb``. A trend query reads only the day
+partitions inside the visible window, folds the series into one line per
+timestamp and then reduces that line to roughly the chart's pixel width
+with LTTB (shape-preserving) or min/max buckets (peak-preserving), so the
+browser receives a few thousand points however many samples are stored.
+
+Usage::
+
+    python -m kube_reports.timeseries append --root samples --metric pod_memory_mb samples.csv
+"""
+
+import argparse
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+
+DEFAULT_POINTS = 1500
+
+_MMAP_FS = pafs.LocalFileSystem(use_mmap=True)
+_TIMESTAMP = pa.timestamp('ms', tz='UTC')
+
+
+def lttb(x, y, threshold):
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    ``x`` must be sorted. Returns the indices of the ``threshold`` points
+    that keep the visual shape of the line.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+
+    # Buckets over the interior points; first and last points are always kept
+    edges = (np.arange(threshold - 1) * ((n - 2) / (threshold - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+    starts, ends = edges[:-1], edges[1:]
+
+    # Average point of every bucket, used as the third triangle vertex of the previous one
+    counts = ends - starts
+    avg_x = np.add.reduceat(x[:n - 1], starts) / counts
+    avg_y = np.add.reduceat(y[:n - 1], starts) / counts
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    picked = np.empty(threshold, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i, (lo, hi) in enumerate(zip(starts, ends)):
+        area = np.abs((x[a] - next_x[i]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y[i] - y[a]))
+        a = lo + int(np.argmax(area))
+        picked[i + 1] = a
+    return picked
+
+
+def minmax(x, y, threshold):
+    """Indices of each bucket's minimum and maximum, in time order.
+
+    Keeps every spike visible at the cost of the line's finer shape.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 2:
+        return np.arange(n)
+    buckets = np.arange(n) * (threshold // 2) // n
+    grouped = pd.Series(np.asarray(y, dtype='float64')).groupby(buckets)
+    picked = np.concatenate([grouped.idxmin().to_numpy(), grouped.idxmax().to_numpy()])
+    return np.unique(picked)
+
+
+DOWNSAMPLERS = {'lttb': lttb, 'minmax': minmax}
+
+
+def downsample(frame, points=DEFAULT_POINTS, method='lttb', x='Timestamp', y='Value'):
+    """Reduce a sorted two-column frame to about ``points`` rows."""
+    if len(frame) <= points:
+        return frame
+    xs = frame[x]
+    xs = xs.astype('int64') if pd.api.types.is_datetime64_any_dtype(xs) else xs
+    index = DOWNSAMPLERS[method](xs.to_numpy(), frame[y].to_numpy(), points)
+    return frame.iloc[index].reset_index(drop=True)
+
+
+def _utc(timestamp):
+    timestamp = pd.Timestamp(timestamp)
+    return timestamp.tz_localize('UTC') if timestamp.tzinfo is None else timestamp.tz_convert('UTC')
+
+
+class SampleStore:
+    """Append-only store of metric samples rooted at a local directory."""
+
+    def __init__(self, root):
+        self.root = os.fspath(root)
+
+    def _metric_dir(self, metric):
+        return os.path.join(self.root, f'metric={metric}')
+
+    def metrics(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name.split('=', 1)[1] for name in os.listdir(self.root)
+                      if name.startswith('metric='))
+
+    def append(self, metric, frame):
+        """Write ``Timestamp``/``Series``/``Value`` samples, one file per day touched."""
+        table = pa.table({
+            'Timestamp': pa.array(pd.to_datetime(frame['Timestamp'], utc=True), type=_TIMESTAMP),
+            'Series': pa.array(frame['Series'].astype(str)),
+            'Value': pa.array(frame['Value'].astype('float64')),
+        })
+        table = table.sort_by('Timestamp')
+        days = pc.floor_temporal(table['Timestamp'], unit='day').to_numpy()
+        bounds = [0, *(np.flatnonzero(days[1:] != days[:-1]) + 1), len(days)]
+        batch = uuid.uuid4().hex[:12]
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            date = pd.Timestamp(days[lo]).strftime('%Y-%m-%d')
+            partition = os.path.join(self._metric_dir(metric), f'date={date}')
+            os.makedirs(partition, exist_ok=True)
+            pq.write_table(table.slice(lo, hi - lo), os.path.join(partition, f'samples-{batch}.parquet'))
+
+    def span(self, metric):
+        """First and last day with samples, as Timestamps (``None`` when empty)."""
+        metric_dir = self._metric_dir(metric)
+        if not os.path.isdir(metric_dir):
+            return None
+        dates = sorted(name.split('=', 1)[1] for name in os.listdir(metric_dir) if name.startswith('date='))
+        if not dates:
+            return None
+        return pd.Timestamp(dates[0], tz='UTC'), pd.Timestamp(dates[-1], tz='UTC') + pd.Timedelta(days=1)
+
+    def files(self, metric, start, end):
+        """Parquet files of the day partitions overlapping ``[start, end)``, as ``{date: [path, ...]}``."""
+        start, end = _utc(start), _utc(end)
+        files = {}
+        for date in pd.date_range(start.normalize(), end.normalize(), freq='D').strftime('%Y-%m-%d'):
+            partition = os.path.join(self._metric_dir(metric), f'date={date}')
+            if os.path.isdir(partition):
+                files[date] = [os.path.join(partition, name) for name in sorted(os.listdir(partition))
+                               if name.endswith('.parquet')]
+        return files
+
+    def samples(self, metric, start, end, columns=('Timestamp', 'Value'), series=None):
+        """Raw samples in ``[start, end)``, reading only the day partitions in range."""
+        start, end = _utc(start), _utc(end)
+        files = [path for paths in self.files(metric, start, end).values() for path in paths]
+        if not files:
+            return pd.DataFrame({name: pd.Series(dtype='float64') for name in columns})
+        expr = ((pc.field('Timestamp') >= pa.scalar(start, type=_TIMESTAMP))
+                & (pc.field('Timestamp') < pa.scalar(end, type=_TIMESTAMP)))
+        if series is not None:
+            expr = expr & pc.field('Series').isin(list(series))
+        dataset = ds.dataset(files, format='parquet', filesystem=_MMAP_FS)
+        return dataset.to_table(columns=list(columns), filter=expr).to_pandas()
+
+    def samples_since(self, metric, after, columns=('Timestamp', 'Series', 'Value')):
+        """Samples at or after ``after``, opening only the day partitions from that day on.
+
+        This is the incremental read behind live refresh: the cost follows
+        the new data, not the size of the store.
+        """
+        after = _utc(after)
+        metric_dir = self._metric_dir(metric)
+        first = after.strftime('%Y-%m-%d')
+        files = []
+        if os.path.isdir(metric_dir):
+            for name in sorted(os.listdir(metric_dir)):
+                if name.startswith('date=') and name.split('=', 1)[1] >= first:
+                    partition = os.path.join(metric_dir, name)
+                    files.extend(os.path.join(partition, f) for f in sorted(os.listdir(partition))
+                                 if f.endswith('.parquet'))
+        if not files:
+            return pd.DataFrame({name: pd.Series(dtype='float64') for name in columns})
+        dataset = ds.dataset(files, format='parquet', filesystem=_MMAP_FS)
+        expr = pc.field('Timestamp') >= pa.scalar(after, type=_TIMESTAMP)
+        return dataset.to_table(columns=list(columns), filter=expr).to_pandas()
+
+    def trend(self, metric, start, end, points=DEFAULT_POINTS, method='lttb', agg='mean'):
+        """One line per timestamp (``agg`` across series), downsampled to ``points``."""
+        raw = self.samples(metric, start, end)
+        line = raw.groupby('Timestamp', sort=True)['Value'].agg(agg).reset_index()
+        return downsample(line, points, method)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m kube_reports.timeseries', description=__doc__.split('\n\n')[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+    append = sub.add_parser('append', help='append a CSV of timestamp,series,value samples')
+    append.add_argument('source')
+    append.add_argument('--metric', required=True)
+    append.add_argument('--root', default=os.environ.get('KUBE_REPORTS_SAMPLE_DIR', 'samples'))
+    args = parser.parse_args(argv)
+
+    frame = pd.read_csv(args.source)
+    frame.columns = ['Timestamp', 'Series', 'Value'][:len(frame.columns)]
+    SampleStore(args.root).append(args.metric, frame)
+    print(f"appended {len(frame)} samples to {args.metric}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,12 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import numpy as np
-from datetime import datetime, timedelta
-import base64
-from io import BytesIO
+from datetime import datetime
+
+from kube_reports.cache import STATS as cache_stats
+from kube_reports.figures import STATS as figure_stats
+from kube_reports.live import REFRESH_SECONDS
+from kube_reports.pages import load_page, page_labels
+from kube_reports.profiling import PROFILE, PROFILE_ENABLED, timings_panel
+from kube_reports.schema import session_footprint
 
 # Configure Streamlit page
 st.set_page_config(
@@ -75,1058 +75,38 @@ st.markdown('<h2 style="text-align: center; color: #666;">Production Kubernetes
 st.sidebar.title("📋 Navigation")
 page = st.sidebar.selectbox(
     "Select Analysis Section:",
-    [
-        "🚨 Executive Summary",
-        "📊 Current Infrastructure Status", 
-        "🔍 Implementation Status Analysis",
-        "💻 Code Optimization Verification",
-        "🚀 Remaining Recommendations",
-        "📈 Performance Impact Analysis",
-        "🔧 Technical Deep Dive",
-        "📋 Action Plan & Next Steps"
-    ]
-)
-
-# Real data from our analysis
-current_cluster_data = {
-    'Namespace': ['emaarhospitality', 'ehgv3', 'cenomi', 'agiv2prod', 'srg', 'atgv2', 'aster', 'salesdemo', 'enova'],
-    'CPU_Usage_Percent': [8, 19, 12, 15, 11, 14, 9, 7, 13],
-    'Memory_Usage_Percent': [69, 86, 74, 78, 71, 82, 67, 63, 75],
-    'Pod_Count': [15, 22, 18, 20, 16, 19, 14, 12, 17],
-    'Status': ['🟢 HEALTHY', '🟡 MODERATE', '🟢 HEALTHY', '🟡 MODERATE', '🟢 HEALTHY', '🟡 MODERATE', '🟢 HEALTHY', '🟢 HEALTHY', '🟢 HEALTHY']
-}
-
-optimization_status_data = {
-    'Component': ['Database Connection Pools', 'Redis Connection Management', 'OCR File Processing', 'Resource Limits & Requests', 'Pod Anti-Affinity', 'Monitoring & Alerting'],
-    'Old_Status': ['❌ Not Optimized', '❌ Dual Pools', '❌ Memory Leaks', '❌ Inadequate', '❌ Missing', '❌ Basic Only'],
-    'Current_Status': ['✅ Implemented', '✅ Implemented', '✅ Implemented', '✅ Implemented', '⚠️ Partial', '⚠️ Basic'],
-    'Memory_Impact_MB': [50, 22, 100, 30, 0, 0],
-    'Implementation_Date': ['2024-Q3', '2024-Q3', '2024-Q3', '2024-Q4', 'Pending', 'Pending']
-}
-
-code_verification_data = {
-    'File_Path': [
-        'Dynamics/app/session/session.py',
-        'Dynamics/app/Utilities/cache.py', 
-        'Dynamics/app/lifespan_manager.py',
-        'Dynamics/app/routers/OCR.py',
-        'Backend/redis.yaml'
-    ],
-    'Optimization_Type': [
-        'Database Pool Configuration',
-        'Redis Connection Pooling',
-        'Redis Lifecycle Management', 
-        'OCR Memory Management',
-        'Redis Resource Limits'
-    ],
-    'Status': ['✅ Verified', '✅ Verified', '✅ Verified', '✅ Verified', '✅ Verified'],
-    'Memory_Reduction': ['60MB → 10MB', '30MB → 8MB', 'Lifecycle Optimized', '150MB → 50MB', 'Resource Limited']
-}
-
-# Page content based on selection
-if page == "🚨 Executive Summary":
-    st.header("🚨 Executive Summary & Implementation Status")
-    
-    # Implementation status overview
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Optimizations Completed", "4/6", "✅ 67% Complete")
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Memory Reduction", "202MB", "📉 Per Pod")
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Cluster Health", "Stable", "🟢 Improved")
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Cost Savings", "$2,500/mo", "💰 Estimated")
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Success summary
-    st.markdown("""
-    <div class="success-alert">
-        <h3>✅ MAJOR OPTIMIZATIONS SUCCESSFULLY IMPLEMENTED</h3>
-        <p><strong>Status: SUCCESSFUL</strong> - Critical memory optimizations have been implemented and verified</p>
-        <ul>
-            <li>Database connection pooling optimized (83% memory reduction)</li>
-            <li>Redis connection management unified (73% memory reduction)</li>
-            <li>OCR processing memory leaks eliminated (67% memory reduction)</li>
-            <li>Resource limits properly configured across all namespaces</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Implementation progress
-    st.subheader("🔍 Implementation Progress Overview")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("### ✅ Successfully Implemented")
-        st.markdown("""
-        - **Database Connection Pools**: `pool_size=3`, `max_overflow=5`, `pool_recycle=600`
-        - **Redis Connection Management**: `AsyncRedisManager` with `max_connections=13`
-        - **OCR Memory Management**: Context managers, `tempfile`, `gc.collect()`
-        - **Resource Limits**: CPU 100m-200m, Memory 1500Mi across namespaces
-        - **HPA Configuration**: Already set up (as confirmed by user)
-        """)
-    
-    with col2:
-        st.markdown("### ⚠️ Remaining Items")
-        st.markdown("""
-        - **Pod Anti-Affinity Rules**: Not yet implemented
-        - **Comprehensive Monitoring**: Basic health checks only
-        - **Resource Quotas**: Namespace-level limits missing
-        - **Advanced Alerting**: Memory threshold alerts needed
-        - **Performance Validation**: Automated testing scripts
-        """)
-    
-    # Memory optimization breakdown chart
-    st.subheader("📊 Memory Optimization Results")
-    
-    df_optimization = pd.DataFrame(optimization_status_data)
-    
-    fig = make_subplots(
-        rows=1, cols=2,
-        subplot_titles=('Implementation Status by Component', 'Memory Impact (MB per Pod)'),
-        specs=[[{"type": "bar"}, {"type": "bar"}]]
-    )
-    
-    # Implementation status
-    status_colors = ['#4caf50' if '✅' in status else '#ff9800' if '⚠️' in status else '#f44336' 
-                    for status in df_optimization['Current_Status']]
-    
-    fig.add_trace(
-        go.Bar(
-            x=df_optimization['Component'],
-            y=[1 if '✅' in status else 0.5 if '⚠️' in status else 0 for status in df_optimization['Current_Status']],
-            marker_color=status_colors,
-            text=df_optimization['Current_Status'],
-            textposition='auto',
-            name='Status'
-        ),
-        row=1, col=1
-    )
-    
-    # Memory impact
-    fig.add_trace(
-        go.Bar(
-            x=df_optimization['Component'],
-            y=df_optimization['Memory_Impact_MB'],
-            marker_color='#45b7d1',
-            text=df_optimization['Memory_Impact_MB'],
-            textposition='auto',
-            name='Memory Saved (MB)'
-        ),
-        row=1, col=2
-    )
-    
-    fig.update_layout(height=500, showlegend=False, title_text="Memory Optimization Implementation Analysis")
-    fig.update_xaxes(title_text="Components", row=1, col=1)
-    fig.update_xaxes(title_text="Components", row=1, col=2)
-    fig.update_yaxes(title_text="Implementation Status", row=1, col=1)
-    fig.update_yaxes(title_text="Memory Reduction (MB)", row=1, col=2)
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Current cluster health
-    st.subheader("🎯 Current Cluster Health Status")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **Memory Utilization**
-        - Average: 73% (Healthy)
-        - Range: 63-86%
-        - **Status: ✅ Stable**
-        """)
-    
-    with col2:
-        st.markdown("""
-        **CPU Utilization**
-        - Average: 12% (Excellent)
-        - Range: 7-19%
-        - **Status: ✅ Optimal**
-        """)
-    
-    with col3:
-        st.markdown("""
-        **Overall Health**
-        - No OOM events
-        - Stable performance
-        - **Status: ✅ Excellent**
-        """)
-
-elif page == "📊 Current Infrastructure Status":
-    st.header("📊 Current Infrastructure Status")
-    
-    df_cluster = pd.DataFrame(current_cluster_data)
-    
-    # Cluster overview
-    st.subheader("🎯 Production Cluster Overview")
-    
-    # Create comprehensive dashboard
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        # Memory and CPU usage comparison
-        fig = make_subplots(
-            rows=1, cols=2,
-            subplot_titles=('Memory Usage by Namespace', 'CPU Usage by Namespace'),
-            specs=[[{"type": "bar"}, {"type": "bar"}]]
-        )
-        
-        # Memory usage
-        memory_colors = ['#4caf50' if x < 70 else '#ff9800' if x < 80 else '#f44336' 
-                        for x in df_cluster['Memory_Usage_Percent']]
-        
-        fig.add_trace(
-            go.Bar(
-                x=df_cluster['Namespace'],
-                y=df_cluster['Memory_Usage_Percent'],
-                marker_color=memory_colors,
-                text=df_cluster['Memory_Usage_Percent'],
-                textposition='auto',
-                texttemplate='%{text}%',
-                name='Memory %'
-            ),
-            row=1, col=1
-        )
-        
-        # CPU usage
-        fig.add_trace(
-            go.Bar(
-                x=df_cluster['Namespace'],
-                y=df_cluster['CPU_Usage_Percent'],
-                marker_color='#45b7d1',
-                text=df_cluster['CPU_Usage_Percent'],
-                textposition='auto',
-                texttemplate='%{text}%',
-                name='CPU %'
-            ),
-            row=1, col=2
-        )
-        
-        fig.add_hline(y=80, line_dash="dash", line_color="red", row=1, col=1,
-                     annotation_text="Critical Threshold (80%)")
-        fig.add_hline(y=70, line_dash="dash", line_color="orange", row=1, col=1,
-                     annotation_text="Warning Threshold (70%)")
-        
-        fig.update_layout(height=500, showlegend=False)
-        fig.update_xaxes(title_text="Namespace", row=1, col=1)
-        fig.update_xaxes(title_text="Namespace", row=1, col=2)
-        fig.update_yaxes(title_text="Memory Usage (%)", row=1, col=1)
-        fig.update_yaxes(title_text="CPU Usage (%)", row=1, col=2)
-        
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        st.markdown("### 🎯 Health Thresholds")
-        st.markdown("""
-        **Memory Usage Levels:**
-        - 🟢 **<70%**: Healthy
-        - 🟡 **70-80%**: Moderate
-        - 🔴 **>80%**: Critical
-        
-        **Current Status:**
-        - 7 namespaces healthy
-        - 2 namespaces moderate
-        - 0 namespaces critical
-        - **Overall: ✅ Stable**
-        """)
-    
-    # Detailed namespace analysis
-    st.subheader("📋 Detailed Namespace Analysis")
-    
-    # Format the dataframe for display
-    display_df = df_cluster.copy()
-    display_df['Memory Usage'] = display_df['Memory_Usage_Percent'].astype(str) + '%'
-    display_df['CPU Usage'] = display_df['CPU_Usage_Percent'].astype(str) + '%'
-    display_df['Pod Count'] = display_df['Pod_Count'].astype(str)
-    
-    st.dataframe(
-        display_df[['Namespace', 'Memory Usage', 'CPU Usage', 'Pod Count', 'Status']],
-        use_container_width=True
-    )
-    
-    # Resource utilization trends
-    st.subheader("📈 Resource Utilization Analysis")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div class="success-alert">
-        <h4>🟢 Memory Status</h4>
-        <ul>
-            <li>Average: 73% utilization</li>
-            <li>No critical namespaces</li>
-            <li>Stable performance</li>
-            <li>Optimizations working</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="success-alert">
-        <h4>🟢 CPU Status</h4>
-        <ul>
-            <li>Average: 12% utilization</li>
-            <li>Excellent efficiency</li>
-            <li>Room for scaling</li>
-            <li>Cost optimized</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="success-alert">
-        <h4>🟢 Overall Health</h4>
-        <ul>
-            <li>153 total pods running</li>
-            <li>No OOM events</li>
-            <li>Stable workloads</li>
-            <li>Ready for growth</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-
-elif page == "🔍 Implementation Status Analysis":
-    st.header("🔍 Implementation Status Analysis")
-    
-    # Implementation comparison
-    st.subheader("📊 Old Recommendations vs Current Implementation")
-    
-    df_status = pd.DataFrame(optimization_status_data)
-    
-    # Status comparison chart
-    fig = go.Figure()
-    
-    # Create status mapping for visualization
-    status_mapping = {'✅ Implemented': 1, '⚠️ Partial': 0.5, '❌ Missing': 0}
-    old_status_values = [0 if '❌' in status else 0.5 for status in df_status['Old_Status']]
-    current_status_values = [status_mapping.get(status.split(' ', 1)[1] if ' ' in status else status, 0) 
-                           for status in df_status['Current_Status']]
-    
-    fig.add_trace(go.Bar(
-        name='Old Status',
-        x=df_status['Component'],
-        y=old_status_values,
-        marker_color='#ff6b6b',
-        text=['Not Implemented'] * len(df_status),
-        textposition='auto'
-    ))
-    
-    fig.add_trace(go.Bar(
-        name='Current Status',
-        x=df_status['Component'],
-        y=current_status_values,
-        marker_color=['#4caf50' if val == 1 else '#ff9800' if val == 0.5 else '#f44336' 
-                     for val in current_status_values],
-        text=df_status['Current_Status'],
-        textposition='auto'
-    ))
-    
-    fig.update_layout(
-        title="Implementation Progress: Old vs Current Status",
-        xaxis_title="Optimization Components",
-        yaxis_title="Implementation Status",
-        height=500,
-        barmode='group'
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Detailed implementation analysis
-    st.subheader("🔍 Detailed Implementation Analysis")
-    
-    for i, row in df_status.iterrows():
-        with st.expander(f"{row['Component']} - {row['Current_Status']}"):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown(f"**Old Status:** {row['Old_Status']}")
-                st.markdown(f"**Current Status:** {row['Current_Status']}")
-                st.markdown(f"**Implementation Date:** {row['Implementation_Date']}")
-            
-            with col2:
-                st.markdown(f"**Memory Impact:** {row['Memory_Impact_MB']} MB per pod")
-                
-                if row['Component'] == 'Database Connection Pools':
-                    st.markdown("""
-                    **Implementation Details:**
-                    - `pool_size=3` (optimized from default)
-                    - `max_overflow=5` (controlled scaling)
-                    - `pool_recycle=600` (connection refresh)
-                    - `pool_pre_ping=True` (health checks)
-                    """)
-                elif row['Component'] == 'Redis Connection Management':
-                    st.markdown("""
-                    **Implementation Details:**
-                    - `AsyncRedisManager` singleton pattern
-                    - `max_connections=13` (optimized pool)
-                    - `retry_on_timeout=True` (resilience)
-                    - Proper lifecycle management
-                    """)
-                elif row['Component'] == 'OCR File Processing':
-                    st.markdown("""
-                    **Implementation Details:**
-                    - `asynccontextmanager` for file handling
-                    - `tempfile` usage for temporary storage
-                    - `gc.collect()` for explicit cleanup
-                    - `BytesIO` buffer management
-                    """)
-                elif row['Component'] == 'Resource Limits & Requests':
-                    st.markdown("""
-                    **Implementation Details:**
-                    - CPU requests: 100m-200m
-                    - Memory limits: 1500Mi
-                    - Consistent across namespaces
-                    - Proper resource allocation
-                    """)
-    
-    # Memory impact summary
-    st.subheader("💾 Memory Impact Summary")
-    
-    total_memory_saved = df_status['Memory_Impact_MB'].sum()
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Total Memory Saved", f"{total_memory_saved}MB", "Per Pod")
-    
-    with col2:
-        st.metric("Percentage Reduction", "62%", "From Original")
-    
-    with col3:
-        st.metric("Cluster-wide Savings", f"{total_memory_saved * 153 / 1024:.1f}GB", "All Pods")
-
-elif page == "💻 Code Optimization Verification":
-    st.header("💻 Code Optimization Verification")
-    
-    st.subheader("🔍 Verified Implementation Details")
-    
-    df_verification = pd.DataFrame(code_verification_data)
-    
-    # Code verification table
-    st.dataframe(df_verification, use_container_width=True)
-    
-    # Detailed code analysis
-    st.subheader("📝 Code Implementation Details")
-    
-    # Database Connection Pools
-    with st.expander("🗄️ Database Connection Pools - session.py"):
-        st.markdown("**File:** `Dynamics/app/session/session.py`")
-        st.code("""
-# Main Application Database Engine
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=600,
-    pool_size=int(os.getenv('client_pool_size', 3)),
-    max_overflow=5,
-    pool_timeout=20,
-    isolation_level="READ COMMITTED"
-)
-
-# RPA Service Database Engine  
-rpa_engine = create_engine(
-    RPA_DATABASE_URL,
-    pool_recycle=600,
-    pool_size=2,
-    max_overflow=1,
-    pool_timeout=20
+    page_labels("phase1")
 )
-        """, language="python")
-        
-        st.markdown("""
-        **Optimizations Implemented:**
-        - ✅ `pool_size=3` (reduced from default 5)
-        - ✅ `max_overflow=5` (controlled connection scaling)
-        - ✅ `pool_recycle=600` (10-minute connection refresh)
-        - ✅ `pool_pre_ping=True` (connection health checks)
-        - ✅ Separate optimized pool for RPA service
-        """)
-    
-    # Redis Connection Management
-    with st.expander("🔄 Redis Connection Management - cache.py"):
-        st.markdown("**File:** `Dynamics/app/Utilities/cache.py`")
-        st.code("""
-class AsyncRedisManager:
-    _instance = None
-    _redis_pool = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
-    async def get_redis_pool(self):
-        if self._redis_pool is None:
-            self._redis_pool = redis.asyncio.ConnectionPool.from_url(
-                f"redis://{redis_host}:{redis_port}",
-                max_connections=13,
-                retry_on_timeout=True,
-                health_check_interval=30
-            )
-        return redis.asyncio.Redis(connection_pool=self._redis_pool)
-        """, language="python")
-        
-        st.markdown("""
-        **Optimizations Implemented:**
-        - ✅ Singleton pattern (single connection pool)
-        - ✅ `max_connections=13` (optimized pool size)
-        - ✅ `retry_on_timeout=True` (resilience)
-        - ✅ `health_check_interval=30` (connection monitoring)
-        - ✅ Async context manager for operations
-        """)
-    
-    # OCR Memory Management
-    with st.expander("🖼️ OCR Memory Management - OCR.py"):
-        st.markdown("**File:** `Dynamics/app/routers/OCR.py`")
-        st.code("""
-@asynccontextmanager
-async def managed_file_processing(file_url: str, context: str):
-    file_buffer = None
-    resp = None
-    try:
-        # Download file with async context
-        async with aiohttp.ClientSession() as session:
-            async with session.get(file_url) as resp:
-                file_buffer = BytesIO(await resp.read())
-        
-        # Process with temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            temp_file.write(file_buffer.getvalue())
-            temp_file_path = temp_file.name
-        
-        yield temp_file_path
-        
-    finally:
-        # Explicit cleanup
-        if file_buffer:
-            file_buffer.close()
-        if resp:
-            resp.close()
-        gc.collect()  # Force garbage collection
-        """, language="python")
-        
-        st.markdown("""
-        **Optimizations Implemented:**
-        - ✅ `asynccontextmanager` for resource management
-        - ✅ `tempfile` usage for temporary storage
-        - ✅ Explicit `BytesIO` buffer cleanup
-        - ✅ `gc.collect()` for memory cleanup
-        - ✅ Proper exception handling with `finally` blocks
-        """)
-    
-    # Resource Configuration
-    with st.expander("⚙️ Resource Configuration - redis.yaml"):
-        st.markdown("**File:** `Backend/redis.yaml`")
-        st.code("""
-apiVersion: apps/v1
-kind: Deployment
-metadata:
-  name: redis
-spec:
-  template:
-    spec:
-      containers:
-      - name: redis
-        image: redis:7-alpine
-        resources:
-          requests:
-            cpu: 100m
-            memory: 512Mi
-          limits:
-            cpu: 200m
-            memory: 1Gi
-        livenessProbe:
-          tcpSocket:
-            port: 6379
-          initialDelaySeconds: 30
-          periodSeconds: 10
-        readinessProbe:
-          tcpSocket:
-            port: 6379
-          initialDelaySeconds: 5
-          periodSeconds: 5
-        """, language="yaml")
-        
-        st.markdown("""
-        **Optimizations Implemented:**
-        - ✅ CPU requests: 100m (efficient baseline)
-        - ✅ CPU limits: 200m (controlled scaling)
-        - ✅ Memory requests: 512Mi (adequate baseline)
-        - ✅ Memory limits: 1Gi (prevents runaway usage)
-        - ✅ Health checks configured (liveness & readiness)
-        """)
 
-elif page == "🚀 Remaining Recommendations":
-    st.header("🚀 Remaining Recommendations")
-    
-    st.subheader("⚠️ Items Requiring Implementation")
-    
-    # Remaining items analysis
-    remaining_items = [
-        {
-            'Item': 'Pod Anti-Affinity Rules',
-            'Priority': 'High',
-            'Impact': 'Medium',
-            'Effort': 'Low',
-            'Timeline': '1-2 days'
-        },
-        {
-            'Item': 'Comprehensive Monitoring',
-            'Priority': 'High', 
-            'Impact': 'High',
-            'Effort': 'Medium',
-            'Timeline': '1 week'
-        },
-        {
-            'Item': 'Resource Quotas',
-            'Priority': 'Medium',
-            'Impact': 'Medium', 
-            'Effort': 'Low',
-            'Timeline': '2-3 days'
-        },
-        {
-            'Item': 'Advanced Alerting',
-            'Priority': 'Medium',
-            'Impact': 'High',
-            'Effort': 'Medium', 
-            'Timeline': '3-5 days'
-        }
-    ]
-    
-    df_remaining = pd.DataFrame(remaining_items)
-    st.dataframe(df_remaining, use_container_width=True)
-    
-    # Detailed recommendations
-    st.subheader("📋 Detailed Implementation Guide")
-    
-    # Pod Anti-Affinity
-    with st.expander("🔄 Pod Anti-Affinity Rules - HIGH PRIORITY"):
-        st.markdown("""
-        **Purpose:** Ensure pods are distributed across different nodes for better resource utilization and fault tolerance.
-        
-        **Implementation:**
-        """)
-        
-        st.code("""
-apiVersion: apps/v1
-kind: Deployment
-metadata:
-  name: server
-spec:
-  template:
-    spec:
-      affinity:
-        podAntiAffinity:
-          preferredDuringSchedulingIgnoredDuringExecution:
-          - weight: 100
-            podAffinityTerm:
-              labelSelector:
-                matchExpressions:
-                - key: app
-                  operator: In
-                  values:
-                  - server
-              topologyKey: kubernetes.io/hostname
-        """, language="yaml")
-        
-        st.markdown("""
-        **Benefits:**
-        - Better resource distribution
-        - Improved fault tolerance
-        - Reduced node hotspots
-        - Enhanced performance
-        """)
-    
-    # Comprehensive Monitoring
-    with st.expander("📊 Comprehensive Monitoring - HIGH PRIORITY"):
-        st.markdown("""
-        **Purpose:** Implement detailed memory and performance monitoring with automated alerting.
-        
-        **Components to Implement:**
-        - Prometheus metrics collection
-        - Grafana dashboards
-        - Memory usage alerts
-        - Performance trend analysis
-        
-        **Sample Alert Rules:**
-        """)
-        
-        st.code("""
-groups:
-- name: memory-alerts
-  rules:
-  - alert: HighMemoryUsage
-    expr: (container_memory_usage_bytes / container_spec_memory_limit_bytes) > 0.8
-    for: 5m
-    labels:
-      severity: warning
-    annotations:
-      summary: "High memory usage detected"
-      description: "Pod {{ $labels.pod }} memory usage is above 80%"
-      
-  - alert: MemoryLeakDetected
-    expr: increase(container_memory_usage_bytes[1h]) > 100000000
-    for: 10m
-    labels:
-      severity: critical
-    annotations:
-      summary: "Potential memory leak detected"
-      description: "Pod {{ $labels.pod }} memory increased by >100MB in 1 hour"
-        """, language="yaml")
-    
-    # Resource Quotas
-    with st.expander("📏 Resource Quotas - MEDIUM PRIORITY"):
-        st.markdown("""
-        **Purpose:** Implement namespace-level resource limits to prevent resource exhaustion.
-        
-        **Implementation:**
-        """)
-        
-        st.code("""
-apiVersion: v1
-kind: ResourceQuota
-metadata:
-  name: namespace-quota
-  namespace: production
-spec:
-  hard:
-    requests.cpu: "4"
-    requests.memory: 8Gi
-    limits.cpu: "8"
-    limits.memory: 16Gi
-    pods: "20"
-    persistentvolumeclaims: "10"
-        """, language="yaml")
-        
-        st.markdown("""
-        **Benefits:**
-        - Prevents resource exhaustion
-        - Ensures fair resource allocation
-        - Improves cluster stability
-        - Cost control
-        """)
+# Auto-refresh redraws only the live charts (fragments) on each tick
+if st.sidebar.toggle("🔄 Auto-refresh live data", key="auto_refresh"):
+    st.sidebar.number_input("Refresh every (seconds)", 5, 3600, REFRESH_SECONDS, step=5, key="refresh_seconds")
 
-elif page == "📈 Performance Impact Analysis":
-    st.header("📈 Performance Impact Analysis")
-    
-    # Performance metrics
-    st.subheader("🎯 Measured Performance Improvements")
-    
-    performance_data = {
-        'Metric': ['Memory Usage per Pod', 'Database Connection Time', 'Redis Operation Latency', 'OCR Processing Memory', 'Overall Stability'],
-        'Before_Optimization': ['326MB', '150ms', '25ms', '150MB peak', '3 OOM events/week'],
-        'After_Optimization': ['124MB', '45ms', '8ms', '50MB peak', '0 OOM events'],
-        'Improvement': ['62% reduction', '70% faster', '68% faster', '67% reduction', '100% stable'],
-        'Status': ['✅ Excellent', '✅ Excellent', '✅ Excellent', '✅ Excellent', '✅ Perfect']
-    }
-    
-    df_performance = pd.DataFrame(performance_data)
-    st.dataframe(df_performance, use_container_width=True)
-    
-    # Performance trends visualization
-    st.subheader("📊 Performance Trends")
-    
-    # Simulated trend data based on optimizations
-    dates = pd.date_range(start='2024-01-01', end='2024-12-31', freq='W')
-    memory_trend = np.concatenate([
-        np.random.normal(320, 20, 26),  # Before optimization (Q1-Q2)
-        np.random.normal(250, 15, 13),  # During optimization (Q3)
-        np.random.normal(125, 10, 13)   # After optimization (Q4)
-    ])
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=dates,
-        y=memory_trend,
-        mode='lines+markers',
-        name='Memory Usage per Pod (MB)',
-        line=dict(color='#1f77b4', width=3)
-    ))
-    
-    # Add optimization phases
-    fig.add_vline(x='2024-07-01', line_dash="dash", line_color="orange", 
-                 annotation_text="Optimization Start")
-    fig.add_vline(x='2024-10-01', line_dash="dash", line_color="green", 
-                 annotation_text="Optimization Complete")
-    
-    fig.update_layout(
-        title="Memory Usage Trend - 2024",
-        xaxis_title="Date",
-        yaxis_title="Memory Usage (MB per Pod)",
-        height=400
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Cost impact analysis
-    st.subheader("💰 Cost Impact Analysis")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **Infrastructure Costs**
-        - Before: $8,500/month
-        - After: $6,000/month
-        - **Savings: $2,500/month**
-        """)
-    
-    with col2:
-        st.markdown("""
-        **Operational Efficiency**
-        - Reduced incident response: 80%
-        - Improved deployment speed: 40%
-        - **Better team productivity**
-        """)
-    
-    with col3:
-        st.markdown("""
-        **Business Impact**
-        - Zero downtime incidents
-        - Improved user experience
-        - **Enhanced reliability**
-        """)
-
-elif page == "🔧 Technical Deep Dive":
-    st.header("🔧 Technical Deep Dive")
-    
-    st.subheader("🏗️ Architecture Improvements")
-    
-    # Architecture comparison
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("### ❌ Before Optimization")
-        st.markdown("""
-        **Database Connections:**
-        - Default pool size (5 connections)
-        - No connection recycling
-        - Multiple connection pools per service
-        
-        **Redis Management:**
-        - Dual connection pools
-        - No connection pooling optimization
-        - Manual connection management
-        
-        **OCR Processing:**
-        - Memory leaks in file processing
-        - No explicit cleanup
-        - Base64 encoding without optimization
-        
-        **Resource Management:**
-        - No resource limits
-        - Inadequate requests
-        - No monitoring
-        """)
-    
-    with col2:
-        st.markdown("### ✅ After Optimization")
-        st.markdown("""
-        **Database Connections:**
-        - Optimized pool size (3 connections)
-        - 600-second connection recycling
-        - Unified connection management
-        
-        **Redis Management:**
-        - Single optimized connection pool
-        - AsyncRedisManager singleton
-        - Proper lifecycle management
-        
-        **OCR Processing:**
-        - Context managers for cleanup
-        - Explicit garbage collection
-        - Optimized file handling
-        
-        **Resource Management:**
-        - Proper CPU/memory limits
-        - Adequate resource requests
-        - Health checks implemented
-        """)
-    
-    # Technical implementation details
-    st.subheader("⚙️ Implementation Patterns")
-    
-    with st.expander("🔄 Singleton Pattern for Redis"):
-        st.code("""
-class AsyncRedisManager:
-    _instance = None
-    _redis_pool = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
-    async def get_redis_pool(self):
-        if self._redis_pool is None:
-            self._redis_pool = redis.asyncio.ConnectionPool.from_url(
-                f"redis://{redis_host}:{redis_port}",
-                max_connections=13,
-                retry_on_timeout=True,
-                health_check_interval=30
-            )
-        return redis.asyncio.Redis(connection_pool=self._redis_pool)
-        """, language="python")
-    
-    with st.expander("🗄️ Database Pool Configuration"):
-        st.code("""
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,          # Health check connections
-    pool_recycle=600,            # Recycle every 10 minutes
-    pool_size=3,                 # Optimized pool size
-    max_overflow=5,              # Allow burst connections
-    pool_timeout=20,             # Connection timeout
-    isolation_level="READ COMMITTED"
-)
-        """, language="python")
-    
-    with st.expander("🧹 Memory Management Pattern"):
-        st.code("""
-@asynccontextmanager
-async def managed_file_processing(file_url: str):
-    file_buffer = None
-    try:
-        # Acquire resources
-        file_buffer = BytesIO(await download_file(file_url))
-        
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_file.write(file_buffer.getvalue())
-            yield temp_file.name
-            
-    finally:
-        # Explicit cleanup
-        if file_buffer:
-            file_buffer.close()
-        gc.collect()  # Force garbage collection
-        """, language="python")
+# Opt-in debug timings of each section of the page render
+profile_render = st.sidebar.toggle("⏱️ Profile rendering", value=PROFILE_ENABLED, key="profile_render")
 
-elif page == "📋 Action Plan & Next Steps":
-    st.header("📋 Action Plan & Next Steps")
-    
-    st.subheader("🎯 Immediate Actions (Next 30 Days)")
-    
-    # Action plan timeline
-    action_plan = [
-        {
-            'Action': 'Implement Pod Anti-Affinity Rules',
-            'Priority': '🔴 High',
-            'Timeline': '1-2 days',
-            'Owner': 'DevOps Team',
-            'Status': 'Pending'
-        },
-        {
-            'Action': 'Setup Comprehensive Monitoring',
-            'Priority': '🔴 High', 
-            'Timeline': '1 week',
-            'Owner': 'Platform Team',
-            'Status': 'Pending'
-        },
-        {
-            'Action': 'Configure Resource Quotas',
-            'Priority': '🟡 Medium',
-            'Timeline': '2-3 days',
-            'Owner': 'DevOps Team', 
-            'Status': 'Pending'
-        },
-        {
-            'Action': 'Implement Advanced Alerting',
-            'Priority': '🟡 Medium',
-            'Timeline': '3-5 days',
-            'Owner': 'Platform Team',
-            'Status': 'Pending'
-        },
-        {
-            'Action': 'Performance Validation Testing',
-            'Priority': '🟢 Low',
-            'Timeline': '1 week',
-            'Owner': 'QA Team',
-            'Status': 'Pending'
-        }
-    ]
-    
-    df_actions = pd.DataFrame(action_plan)
-    st.dataframe(df_actions, use_container_width=True)
-    
-    # Success criteria
-    st.subheader("✅ Success Criteria")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        **Technical Metrics:**
-        - Memory usage <70% across all namespaces
-        - Zero OOM events for 30 days
-        - Pod distribution across nodes >80%
-        - Alert response time <5 minutes
-        """)
-    
-    with col2:
-        st.markdown("""
-        **Business Metrics:**
-        - 99.9% uptime maintained
-        - Cost reduction of $2,500/month achieved
-        - Zero production incidents
-        - Team productivity improved by 25%
-        """)
-    
-    # Monitoring and validation
-    st.subheader("📊 Ongoing Monitoring")
-    
-    st.markdown("""
-    **Daily Monitoring:**
-    - Memory usage trends
-    - Pod distribution analysis
-    - Performance metrics review
-    
-    **Weekly Reviews:**
-    - Cost optimization analysis
-    - Capacity planning updates
-    - Performance trend analysis
-    
-    **Monthly Assessments:**
-    - Full infrastructure review
-    - Optimization opportunity identification
-    - Strategic planning updates
-    """)
-    
-    # Final recommendations
-    st.subheader("🎯 Final Recommendations")
-    
-    st.markdown("""
-    <div class="success-alert">
-        <h3>🎉 EXCELLENT PROGRESS ACHIEVED</h3>
-        <p>The major memory optimizations have been successfully implemented with significant improvements:</p>
-        <ul>
-            <li><strong>62% memory reduction</strong> per pod achieved</li>
-            <li><strong>Zero OOM events</strong> since optimization</li>
-            <li><strong>$2,500/month cost savings</strong> realized</li>
-            <li><strong>Improved stability</strong> and performance</li>
-        </ul>
-        <p><strong>Next Focus:</strong> Complete the remaining infrastructure optimizations for maximum benefit.</p>
-    </div>
-    """, unsafe_allow_html=True)
+# Page content based on selection; only the selected page module is imported
+with PROFILE.rerun(page, enabled=profile_render, session_state=st.session_state):
+    load_page("phase1", page).render()
 
 # Footer
 st.markdown("---")
 st.markdown("**Report Generated:** " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-st.markdown("**Analysis Period:** 2024 Q1-Q4 | **Status:** Implementation Successful ✅")
\ No newline at end of file
+st.markdown("**Analysis Period:** 2024 Q1-Q4 | **Status:** Implementation Successful ✅")
+
+# Data cache counters (process-wide, so reruns served from memory show up as hits)
+st.sidebar.caption(f"🗄️ Data cache: {cache_stats.hits} hits / {cache_stats.misses} misses ({cache_stats.hit_rate:.0%} hit rate)"
+                   + (f", {cache_stats.shared_reads} from shared memory" if cache_stats.shared_reads else ""))
+frame_footprint = session_footprint(st.session_state)
+if frame_footprint.frames:
+    st.sidebar.caption(f"🧮 Typed columns this session: {frame_footprint.after / 2**20:.1f} MiB, "
+                       f"{frame_footprint.ratio:.1f}× smaller than as loaded")
+
+# Charts drawn from stored Plotly JSON instead of rebuilt figures
+if figure_stats.served:
+    st.sidebar.caption(f"🖼️ Figure cache: {figure_stats.served} charts from cached JSON, "
+                       f"{figure_stats.saved_seconds * 1000:,.0f} ms CPU saved")
+
+# Section timings of this rerun and the recent ones
+if profile_render:
+    timings_panel(page)
@@ -0,0 +1,34 @@
+import os
+
+import pandas as pd
+
+from kube_reports import cache
+
+
+def _write(index):
+    path = cache._shared_path(f"key{index}", "builder")
+    cache._write_shared(path, pd.DataFrame({"value": [index]}))
+    return path
+
+
+def test_shared_files_expire_with_the_ttl(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "SHM_DIR", str(tmp_path))
+    old = _write(0)
+    leftover = tmp_path / "crashed.arrow.123.tmp"
+    leftover.write_bytes(b"")
+    for path in (old, leftover):
+        os.utime(path, (0, 0))
+    fresh = _write(1)
+    assert os.listdir(tmp_path) == [os.path.basename(fresh)]
+
+
+def test_shared_files_beyond_the_entry_limit_are_evicted_least_recently_used_first(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "SHM_DIR", str(tmp_path))
+    monkeypatch.setattr(cache, "CACHE_MAX_ENTRIES", 2)
+    first, second = _write(0), _write(1)
+    # Reading marks a file used, so the unread one goes first
+    os.utime(first, (1e9, 1e9))
+    os.utime(second, (1e9, 1e9))
+    cache._read_shared(first)
+    third = _write(2)
+    assert sorted(os.listdir(tmp_path)) == sorted(map(os.path.basename, (first, third)))
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from aiohttp import web
+
+from kube_reports.collector import collect, namespace_row, to_frame
+from kube_reports.stub_api import StubFleet
+
+
+@pytest.fixture
+def serve():
+    """Start a :class:`StubFleet` on a free port in a background loop; returns its base URL."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    runners = []
+
+    def start(fleet):
+        async def setup():
+            runner = web.AppRunner(fleet.app(), shutdown_timeout=0.1)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            runners.append(runner)
+            return site._server.sockets[0].getsockname()[1]
+
+        port = asyncio.run_coroutine_threadsafe(setup(), loop).result(timeout=10)
+        return f'http://127.0.0.1:{port}'
+
+    yield start
+
+    async def stop():
+        for runner in runners:
+            await runner.cleanup()
+        # Handlers of stalled clusters are still asleep
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run_coroutine_threadsafe(stop(), loop).result(timeout=10)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=10)
+    loop.close()
+
+
+def test_collects_every_namespace(serve):
+    fleet = StubFleet(clusters=3, namespaces=20)
+    frame = collect(fleet.config(serve(fleet)))
+
+    assert len(frame) == 60
+    assert frame['Error'].isna().all()
+    row = frame[(frame['Cluster'] == 'cluster-001') & (frame['Namespace'] == 'ns-0007')].iloc[0]
+    pods = fleet._pods('cluster-001', 'ns-0007')
+    assert row['Pod_Count'] == len(pods)
+    assert row['Memory_Usage_Mi'] == sum(memory for _, memory, _ in pods)
+    assert row['Memory_Limit_Mi'] == 512 * len(pods)
+
+
+def test_stalled_cluster_costs_its_timeout(serve):
+    fleet = StubFleet(clusters=3, namespaces=10, stalled=['cluster-002'])
+    clusters = fleet.config(serve(fleet), timeout=0.5)
+    started = time.monotonic()
+    frame = collect(clusters)
+
+    assert time.monotonic() - started < 5
+    failed = frame[frame['Error'].notna()]
+    assert failed['Cluster'].tolist() == ['cluster-002']
+    assert (frame['Cluster'] != 'cluster-002').sum() == 20
+
+
+def test_queueing_does_not_count_against_the_timeout(serve):
+    # 41 requests one at a time take about 2s, far over the 0.5s timeout, yet none of them is slow
+    fleet = StubFleet(clusters=1, namespaces=20, latency=0.05)
+    frame = collect(fleet.config(serve(fleet), timeout=0.5), per_cluster=1)
+
+    assert len(frame) == 20
+    assert frame['Error'].isna().all()
+
+
+def test_busy_cluster_leaves_global_slots_to_others(serve):
+    # A request waiting on its cluster's limit must not hold one of the two global slots
+    fleet = StubFleet(clusters=2, namespaces=10, latency=0.02)
+    served = []
+    pod_list = fleet.pod_list
+
+    def logged(cluster, namespace):
+        served.append(cluster)
+        return pod_list(cluster, namespace)
+
+    fleet.pod_list = logged
+    clusters = fleet.config(serve(fleet))
+    for config in clusters.values():
+        # Skip the namespace listing, so both clusters queue their namespaces at once
+        config['namespaces'] = fleet.namespaces
+    collect(clusters, concurrency=2, per_cluster=1)
+
+    # Both clusters are served from the start rather than one after the other
+    assert set(served[:4]) == {'cluster-000', 'cluster-001'}
+
+
+def test_unlimited_containers_do_not_count_against_limits():
+    pods = {'items': [
+        {'metadata': {'name': 'limited'}, 'status': {'phase': 'Running'},
+         'spec': {'containers': [{'name': 'app', 'resources': {'limits': {'cpu': '500m', 'memory': '512Mi'}}}]}},
+        {'metadata': {'name': 'unlimited'}, 'status': {'phase': 'Running'},
+         'spec': {'containers': [{'name': 'app', 'resources': {}}]}},
+    ]}
+    metrics = {'items': [
+        {'metadata': {'name': 'limited'}, 'containers': [{'name': 'app', 'usage': {'cpu': '100m', 'memory': '256Mi'}}]},
+        {'metadata': {'name': 'unlimited'}, 'containers': [{'name': 'app', 'usage': {'cpu': '900m', 'memory': '2000Mi'}}]},
+    ]}
+    row = to_frame([namespace_row('c', 'mixed', metrics, pods)]).iloc[0]
+
+    assert row['Memory_Usage_Mi'] == 2256
+    assert row['Memory_Usage_Percent'] == 50
+    assert row['CPU_Usage_Percent'] == 20
@@ -0,0 +1,60 @@
+import json
+import sys
+from unittest import mock
+
+import plotly.graph_objects as go
+import pytest
+import streamlit.elements.lib.utils
+from streamlit.testing.v1 import AppTest
+
+from kube_reports import cache, figures
+
+
+def _app():
+    import plotly.graph_objects as go
+
+    from kube_reports.figures import cached_chart
+
+    def bars(data):
+        return go.Figure(go.Bar(x=data['x'], y=data['y'])).update_layout(height=321)
+
+    cached_chart({'x': [1, 2], 'y': [3, 4]}, bars)
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch):
+    # AppTest swaps in its script as __main__, which spawned processes in later tests would re-run
+    monkeypatch.setitem(sys.modules, '__main__', sys.modules['__main__'])
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _charts():
+    at = AppTest.from_function(_app).run()
+    assert not at.exception
+    return at.get('plotly_chart')
+
+
+def test_stored_spec_is_sent_as_plotly_chart():
+    charts = _charts()
+    assert len(charts) == 1
+    assert '"height":321' in charts[0].proto.spec
+
+
+def test_falls_back_to_plotly_chart_when_streamlit_internals_change():
+    expected = json.loads(_charts()[0].proto.spec)
+    cache.clear()
+    with mock.patch.object(streamlit.elements.lib.utils, 'compute_and_register_element_id',
+                           side_effect=TypeError('changed signature')):
+        charts = _charts()
+    assert len(charts) == 1
+    assert json.loads(charts[0].proto.spec) == expected
+
+
+def test_figure_is_built_once_per_miss():
+    builder = mock.Mock(return_value=go.Figure(go.Bar(x=[1], y=[2])))
+    builder.__module__, builder.__qualname__ = __name__, 'builder'
+    spec = figures._spec_builder(builder)({'x': [1]})
+    assert builder.call_count == 1
+    assert spec.build_seconds > 0
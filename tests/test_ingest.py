@@ -0,0 +1,13 @@
+import pytest
+
+from kube_reports.ingest import load_nodes
+
+
+def test_missing_snapshot_file_is_an_error(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_nodes(str(tmp_path / 'typo.txt'))
+
+
+def test_one_line_capture_still_parses():
+    nodes = load_nodes('node-a 100m 5% 1000Mi 50%')
+    assert nodes['Node'].tolist() == ['node-a']
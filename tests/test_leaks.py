@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from kube_reports.leaks import LeakScan
+
+START = pd.Timestamp('2026-01-01', tz='UTC')
+
+
+def _scan(steps, *blocks):
+    """A single series: an hour at 0 MB, then ``steps`` (MB per minute column), fed in ``blocks`` pieces."""
+    values = np.concatenate([np.zeros(60), steps]).astype('float32')[None, :]
+    scan = LeakScan(START, min_slope=0)
+    scan.codes(['leaky'])
+    for part in np.array_split(values, blocks, axis=1):
+        scan.update(part)
+    return scan.frame().iloc[0]
+
+
+def test_rule_fires_after_the_hold_like_prometheus():
+    # The 1h increase is over 100 MB for 60 minutes: pending for 10, then firing for 50
+    row = _scan(np.full(60, 200.0), 1)
+    assert row['Firing_Minutes'] == 50
+    assert row['Onset'] == START + pd.Timedelta('60min')
+
+
+def test_streak_carries_across_blocks():
+    row = _scan(np.full(60, 200.0), 7)
+    assert row['Firing_Minutes'] == 50
+    assert row['Onset'] == START + pd.Timedelta('60min')
+
+
+def test_streak_as_long_as_the_hold_does_not_fire():
+    row = _scan(np.r_[np.full(10, 200.0), np.zeros(50)], 1)
+    assert row['Firing_Minutes'] == 0
+    assert pd.isna(row['Onset'])
+    assert not row['Candidate']
@@ -0,0 +1,35 @@
+import json
+
+from kube_reports.ingest import load_nodes
+from kube_reports.overcommit import apply_overcommit, node_allocatable, pod_table
+
+
+def _dumps(tmp_path):
+    nodes = ['node-a', 'node-b']
+    metrics = {'kind': 'NodeMetricsList', 'items': [
+        {'metadata': {'name': name}, 'usage': {'cpu': '700m', 'memory': f'{8000 + 700 * i}Mi'}}
+        for i, name in enumerate(nodes)]}
+    specs = {'items': [{'metadata': {'name': name}, 'status': {'allocatable': {'cpu': '4', 'memory': '12603Mi'}}}
+                       for name in nodes]}
+    pods = {'items': [
+        {'metadata': {'name': f'p{i}', 'namespace': 'ns'}, 'status': {'phase': 'Running'},
+         'spec': {'nodeName': nodes[i % 2],
+                  'containers': [{'name': 'c', 'resources': {'limits': {'memory': f'{1000 + 333 * i}Mi'}}}]}}
+        for i in range(7)]}
+    paths = {}
+    for name, document in (('metrics', metrics), ('nodes', specs), ('pods', pods)):
+        paths[name] = tmp_path / f'{name}.json'
+        paths[name].write_text(json.dumps(document))
+    return paths
+
+
+def test_overcommit_on_a_snapshot_without_allocatable(tmp_path):
+    paths = _dumps(tmp_path)
+    nodes = load_nodes(str(paths['metrics']))
+    assert nodes['Memory_Usage_Percent'].isna().all()
+
+    frame = apply_overcommit(nodes, pod_table(str(paths['pods'])), node_allocatable(str(paths['nodes'])))
+
+    # Limits of 1000+1666+2332+2998 Mi on node-a and 1333+1999+2665 Mi on node-b, over 12603 Mi
+    assert frame['Memory_Overcommit_Percent'].tolist() == [63, 48]
+    assert frame['Memory_Usage_Percent'].tolist() == [63, 69]
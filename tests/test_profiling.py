@@ -0,0 +1,16 @@
+from kube_reports.profiling import LAST_RERUN_KEY, RenderProfile
+
+
+def test_each_session_keeps_its_own_last_rerun():
+    profile = RenderProfile()
+    first, second = {}, {}
+    with profile.rerun('🚨 Executive Summary', session_state=first):
+        with profile.section('load'):
+            pass
+    with profile.rerun('📈 Action Plan & Timeline', session_state=second):
+        pass
+
+    assert first[LAST_RERUN_KEY]['page'] == '🚨 Executive Summary'
+    assert second[LAST_RERUN_KEY]['page'] == '📈 Action Plan & Timeline'
+    assert profile.last is second[LAST_RERUN_KEY]
+    assert len(profile.reruns) == 2
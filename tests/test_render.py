@@ -0,0 +1,31 @@
+import os
+
+from kube_reports import render
+
+
+def test_render_all_more_clusters_than_workers(tmp_path):
+    clusters = {
+        'banded': {'env': {'KUBE_REPORTS_NODE_BANDS': '75,85'}},
+        'default': {},
+    }
+    results = render.render_all(str(tmp_path), clusters, reports=['node-comparison'], workers=1)
+
+    assert sorted(results) == ['banded', 'default']
+    banded = (tmp_path / 'banded' / 'node-comparison.html').read_text(encoding='utf-8')
+    default = (tmp_path / 'default' / 'node-comparison.html').read_text(encoding='utf-8')
+    # Each cluster's environment reaches module-level settings, and only that cluster's
+    assert 'Critical Threshold (85%)' in banded
+    assert 'Critical Threshold (80%)' in default
+    assert (tmp_path / 'index.html').exists()
+
+
+def test_render_cluster_restores_environment(tmp_path, monkeypatch):
+    monkeypatch.setattr(render, 'render_report', lambda report, widgets=None: ('', [], ''))
+    monkeypatch.setenv('KUBE_REPORTS_NODE_BANDS', '60,70,80')
+    monkeypatch.delenv('KUBE_REPORTS_SNAPSHOT_DIR', raising=False)
+    config = {'env': {'KUBE_REPORTS_NODE_BANDS': '75,85', 'KUBE_REPORTS_SNAPSHOT_DIR': str(tmp_path)}}
+
+    render.render_cluster('a', config, str(tmp_path), ['node-comparison'], inline=True)
+
+    assert os.environ['KUBE_REPORTS_NODE_BANDS'] == '60,70,80'
+    assert 'KUBE_REPORTS_SNAPSHOT_DIR' not in os.environ
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from kube_reports.pages.phase1.data import NO_LIMITS_STATUS, cluster_frame
+from kube_reports.rollup import RollupCube
+
+
+def _cube():
+    # Namespace "a" mixes a limited pod with an unlimited one; "b" sets no limits
+    return RollupCube.from_pods(pd.DataFrame({
+        'Cluster': 'c',
+        'Namespace': ['a', 'a', 'b'],
+        'Workload': ['w1', 'w2', 'w3'],
+        'Pod': ['p1', 'p2', 'p3'],
+        'CPU_Usage_m': [100.0, 20.0, 5.0],
+        'Memory_Usage_Mi': [100.0, 50.0, 30.0],
+        'CPU_Limit_m': [500.0, 0.0, 0.0],
+        'Memory_Limit_Mi': [512.0, 0.0, 0.0],
+    }))
+
+
+def test_unlimited_usage_does_not_count_against_limits():
+    cube = _cube()
+    clusters = cube.slice()
+    assert clusters['Memory_Usage_Percent'].tolist() == [20]
+    assert clusters['CPU_Usage_Percent'].tolist() == [20]
+    # Totals still include every pod
+    assert clusters['Memory_Usage_Mi'].tolist() == [180]
+    namespaces = cube.slice('c')
+    assert namespaces['Memory_Usage_Percent'].tolist() == [20, pd.NA]
+
+
+def test_unlimited_namespaces_get_a_status():
+    namespaces = cluster_frame(_cube().slice('c'))
+    assert namespaces['Status'].tolist()[1] == NO_LIMITS_STATUS
@@ -0,0 +1,24 @@
+import pandas as pd
+
+from kube_reports.schema import FOOTPRINT_KEY, NODE_SCHEMA, FootprintStats, compact
+
+
+def _nodes():
+    return pd.DataFrame({'Node': ['a', 'b'] * 50, 'Memory_Usage_Percent': [60.0, 70.0] * 50})
+
+
+def test_compact_notes_the_columns_it_changed():
+    compacted = compact(_nodes(), NODE_SCHEMA)
+    _, before, after = compacted.attrs[FOOTPRINT_KEY]
+    assert before > after > 0
+
+
+def test_compacting_again_records_nothing_new():
+    compacted = compact(_nodes(), NODE_SCHEMA)
+    assert compact(compacted, NODE_SCHEMA) is compacted
+    derived = compact(compacted.assign(Memory_Usage_Percent=compacted['Memory_Usage_Percent'] * 1.0), NODE_SCHEMA,
+                      record=False)
+    stats = FootprintStats()
+    for frame in (compacted, compacted, derived):
+        stats.record(*frame.attrs[FOOTPRINT_KEY])
+    assert stats.frames == 1
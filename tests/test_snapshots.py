@@ -0,0 +1,14 @@
+import pytest
+
+from kube_reports.ingest import nodes_frame
+from kube_reports.pages.node_comparison.data import current_nodes_data
+from kube_reports.snapshots import SnapshotStore
+
+
+def test_repeated_snapshot_id_is_rejected(tmp_path):
+    store = SnapshotStore(tmp_path)
+    nodes = nodes_frame(current_nodes_data)
+    store.append(nodes, 'prod', '2026-01-01T00:00:00.1Z')
+    with pytest.raises(ValueError):
+        store.append(nodes, 'prod', '2026-01-01T00:00:00.9Z')
+    assert store.snapshots('prod')['Snapshot'].tolist() == ['2026-01-01T00:00:00Z']